@@ -6,6 +6,9 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
 import uuid
+import os
+
+from app.config import settings
 
 
 # Enums
@@ -91,6 +94,7 @@ class AudioReadyPayload(EventPayload):
     format: str = "wav"
     sample_rate_hz: int = 24000
     channels: int = 1
+    inline: bool = False  # WAV bytes already sent as a binary frame
 
 
 class ErrorPayload(EventPayload):
@@ -172,6 +176,11 @@ class Session(BaseModel):
     # Current turn being processed
     current_turn: Optional[Turn] = None
 
+    @property
+    def audio_dir(self) -> str:
+        """Directory for this session's synthesized audio (created by SessionManager)"""
+        return os.path.join(settings.AUDIO_DIR, self.session_id)
+
     def start_turn(self) -> Turn:
         """Start a new turn"""
         turn = Turn()
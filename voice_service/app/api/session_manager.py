@@ -4,6 +4,7 @@ Session Manager - Handles session state and lifecycle
 from typing import Dict, Optional
 import asyncio
 import logging
+import os
 from datetime import datetime, timedelta
 
 from app.api.models import Session, SessionStatus, Turn
@@ -53,6 +54,7 @@ class SessionManager:
             self._remove_oldest_idle_session()
 
         self.sessions[session.session_id] = session
+        self._prepare_audio_dir(session)
 
         # Attach mood manager + start proactive engine
         mood_manager = MoodManager()
@@ -69,6 +71,10 @@ class SessionManager:
 
         return session
 
+    def _prepare_audio_dir(self, session: Session) -> None:
+        """Create the session's audio directory once, so per-turn code can skip it"""
+        os.makedirs(session.audio_dir, exist_ok=True)
+
     def get_session(self, session_id: str) -> Optional[Session]:
         """Get session by ID"""
         return self.sessions.get(session_id)
@@ -193,6 +199,7 @@ class SessionManager:
 
                         # Add to in-memory cache
                         self.sessions[session_id] = session
+                        self._prepare_audio_dir(session)
 
                         # Create MoodManager + ProactiveEngine that were not
                         # persisted to DB (they are in-process only).
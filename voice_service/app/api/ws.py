@@ -14,6 +14,7 @@ from app.api.session_manager import session_manager
 from app.pipeline.streaming_vad import (
     StreamingVADState,
     create_streaming_vad_state,
+    get_speech_segments,
     process_chunk as vad_process_chunk,
 )
 
@@ -77,6 +78,8 @@ class ConnectionManager:
         # initiative is never silently lost.  Capped at 1 per session so
         # the cat doesn't dump a backlog of old speech on reconnect.
         self.pending_proactive: Dict[str, WebSocketEvent] = {}
+        # Set when the client reports that reply audio started playing
+        self.playback_acks: Dict[str, asyncio.Event] = {}
         self._lock = asyncio.Lock()
 
     async def connect(self, websocket: WebSocket, session_id: str):
@@ -122,6 +125,10 @@ class ConnectionManager:
             if session_id in self.endpoint_tasks:
                 self.endpoint_tasks[session_id].cancel()
                 del self.endpoint_tasks[session_id]
+            # Release anyone waiting on a playback ack that will never come
+            ack = self.playback_acks.pop(session_id, None)
+            if ack:
+                ack.set()
 
         logger.info(f"WebSocket disconnected for session {session_id}")
 
@@ -187,7 +194,36 @@ class ConnectionManager:
         logger.info(f"Audio streaming ended for session {session_id}")
         await self._trigger_processing_once(session_id, source="audio_end")
 
-    async def _process_audio(self, session_id: str, audio_data: bytes, audio_config: dict = None):
+    def expect_playback_ack(self, session_id: str):
+        """Arm a fresh playback ack for the current turn (before audio_ready goes out)"""
+        self.playback_acks[session_id] = asyncio.Event()
+
+    def handle_playback_started(self, session_id: str):
+        """Handle playback.started message from the client"""
+        ack = self.playback_acks.get(session_id)
+        if ack:
+            ack.set()
+
+    async def wait_for_playback_ack(self, session_id: str, timeout: float):
+        """Wait until the client acks playback, or the timeout elapses"""
+        ack = self.playback_acks.get(session_id)
+        if ack is None:
+            return
+        try:
+            await asyncio.wait_for(ack.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.debug(f"No playback ack from session {session_id} within {timeout}s")
+        finally:
+            if self.playback_acks.get(session_id) is ack:
+                del self.playback_acks[session_id]
+
+    async def _process_audio(
+        self,
+        session_id: str,
+        audio_data: bytes,
+        audio_config: dict = None,
+        vad_segments: Optional[list] = None,
+    ):
         """Process received audio through the pipeline"""
         try:
             # Import here to avoid circular dependency
@@ -201,7 +237,9 @@ class ConnectionManager:
                 client_sample_rate = audio_config.get("sample_rate")
 
             # Process the audio
-            await process_audio_stream(session_id, audio_data, sample_rate=client_sample_rate)
+            await process_audio_stream(
+                session_id, audio_data, sample_rate=client_sample_rate, vad_segments=vad_segments
+            )
 
         except Exception as e:
             logger.error(f"Error processing audio for session {session_id}: {e}", exc_info=True)
@@ -247,8 +285,12 @@ class ConnectionManager:
                 else:
                     logger.warning(f"No audio buffer for session {session_id}")
 
-            if session_id in self.streaming_vad_states:
-                del self.streaming_vad_states[session_id]
+            # Streaming VAD already found the speech; the pipeline reuses
+            # its segments instead of running VAD again
+            vad_segments = None
+            vad_state = self.streaming_vad_states.pop(session_id, None)
+            if vad_state is not None and settings.STREAMING_VAD_REUSE_SEGMENTS:
+                vad_segments = get_speech_segments(vad_state) or None
             if session_id in self.endpoint_tasks:
                 self.endpoint_tasks[session_id].cancel()
                 del self.endpoint_tasks[session_id]
@@ -256,7 +298,9 @@ class ConnectionManager:
         await self.broadcast_state(session_id, SessionStatus.PROCESSING)
 
         if audio_data:
-            asyncio.create_task(self._process_audio(session_id, audio_data, audio_config))
+            asyncio.create_task(
+                self._process_audio(session_id, audio_data, audio_config, vad_segments)
+            )
         else:
             await self.broadcast_error(
                 session_id,
@@ -319,66 +363,101 @@ class ConnectionManager:
                 logger.info(f"Stored pending proactive event for session {session_id}")
             return
 
-        # Convert event to JSON
-        event_json = event.model_dump_json()
+        await self._send_text(session_id, event.model_dump_json())
+
+    async def broadcast_bulk(self, session_id: str, events: list[WebSocketEvent]):
+        """
+        Send several events to all connections as a single frame.
 
-        # Send to all connections
+        The frame is a JSON array of event envelopes, so the client gets one
+        message (one serialization, one write per connection) instead of one
+        per event.
+        """
+        if not events:
+            return
+        if len(events) == 1:
+            await self.send_event(session_id, events[0])
+            return
+        if session_id not in self.active_connections:
+            logger.warning(f"No active connections for session {session_id}")
+            return
+
+        events_json = "[" + ",".join(event.model_dump_json() for event in events) + "]"
+        await self._send_text(session_id, events_json)
+
+    async def broadcast_audio_bytes(self, session_id: str, audio_data: bytes):
+        """Send reply audio (WAV bytes) to all connections as a binary frame"""
+        if session_id not in self.active_connections:
+            logger.warning(f"No active connections for session {session_id}")
+            return
+        await self._send(session_id, audio_data)
+
+    async def _send_text(self, session_id: str, text: str):
+        """Send a text frame to all connections for a session concurrently"""
+        await self._send(session_id, text)
+
+    async def _send(self, session_id: str, data):
+        """Send a text (str) or binary (bytes) frame to all connections concurrently"""
+        connections = list(self.active_connections.get(session_id, ()))
+        if isinstance(data, bytes):
+            sends = (connection.send_bytes(data) for connection in connections)
+        else:
+            sends = (connection.send_text(data) for connection in connections)
+        results = await asyncio.gather(*sends, return_exceptions=True)
+
+        # Cleanup disconnected connections
         disconnected = []
-        for connection in self.active_connections[session_id]:
-            try:
-                await connection.send_text(event_json)
-            except Exception as e:
-                logger.error(f"Error sending event: {e}")
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending event: {result}")
                 disconnected.append(connection)
 
-        # Cleanup disconnected connections
         if disconnected:
             async with self._lock:
                 for connection in disconnected:
-                    self.active_connections[session_id].discard(connection)
+                    if session_id in self.active_connections:
+                        self.active_connections[session_id].discard(connection)
 
-    async def broadcast_state(self, session_id: str, state: SessionStatus, turn_id: str = None):
-        """Helper to broadcast state change event"""
-        event = WebSocketEvent(
+    def state_event(self, session_id: str, state: SessionStatus, turn_id: str = None) -> WebSocketEvent:
+        """Build a state change event"""
+        return WebSocketEvent(
             type=EventType.STATE,
             session_id=session_id,
             turn_id=turn_id,
             payload={"state": state}
         )
-        await self.send_event(session_id, event)
 
-    async def broadcast_transcript(self, session_id: str, text: str, turn_id: str, partial: bool = False):
-        """Helper to broadcast transcript event"""
-        event = WebSocketEvent(
+    def transcript_event(self, session_id: str, text: str, turn_id: str, partial: bool = False) -> WebSocketEvent:
+        """Build a transcript event"""
+        return WebSocketEvent(
             type=EventType.TRANSCRIPT_PARTIAL if partial else EventType.TRANSCRIPT_FINAL,
             session_id=session_id,
             turn_id=turn_id,
             payload={"text": text}
         )
-        await self.send_event(session_id, event)
 
-    async def broadcast_reply_text(self, session_id: str, text: str, turn_id: str):
-        """Helper to broadcast reply text event"""
-        event = WebSocketEvent(
+    def reply_text_event(self, session_id: str, text: str, turn_id: str) -> WebSocketEvent:
+        """Build a reply text event"""
+        return WebSocketEvent(
             type=EventType.REPLY_TEXT,
             session_id=session_id,
             turn_id=turn_id,
             payload={"text": text}
         )
-        await self.send_event(session_id, event)
 
-    async def broadcast_audio_ready(
+    def audio_ready_event(
         self,
         session_id: str,
         turn_id: str,
         url: str,
         duration_ms: int = 0,
-        sample_rate_hz: int = None
-    ):
-        """Helper to broadcast audio ready event"""
+        sample_rate_hz: int = None,
+        inline: bool = False
+    ) -> WebSocketEvent:
+        """Build an audio ready event (inline=True: bytes were just sent as a binary frame)"""
         if sample_rate_hz is None:
             sample_rate_hz = settings.TTS_SAMPLE_RATE
-        event = WebSocketEvent(
+        return WebSocketEvent(
             type=EventType.REPLY_AUDIO_READY,
             session_id=session_id,
             turn_id=turn_id,
@@ -387,9 +466,36 @@ class ConnectionManager:
                 "duration_ms": duration_ms,
                 "format": "wav",
                 "sample_rate_hz": sample_rate_hz,
-                "channels": settings.TTS_CHANNELS
+                "channels": settings.TTS_CHANNELS,
+                "inline": inline
             }
         )
+
+    async def broadcast_state(self, session_id: str, state: SessionStatus, turn_id: str = None):
+        """Helper to broadcast state change event"""
+        await self.send_event(session_id, self.state_event(session_id, state, turn_id))
+
+    async def broadcast_transcript(self, session_id: str, text: str, turn_id: str, partial: bool = False):
+        """Helper to broadcast transcript event"""
+        await self.send_event(session_id, self.transcript_event(session_id, text, turn_id, partial))
+
+    async def broadcast_reply_text(self, session_id: str, text: str, turn_id: str):
+        """Helper to broadcast reply text event"""
+        await self.send_event(session_id, self.reply_text_event(session_id, text, turn_id))
+
+    async def broadcast_audio_ready(
+        self,
+        session_id: str,
+        turn_id: str,
+        url: str,
+        duration_ms: int = 0,
+        sample_rate_hz: int = None
+    ):
+        """Helper to broadcast audio ready event"""
+        event = self.audio_ready_event(
+            session_id, turn_id, url,
+            duration_ms=duration_ms, sample_rate_hz=sample_rate_hz,
+        )
         await self.send_event(session_id, event)
 
     async def broadcast_error(self, session_id: str, code: str, message: str, turn_id: str = None):
@@ -488,7 +594,7 @@ async def websocket_endpoint(
     Client should connect with: ws://127.0.0.1:8008/ws?session_id=<session_id>
 
     Message types:
-    - Text: JSON messages (audio.start, audio.end, ping)
+    - Text: JSON messages (audio.start, audio.end, playback.started, ping)
     - Binary: Audio chunks
     """
     await connection_manager.connect(websocket, session_id)
@@ -530,6 +636,9 @@ async def websocket_endpoint(
                         elif msg_type == "audio.end":
                             await connection_manager.handle_audio_end(session_id)
 
+                        elif msg_type == "playback.started":
+                            connection_manager.handle_playback_started(session_id)
+
                         elif msg_type == "ping":
                             await websocket.send_json({"type": "pong"})
 
@@ -21,7 +21,9 @@ class Settings(BaseSettings):
     # Engine Selection — choose which STT and TTS backend to use
     # STT options: "whisper" (faster-whisper, best accuracy/speed balance ★),
     #              "moonshine" (lightest CPU, lowest accuracy),
-    #              "canary-qwen" (heaviest, highest accuracy)
+    #              "canary-qwen" (heaviest, highest accuracy),
+    #              "openvino-distil" (Distil-Whisper INT8 on OpenVINO, fast on Intel CPUs),
+    #              "trtllm-whisper" (Whisper INT8 TensorRT-LLM engines, CUDA only)
     STT_ENGINE: str = "whisper"
     # TTS options: "pocket" | "qwen3" | "edge" | "elevenlabs"
     #   pocket     — ultra-lightweight local (100M params), no internet needed
@@ -34,6 +36,10 @@ class Settings(BaseSettings):
     OLLAMA_BASE_URL: str = "http://127.0.0.1:11434"
     OLLAMA_MODEL: str = "qwen2.5:0.5b-instruct"
     OLLAMA_TIMEOUT: int = 30  # seconds
+    # Keep the model (and its cached system-prompt prefix) loaded between turns
+    OLLAMA_KEEP_ALIVE: str = "30m"
+    # Startup model-load request; on timeout the first turn loads it instead
+    OLLAMA_WARMUP_TIMEOUT: int = 10  # seconds
 
     # Audio Configuration
     AUDIO_SAMPLE_RATE: int = 16000  # Hz for STT
@@ -44,6 +50,22 @@ class Settings(BaseSettings):
     # TTS Audio Configuration
     TTS_SAMPLE_RATE: int = 24000  # Hz for output
     TTS_CHANNELS: int = 1  # Mono
+    # Send reply WAV bytes as a binary WebSocket frame right before the
+    # reply.audio_ready event, so the client skips the HTTP download.
+    # The file is still written and served at /api/audio as a fallback.
+    TTS_INLINE_WS_AUDIO: bool = True
+    # Cache of synthesized waveforms for repeated lines (Pocket-TTS, Kokoro),
+    # bounded by total seconds of audio held; 0 disables
+    TTS_CACHE_MAX_SECONDS: float = 300.0
+    # Pre-render the pooled cat replies into the cache at startup (Pocket-TTS)
+    TTS_CACHE_FIXED_PROMPTS: bool = False
+    # Kokoro: sentences of a multi-sentence reply rendered in parallel
+    KOKORO_PARALLEL: int = 2
+
+    # Retries for cloud STT/TTS calls (rate limits, 5xx, timeouts)
+    CLOUD_RETRY_ATTEMPTS: int = 3  # Total attempts, including the first
+    CLOUD_RETRY_BASE_DELAY: float = 0.5  # Seconds; doubles per retry (jittered)
+    CLOUD_RETRY_MAX_DELAY: float = 8.0
 
     # ElevenLabs Configuration
     ELEVENLABS_API_KEY: str = ""  # Set via environment variable
@@ -70,6 +92,18 @@ class Settings(BaseSettings):
     QWEN_TTS_DEVICE: str = "cpu"  # "cpu" or "cuda"
     QWEN_TTS_DTYPE: str = "float32"  # "float32", "float16", "bfloat16"
     QWEN_TTS_ATTN_IMPL: str = ""  # Optional: "flash_attention_2" on compatible GPUs
+    # Weight quantization: "none" (use QWEN_TTS_DTYPE), "int8" (dynamic, CPU),
+    # "int4" (torchao weight-only, CUDA), "fp8" (torchao FP8 weights and
+    # activations, CUDA compute capability >= 8.9; bf16 otherwise)
+    QWEN_TTS_QUANT: str = "none"
+    QWEN_TTS_MAX_BATCH: int = 4  # Texts per generate call in synthesize_batch
+    QWEN_TTS_COMPILE: bool = False  # torch.compile the transformer (compiles during warmup)
+    # Run Qwen3-TTS in one persistent worker process (model loaded once,
+    # state reset between utterances)
+    QWEN_TTS_WORKER_PROCESS: bool = False
+    QWEN_TTS_WORKER_EMPTY_CACHE_EVERY: int = 32  # Jobs between torch.cuda.empty_cache() calls
+    QWEN_TTS_WORKER_LOAD_TIMEOUT: float = 600.0  # Seconds to wait for the worker's model load
+    QWEN_TTS_WORKER_JOB_TIMEOUT: float = 120.0  # Seconds per job before the worker is restarted
     QWEN_TTS_LANGUAGE: str = "Auto"
     QWEN_TTS_SPEAKER: str = "Auto"
     QWEN_TTS_INSTRUCTION: str = (
@@ -88,6 +122,24 @@ class Settings(BaseSettings):
     CANARY_QWEN_TOP_P: float = 0.95
     CANARY_QWEN_PROMPT: str = ""  # Optional override prompt, must include audio locator tag
     CANARY_QWEN_STARTUP_LOAD: bool = True  # Load Canary model at startup for validation
+    # Weight dtype: "auto" = bf16 on GPUs that support it, else fp16 on GPU, fp32 on CPU
+    CANARY_QWEN_DTYPE: str = "auto"  # "auto", "bfloat16", "float16", "float32"
+    CANARY_QWEN_COMPILE: bool = False  # torch.compile the model (slow first call)
+    # Micro-batching: utterances arriving within this window share one generate()
+    CANARY_QWEN_BATCH_WINDOW_MS: int = 20
+    CANARY_QWEN_MAX_BATCH: int = 8
+
+    # Distil-Whisper on OpenVINO (STT_ENGINE=openvino-distil)
+    OPENVINO_STT_MODEL_ID: str = "distil-whisper/distil-large-v2"
+    OPENVINO_STT_DEVICE: str = "CPU"  # OpenVINO device name: "CPU", "GPU", "AUTO"
+    OPENVINO_STT_INT8: bool = True  # NNCF 8-bit weight compression at export
+    OPENVINO_STT_MAX_TOKENS: int = 128
+
+    # Whisper on TensorRT-LLM (STT_ENGINE=trtllm-whisper); engines prebuilt
+    # with trtllm-build into <dir>/encoder and <dir>/decoder
+    TRTLLM_ENGINE_DIR: str = "./data/models/whisper_trtllm"
+    TRTLLM_WHISPER_MODEL_ID: str = "openai/whisper-large-v3"  # Tokenizer/features
+    TRTLLM_MAX_NEW_TOKENS: int = 96
 
     # Moonshine STT Configuration (lightweight, CPU-optimized)
     # Model options: "tiny", "base", "tiny-streaming", "small-streaming", "medium-streaming"
@@ -111,14 +163,37 @@ class Settings(BaseSettings):
     SILERO_VAD_MIN_SPEECH_MS: int = 250      # Minimum speech duration to keep (ms)
     SILERO_VAD_MIN_SILENCE_MS: int = 150     # Silence duration to split segments (ms)
     SILERO_VAD_SPEECH_PAD_MS: int = 60       # Padding before/after speech (ms)
+    SILERO_VAD_DEVICE: str = "cpu"           # "cpu" or "cuda" (FP16 weights when supported)
+    SILERO_VAD_STOP_AT_FIRST_END: bool = False  # Keep only the first speech segment (skips the tail)
+    VAD_COMPILE: bool = False  # torch.compile the Silero model (eager if the export can't compile)
+
+    # Run a dummy forward through VAD / local TTS models right after they
+    # load, so the first request doesn't pay JIT and autotune costs
+    MODEL_WARMUP: bool = True
 
     # Streaming VAD endpointing
     STREAMING_VAD_ENABLED: bool = True  # Set to False to disable endpointing
+    STREAMING_VAD_REUSE_SEGMENTS: bool = True  # Skip the offline VAD pass when endpointing found speech
     ENDPOINT_CONFIRM_MS: int = 450  # Silence confirmation before triggering (ms)
     ENDPOINT_POST_ROLL_MS: int = 200  # Audio kept after end (ms)
 
+    # Worker threads for blocking model calls (STT/LLM/TTS) across sessions
+    PIPELINE_WORKER_THREADS: int = 4
+    # Empty the CUDA cache after each pipeline stage (STT, LLM) so the
+    # models can share an 8 GB GPU; slower under normal load, so opt-in
+    FREE_VRAM_BETWEEN_STAGES: bool = False
+
+    # Max wait for the client's playback.started ack before a turn returns to idle (ms)
+    PLAYBACK_ACK_TIMEOUT_MS: int = 500
+
     # Noise Reduction Configuration
     NOISE_REDUCE_PROP_DECREASE: float = 0.6  # Reduction strength (0.0-1.0)
+    # True: in-house stationary spectral gate (fast; steady noise like fans
+    # and hum). False: noisereduce's non-stationary gate (TV, other voices)
+    NOISE_REDUCE_STATIONARY: bool = False
+    # Skip noise reduction when the noise floor (quietest 20 ms frames) is
+    # this far below the rest of the utterance — the audio is already clean
+    NOISE_REDUCE_SNR_SKIP_DB: float = 25.0
 
     # STT Configuration (faster-whisper)
     # Model sizes (accuracy vs speed): tiny.en < base.en < small.en < medium.en
@@ -126,7 +201,10 @@ class Settings(BaseSettings):
     # on short, conversational utterances with minimal extra latency on CPU.
     STT_MODEL_SIZE: str = "small.en"
     STT_DEVICE: str = "cpu"
-    STT_COMPUTE_TYPE: str = "int8"  # CPU-friendly quantised weights
+    # CTranslate2 compute type; "auto" = int8 on CPU, int8_float16 on CUDA
+    STT_COMPUTE_TYPE: str = "auto"
+    STT_CPU_THREADS: int = 0  # 0 = half the available cores
+    STT_NUM_WORKERS: int = 1  # Parallel transcribe() calls the model can serve
     STT_BEAM_SIZE: int = 5
     STT_LANGUAGE: str = "en"
     # Initial prompt biases the Whisper decoder toward domain vocabulary.
@@ -141,6 +219,7 @@ class Settings(BaseSettings):
     # OpenAI Configuration (for Whisper STT)
     OPENAI_API_KEY: str = ""  # Set via environment variable
     OPENAI_WHISPER_MODEL: str = "whisper-1"  # OpenAI Whisper model
+    OPENAI_STT_CONCURRENCY: int = 8  # Max concurrent uploads in transcribe_many
 
     # Anthropic / Claude Configuration
     # Set ANTHROPIC_API_KEY in your .env or environment.
@@ -164,6 +243,12 @@ class Settings(BaseSettings):
     # Number of CPU threads for Ollama inference (0 = Ollama picks automatically).
     # Set explicitly to match available CPU cores for best throughput.
     LLM_NUM_THREAD: int = 0
+    # Prompt tokens Ollama keeps when the context window shifts (0 = Ollama
+    # default).  Set to roughly the system-prompt length to pin its KV cache.
+    LLM_NUM_KEEP: int = 0
+    # Exact-match reply cache (system prompt + context + prompt) so repeated
+    # questions and greetings skip generation entirely.  0 disables it.
+    LLM_RESPONSE_CACHE_SIZE: int = 256
 
     # Response Shaping Configuration
     MAX_RESPONSE_SENTENCES: int = 2
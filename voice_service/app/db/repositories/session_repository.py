@@ -91,3 +91,22 @@ class SessionRepository:
         sessions = result.scalars().all()
         logger.debug(f"Found {len(sessions)} expired sessions before {cutoff}")
         return list(sessions)
+
+    async def delete_expired(self, cutoff: datetime) -> List[str]:
+        """Delete every session older than cutoff in one statement (cascades to turns)
+
+        Args:
+            cutoff: DateTime threshold for expiration
+
+        Returns:
+            IDs of the deleted sessions (for removing their audio)
+        """
+        result = await self.session.execute(
+            delete(DBSession)
+            .where(DBSession.last_activity_at < cutoff)
+            .returning(DBSession.session_id)
+        )
+        session_ids = list(result.scalars().all())
+        await self.session.commit()
+        logger.debug(f"Deleted {len(session_ids)} expired sessions before {cutoff}")
+        return session_ids
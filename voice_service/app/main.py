@@ -4,10 +4,13 @@ Handles HTTP endpoints, WebSocket connections, and service initialization
 """
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
+from contextlib import asynccontextmanager
 
 from app.config import settings
 import asyncio
@@ -19,60 +22,47 @@ if settings.ENABLE_DB_PERSISTENCE:
     from app.tasks.cleanup import cleanup_old_data_task
 
 # Configure logging
+# Records are formatted by a QueueHandler and written to stdout/file by a
+# QueueListener thread, so log writes never block the event loop. The
+# listener runs for the lifespan of the app; records logged before startup
+# wait in the queue.
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(
+    _log_queue,
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler(f"{settings.LOGS_DIR}/voice_service.log"),
+)
 logging.basicConfig(
     level=getattr(logging, settings.LOG_LEVEL),
     format=settings.LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(f"{settings.LOGS_DIR}/voice_service.log")
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
-# Create FastAPI app
-app = FastAPI(
-    title=settings.SERVICE_NAME,
-    description="Local voice interaction service for kids game",
-    version="0.1.0",
-    docs_url="/docs",
-    redoc_url="/redoc"
-)
-
-# Add CORS middleware for web client
-# Log configured CORS origins for debugging
-logger.info(f"CORS allowed origins: {settings.cors_origins_list}")
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
-    allow_origin_regex=r"https://.*\.vercel\.app",  # Allow all Vercel deployments
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-
 # Import routers
 from app.api import routes, ws
 from app.api.session_manager import session_manager
 
 
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """Initialize service on startup"""
-    logger.info("=" * 60)
-    logger.info(f"{settings.SERVICE_NAME} starting...")
-    logger.info(f"Service URL: http://{settings.SERVICE_HOST}:{settings.SERVICE_PORT}")
-    logger.info(f"WebSocket URL: ws://{settings.SERVICE_HOST}:{settings.SERVICE_PORT}/ws")
-    logger.info(f"Ollama URL: {settings.OLLAMA_BASE_URL}")
-    logger.info(f"STT Engine: {settings.STT_ENGINE}")
-    logger.info(f"TTS Engine: {settings.TTS_ENGINE}")
-    logger.info(f"LLM Model: {settings.OLLAMA_MODEL}")
-    logger.info(f"Data Directory: {settings.DATA_DIR}")
-    logger.info("=" * 60)
+def _check_stt_config():
+    """
+    Fail fast on STT configuration errors (missing API keys).
+
+    Runs synchronously in the lifespan handler before the app starts
+    serving, so a misconfigured service never comes up.
+    """
+    stt_engine = settings.STT_ENGINE.lower()
+    if stt_engine == "elevenlabs" and not settings.ELEVENLABS_API_KEY:
+        raise RuntimeError("STT_ENGINE=elevenlabs but ELEVENLABS_API_KEY is not set")
 
-    # STT startup validation (engine-aware) — pre-load model so first
-    # user request is not blocked by a cold model load.
+
+def _preload_stt_model():
+    """
+    STT startup validation (engine-aware) — pre-load model so first
+    user request is not blocked by a cold model load.
+
+    Blocking; called via asyncio.to_thread from the lifespan handler.
+    """
     stt_engine = settings.STT_ENGINE.lower()
     if stt_engine == "whisper":
         try:
@@ -101,62 +91,226 @@ async def startup_event():
         except Exception as e:
             logger.error(f"Moonshine STT model load failed: {e}", exc_info=True)
             raise
-    elif stt_engine == "elevenlabs":
-        if not settings.ELEVENLABS_API_KEY:
-            raise RuntimeError("STT_ENGINE=elevenlabs but ELEVENLABS_API_KEY is not set")
+    elif stt_engine == "openvino-distil":
+        try:
+            logger.info(f"Pre-loading Distil-Whisper OpenVINO model ({settings.OPENVINO_STT_MODEL_ID})...")
+            from app.pipeline.processors.stt_openvino import _get_openvino_model
+            _get_openvino_model()
+            logger.info("Distil-Whisper OpenVINO model ready")
+        except Exception as e:
+            logger.error(f"Distil-Whisper OpenVINO model load failed: {e}", exc_info=True)
+            raise
+    elif stt_engine == "trtllm-whisper":
+        try:
+            logger.info(f"Pre-loading TensorRT-LLM Whisper engines ({settings.TRTLLM_ENGINE_DIR})...")
+            from app.pipeline.processors.stt_trtllm import _get_trtllm_runner
+            _get_trtllm_runner()
+            logger.info("TensorRT-LLM Whisper engines ready")
+        except Exception as e:
+            logger.error(f"TensorRT-LLM Whisper engine load failed: {e}", exc_info=True)
+            raise
 
-    # Start session manager
-    await session_manager.start()
 
-    # Initialize database (if enabled)
-    if settings.ENABLE_DB_PERSISTENCE:
-        logger.info("Initializing database...")
-        logger.info(f"Database URL format: {settings.database_url_async.split('@')[0]}@***")  # Log without credentials
-        try:
-            engine = await init_db(
-                database_url=settings.database_url_async,
-                pool_size=settings.DB_POOL_SIZE,
-                max_overflow=settings.DB_MAX_OVERFLOW,
-                echo=settings.DB_ECHO
-            )
-            if engine:
-                logger.info("Database engine created successfully")
-
-                # Initialize session factory
-                factory_initialized = init_session_factory()
-
-                if factory_initialized:
-                    logger.info("Database initialized successfully - persistence enabled")
-
-                    # Start cleanup background task
-                    asyncio.create_task(cleanup_old_data_task())
-                    logger.info(f"Cleanup task started: will delete data older than {settings.DATA_RETENTION_DAYS} days")
-                else:
-                    logger.error("Session factory initialization failed - persistence disabled")
+def _warm_pipeline():
+    """
+    Build the pipeline singleton (loading and warming Silero VAD), the
+    streaming VAD model, for Qwen3-TTS the TTS model, and the Ollama model,
+    so the first turn runs at steady-state speed.
+
+    Blocking; called via asyncio.to_thread after the STT preload (and after
+    /readyz flips to ready).
+    """
+    if not settings.MODEL_WARMUP:
+        return
+    from app.pipeline.voice_pipeline import get_pipeline
+    pipeline = get_pipeline()
+    # Processors are built lazily; touch the local-model ones now
+    pipeline.vad
+    pipeline.stt
+    if settings.STREAMING_VAD_ENABLED:
+        from app.pipeline.streaming_vad import _get_vad_model
+        _get_vad_model()
+    if settings.TTS_ENGINE.lower() == "qwen3":
+        from app.pipeline.pipeline_runner import _create_tts_processor
+        _create_tts_processor()
+    # Ollama is the LLM fallback; load its model once so a fallback turn
+    # doesn't pay the cold load (tried once, never per turn)
+    from app.pipeline.processors.llm_ollama import warmup_ollama
+    warmup_ollama()
+    logger.info("Pipeline models warmed up")
+
+
+async def _preload_stt_in_background(app: FastAPI):
+    """
+    Load the STT model off the event loop and flip readiness when done.
+
+    Liveness (/healthz) is served immediately; /readyz stays 503 until the
+    model is loaded, so orchestrator probes don't time out on a cold load.
+    The pipeline warmup runs after that, best effort: a failed warmup only
+    means a slower first turn, not an unready service.
+    """
+    try:
+        await asyncio.to_thread(_preload_stt_model)
+    except Exception:
+        logger.error("STT preload failed - /readyz will report not ready", exc_info=True)
+        return
+    app.state.model_ready.set()
+
+    try:
+        await asyncio.to_thread(_warm_pipeline)
+    except Exception:
+        logger.error("Pipeline warmup failed - models will load on first use", exc_info=True)
+
+
+def _prewarm_tts_cache():
+    """
+    Render the pooled cat replies into the Pocket-TTS waveform cache, so
+    pool fast-path replies skip synthesis from the first turn.
+
+    Blocking; called via asyncio.to_thread from the lifespan handler.
+    """
+    try:
+        from app.personality.cat_responses import all_pool_responses
+        from app.pipeline.pipeline_runner import _create_tts_processor
+        _create_tts_processor().prewarm(all_pool_responses())
+    except Exception as e:
+        logger.error(f"TTS cache prewarm failed: {e}", exc_info=True)
+
+
+async def _init_database():
+    """
+    Initialize database persistence: engine, session factory, then the
+    cleanup task. These steps depend on each other and run in order.
+    """
+    logger.info("Initializing database...")
+    logger.info(f"Database URL format: {settings.database_url_async.split('@')[0]}@***")  # Log without credentials
+    try:
+        engine = await init_db(
+            database_url=settings.database_url_async,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            echo=settings.DB_ECHO
+        )
+        if engine:
+            logger.info("Database engine created successfully")
+
+            # Initialize session factory
+            factory_initialized = init_session_factory()
+
+            if factory_initialized:
+                logger.info("Database initialized successfully - persistence enabled")
+
+                # Start cleanup background task
+                asyncio.create_task(cleanup_old_data_task())
+                logger.info(f"Cleanup task started: will delete data older than {settings.DATA_RETENTION_DAYS} days")
             else:
-                logger.warning("Database engine initialization failed, persistence disabled")
-        except Exception as e:
-            logger.error(f"Failed to initialize database: {e}", exc_info=True)
-            logger.warning("Continuing without database persistence")
+                logger.error("Session factory initialization failed - persistence disabled")
+        else:
+            logger.warning("Database engine initialization failed, persistence disabled")
+    except Exception as e:
+        logger.error(f"Failed to initialize database: {e}", exc_info=True)
+        logger.warning("Continuing without database persistence")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Service lifespan: startup before the yield, shutdown after it.
+
+    Startup steps are independent of each other: the STT model loads in a
+    background thread (tracked by app.state.model_ready) while the session
+    manager and database init run concurrently, so the service starts
+    accepting requests without waiting for the model.
+    """
+    _log_listener.start()
+
+    logger.info("=" * 60)
+    logger.info(f"{settings.SERVICE_NAME} starting...")
+    logger.info(f"Service URL: http://{settings.SERVICE_HOST}:{settings.SERVICE_PORT}")
+    logger.info(f"WebSocket URL: ws://{settings.SERVICE_HOST}:{settings.SERVICE_PORT}/ws")
+    logger.info(f"Ollama URL: {settings.OLLAMA_BASE_URL}")
+    logger.info(f"STT Engine: {settings.STT_ENGINE}")
+    logger.info(f"TTS Engine: {settings.TTS_ENGINE}")
+    logger.info(f"LLM Model: {settings.OLLAMA_MODEL}")
+    logger.info(f"Data Directory: {settings.DATA_DIR}")
+    logger.info("=" * 60)
+
+    # Configuration errors stop startup here, before anything is served
+    _check_stt_config()
+
+    app.state.model_ready = asyncio.Event()
+    app.state.tts_prewarm_task = None
+    app.state.stt_preload_task = asyncio.create_task(_preload_stt_in_background(app))
+    if settings.TTS_CACHE_FIXED_PROMPTS and settings.TTS_ENGINE.lower() == "pocket":
+        app.state.tts_prewarm_task = asyncio.create_task(asyncio.to_thread(_prewarm_tts_cache))
+
+    # The session manager and the database chain touch independent
+    # resources, so they start concurrently.
+    startup_tasks = [session_manager.start()]
+    if settings.ENABLE_DB_PERSISTENCE:
+        startup_tasks.append(_init_database())
     else:
         logger.info("Database persistence disabled (ENABLE_DB_PERSISTENCE=False)")
+    await asyncio.gather(*startup_tasks)
 
+    yield
 
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown"""
     logger.info(f"{settings.SERVICE_NAME} shutting down...")
 
+    # Stop waiting on startup work that is still running (a thread already
+    # inside a model load finishes on its own; its result is discarded)
+    for task in (app.state.stt_preload_task, app.state.tts_prewarm_task):
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    # Let in-flight turns finish their tail work
+    from app.pipeline.pipeline_runner import shutdown_pipeline_runner
+    await shutdown_pipeline_runner()
+
     # Stop session manager
     await session_manager.stop()
 
+    # Close the shared cloud STT/TTS connection pools
+    from app.utils.http_clients import close_http_clients
+    await close_http_clients()
+
     # Close database connections (if enabled)
     if settings.ENABLE_DB_PERSISTENCE:
         logger.info("Closing database connections...")
         await close_db()
         logger.info("Database connections closed")
 
+    # Flush queued log records
+    _log_listener.stop()
+
+
+# Create FastAPI app
+app = FastAPI(
+    title=settings.SERVICE_NAME,
+    description="Local voice interaction service for kids game",
+    version="0.1.0",
+    docs_url="/docs",
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+# Add CORS middleware for web client
+# Log configured CORS origins for debugging
+logger.info(f"CORS allowed origins: {settings.cors_origins_list}")
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.cors_origins_list,
+    allow_origin_regex=r"https://.*\.vercel\.app",  # Allow all Vercel deployments
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
 
 # Root endpoint
 @app.get("/")
@@ -222,6 +376,20 @@ async def health_check():
                 "engine": "moonshine",
                 "model": settings.MOONSHINE_MODEL_NAME,
             }
+        elif stt_engine == "openvino-distil":
+            health_status["checks"]["stt"] = {
+                "status": "ready",
+                "engine": "openvino-distil",
+                "model": settings.OPENVINO_STT_MODEL_ID,
+                "device": settings.OPENVINO_STT_DEVICE
+            }
+        elif stt_engine == "trtllm-whisper":
+            health_status["checks"]["stt"] = {
+                "status": "ready",
+                "engine": "trtllm-whisper",
+                "model": settings.TRTLLM_WHISPER_MODEL_ID,
+                "device": "cuda"
+            }
         else:
             health_status["checks"]["stt"] = {
                 "status": "unknown",
@@ -279,12 +447,32 @@ async def ping():
     return {"ping": "pong", "timestamp": datetime.utcnow().isoformat()}
 
 
+# Liveness probe
+@app.get("/healthz")
+async def healthz():
+    """Liveness probe - the process is up and serving requests"""
+    return {"status": "alive", "timestamp": datetime.utcnow().isoformat()}
+
+
+# Readiness probe
+@app.get("/readyz")
+async def readyz(request: Request):
+    """Readiness probe - 503 until the STT model has finished loading"""
+    model_ready = getattr(request.app.state, "model_ready", None)
+    if model_ready is None or not model_ready.is_set():
+        return ORJSONResponse(
+            status_code=503,
+            content={"status": "loading", "timestamp": datetime.utcnow().isoformat()}
+        )
+    return {"status": "ready", "timestamp": datetime.utcnow().isoformat()}
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle unexpected exceptions"""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -91,6 +91,12 @@ _SHORT_REACTIONS: list[str] = [
 ]
 
 
+def all_pool_responses() -> list[str]:
+    """Every pre-baked line (all moods plus short reactions), e.g. for TTS prewarming."""
+    lines = [line for bucket in _POOL.values() for line in bucket]
+    return lines + _SHORT_REACTIONS
+
+
 def should_use_pool(utterance: str, pool_probability: float = 0.65) -> bool:
     """
     Decide whether to use the fast response pool instead of the LLM.
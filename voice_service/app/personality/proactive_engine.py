@@ -15,6 +15,7 @@ from typing import Optional
 from app.personality.cat_mood import CatMood, MoodManager
 from app.personality.cat_prompts import get_proactive_prompt, get_context_note
 from app.config import settings
+from app.pipeline.executor import run_in_pool
 
 logger = logging.getLogger(__name__)
 
@@ -178,7 +179,7 @@ class ProactiveEngine:
             await self._broadcast_cat_state("speaking")
 
             # Generate text (LLM call in thread)
-            text = await asyncio.to_thread(self._call_llm, system_prompt)
+            text = await run_in_pool(self._call_llm, system_prompt)
             if not text:
                 session.status = SessionStatus.IDLE
                 await self._broadcast_cat_state("idle")
@@ -191,16 +192,20 @@ class ProactiveEngine:
                 await self._broadcast_cat_state("idle")
                 return
 
-            # Apply cat voice pitch shift
+            # Apply cat voice pitch shift (reuse its output for the duration)
+            audio_bytes = None
             if settings.CAT_VOICE_PITCH_SEMITONES != 0.0:
                 from app.utils.audio_pitch import pitch_shift_wav_inplace
-                await asyncio.to_thread(
+                audio_bytes = await asyncio.to_thread(
                     pitch_shift_wav_inplace, audio_path, settings.CAT_VOICE_PITCH_SEMITONES
                 )
 
             # Get duration
-            from app.utils.wav_utils import get_wav_info
-            wav_info = await asyncio.to_thread(get_wav_info, audio_path)
+            from app.utils.wav_utils import get_wav_info, get_wav_info_from_bytes
+            if audio_bytes is not None:
+                wav_info = get_wav_info_from_bytes(audio_bytes)
+            else:
+                wav_info = await asyncio.to_thread(get_wav_info, audio_path)
             duration_ms = int(wav_info.get("duration", 2.0) * 1000)
 
             # Build URL
@@ -301,12 +306,12 @@ class ProactiveEngine:
         """Generate TTS audio and return the file path."""
         try:
             from app.pipeline.pipeline_runner import _create_tts_processor
+            # Directory is created once by SessionManager when the session is registered
             audio_dir = os.path.join(settings.AUDIO_DIR, self.session_id)
-            os.makedirs(audio_dir, exist_ok=True)
             proactive_id = f"proactive_{uuid.uuid4().hex[:8]}.wav"
             audio_path = os.path.join(audio_dir, proactive_id)
             tts = _create_tts_processor()
-            success = await asyncio.to_thread(tts.synthesize, text, audio_path)
+            success = await run_in_pool(tts.synthesize, text, audio_path)
             return audio_path if success else None
         except Exception as e:
             logger.error(f"[{self.session_id}] Proactive TTS failed: {e}")
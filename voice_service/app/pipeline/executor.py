@@ -0,0 +1,44 @@
+"""
+Shared thread pool for blocking model calls (STT, LLM, TTS)
+
+Model inference runs in its own pool sized by PIPELINE_WORKER_THREADS so
+concurrent sessions don't compete with quick file I/O offloads in the
+default asyncio executor, and so model concurrency has an explicit cap.
+"""
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_pool: Optional[ThreadPoolExecutor] = None
+
+
+def get_pool() -> ThreadPoolExecutor:
+    """Get the shared model-call pool (created on first use)"""
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(
+            max_workers=settings.PIPELINE_WORKER_THREADS,
+            thread_name_prefix="pipeline",
+        )
+        logger.info(f"Pipeline thread pool started ({settings.PIPELINE_WORKER_THREADS} workers)")
+    return _pool
+
+
+async def run_in_pool(func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking call on the shared pool without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_pool(), functools.partial(func, *args, **kwargs))
+
+
+def shutdown_pool():
+    """Stop the pool (a later call to get_pool starts a fresh one)"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
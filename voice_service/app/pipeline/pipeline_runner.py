@@ -10,24 +10,33 @@ Response latency strategy (fastest → slowest):
 import asyncio
 import logging
 import numpy as np
-from typing import Optional
+from typing import Dict, List, Optional
 import os
 import time
+from functools import lru_cache
 
+from app.pipeline.executor import run_in_pool, shutdown_pool
 from app.pipeline.voice_pipeline import get_pipeline
 from app.api.session_manager import session_manager
 from app.api.ws import connection_manager
 from app.api.models import SessionStatus
 from app.config import settings
 from app.utils.audio_io import save_wav
+from app.utils.audio_pitch import pitch_shift_wav_inplace
+from app.utils.wav_utils import get_wav_info, get_wav_info_from_bytes
 
 logger = logging.getLogger(__name__)
 
 
-def _collect_sentences(prompt: str, context: list, system_prompt: str) -> list[str]:
+def _collect_sentences(
+    prompt: str, context: list, system_prompt: str, context_note: str = ""
+) -> list[str]:
     """
     Generate LLM sentences with Claude as primary and Ollama as fallback.
 
+    ``context_note`` is kept apart from the static system prompt so Ollama
+    can reuse its cached prompt prefix across turns.
+
     Tries Claude (claude-haiku-4-5) first — ~5-10× faster than local CPU
     inference.  Falls back to the Ollama 0.5b model if:
       - ANTHROPIC_API_KEY is not set
@@ -40,7 +49,9 @@ def _collect_sentences(prompt: str, context: list, system_prompt: str) -> list[s
         try:
             from app.pipeline.processors.llm_claude import ClaudeLLMProcessor
             sentences = list(
-                ClaudeLLMProcessor().generate_sentences_stream(prompt, context, system_prompt)
+                ClaudeLLMProcessor().generate_sentences_stream(
+                    prompt, context, system_prompt + context_note
+                )
             )
             if sentences:
                 logger.info(f"Claude replied with {len(sentences)} sentence(s)")
@@ -54,24 +65,41 @@ def _collect_sentences(prompt: str, context: list, system_prompt: str) -> list[s
     # ── Fallback: local Ollama ──────────────────────────────────────────────
     logger.info("Using Ollama fallback for LLM")
     from app.pipeline.processors.llm_ollama import OllamaLLMProcessor
-    return list(OllamaLLMProcessor().generate_sentences_stream(prompt, context, system_prompt))
+    return list(
+        OllamaLLMProcessor().generate_sentences_stream(
+            prompt, context, system_prompt, context_note=context_note
+        )
+    )
 
 
-def _create_tts_processor():
-    """Create TTS processor based on configured engine."""
-    engine = settings.TTS_ENGINE.lower()
+def _read_file(path: str) -> bytes:
+    """Read a whole file (called via asyncio.to_thread)"""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=8)
+def _get_tts_processor(engine: str, voice: str):
+    """
+    One live processor per (engine, voice), shared by every turn and by
+    the proactive engine, so clients, connection pools and voice state are
+    set up once rather than per sentence.
+    """
     if engine == "pocket":
         from app.pipeline.processors.tts_pocket import PocketTTSProcessor
         return PocketTTSProcessor()
     elif engine == "qwen3":
+        if settings.QWEN_TTS_WORKER_PROCESS:
+            from app.pipeline.processors.tts_worker import TTSWorkerClient
+            return TTSWorkerClient()
         from app.pipeline.processors.tts_qwen3 import Qwen3TTSProcessor
         return Qwen3TTSProcessor()
     elif engine == "edge":
         from app.pipeline.processors.tts_edge import EdgeTTSProcessor
-        return EdgeTTSProcessor()
+        return EdgeTTSProcessor(voice=voice)
     elif engine == "elevenlabs":
         from app.pipeline.processors.tts_elevenlabs import ElevenLabsTTSProcessor
-        return ElevenLabsTTSProcessor(voice=settings.ELEVENLABS_VOICE)
+        return ElevenLabsTTSProcessor(voice=voice)
     else:
         raise ValueError(
             f"Unknown TTS_ENGINE '{engine}'. "
@@ -79,23 +107,85 @@ def _create_tts_processor():
         )
 
 
+# Voice setting per engine (engines without one share a single instance)
+_TTS_VOICE_SETTING = {
+    "pocket": "POCKET_TTS_VOICE",
+    "edge": "EDGE_TTS_VOICE",
+    "elevenlabs": "ELEVENLABS_VOICE",
+}
+
+
+def _create_tts_processor():
+    """Get the TTS processor for the configured engine and voice."""
+    engine = settings.TTS_ENGINE.lower()
+    voice_setting = _TTS_VOICE_SETTING.get(engine)
+    voice = getattr(settings, voice_setting) if voice_setting else ""
+    return _get_tts_processor(engine, voice)
+
+
 class PipelineRunner:
     """Runs voice pipeline and broadcasts events"""
 
     def __init__(self):
         """Initialize pipeline runner"""
         self.pipeline = get_pipeline()
+        # Fire-and-forget tail work (turn finalization, DB persistence).
+        # Holding references keeps the tasks alive until they finish and
+        # lets shutdown wait for them.
+        self._background_tasks: set[asyncio.Task] = set()
         logger.info("Pipeline runner initialized")
 
+    def _spawn(self, coro) -> asyncio.Task:
+        """Schedule a tracked background task"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def wait_for_background_tasks(self):
+        """Wait for pending background tasks (called at shutdown)"""
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
+    async def _finalize_turn(self, session, turn_id: str, any_audio: bool, t_start: float):
+        """
+        Tail of a turn: wait for the client's playback ack, return to IDLE and
+        resume the proactive engine. Runs as a background task so
+        process_session_audio returns as soon as the reply is out.
+        """
+        session_id = session.session_id
+        try:
+            if any_audio:
+                # Let the client start playback before flipping back to idle
+                await connection_manager.wait_for_playback_ack(
+                    session_id, settings.PLAYBACK_ACK_TIMEOUT_MS / 1000.0
+                )
+            await connection_manager.broadcast_state(session_id, SessionStatus.IDLE, None)
+            session.status = SessionStatus.IDLE
+
+            logger.info(
+                f"Turn {turn_id} complete in {(time.time()-t_start)*1000:.0f}ms"
+            )
+        except Exception as e:
+            logger.error(f"Error finalizing turn {turn_id}: {e}", exc_info=True)
+        finally:
+            engine = session_manager.get_proactive_engine(session_id)
+            if engine:
+                engine.resume()
+
     async def process_session_audio(
         self,
         session_id: str,
         audio: np.ndarray,
-        sample_rate: int = None
+        sample_rate: int = None,
+        vad_segments: Optional[List[Dict[str, int]]] = None,
     ) -> bool:
         """
         Process audio for a session through the complete pipeline.
 
+        vad_segments (speech segments from streaming endpointing) let the
+        pipeline skip its own VAD pass.
+
         Flow:
           1. STT + skills routing  (thread)
           2a. Math route           → single TTS, broadcast
@@ -124,6 +214,7 @@ class PipelineRunner:
         if mood_manager:
             mood_manager.on_user_interaction()
 
+        finalize_scheduled = False
         try:
             t_start = time.time()
             logger.info(f"Processing audio for session {session_id}, turn {turn_id}")
@@ -134,8 +225,8 @@ class PipelineRunner:
             session.status = SessionStatus.PROCESSING
 
             # ── Step 1: STT + skills routing ────────────────────────────────
-            stt_result = await asyncio.to_thread(
-                self.pipeline.transcribe_and_route, audio, sample_rate
+            stt_result = await self.pipeline.transcribe_and_route_async(
+                audio, sample_rate, vad_segments
             )
 
             if stt_result.get("error"):
@@ -152,10 +243,14 @@ class PipelineRunner:
             session.current_turn.transcript = transcript
             logger.info(f"STT done in {(time.time()-t_start)*1000:.0f}ms: '{transcript}'")
 
+            # Events that can go out together are coalesced into a single
+            # frame; the transcript is only sent ahead when the LLM is about
+            # to add noticeable latency.
+            pending_events = []
             if transcript:
-                await connection_manager.broadcast_transcript(
+                pending_events.append(connection_manager.transcript_event(
                     session_id, transcript, turn_id, partial=False
-                )
+                ))
 
             # ── Step 2: Generate reply ───────────────────────────────────────
             context = session.get_context(num_turns=settings.LLM_CONTEXT_TURNS)
@@ -178,17 +273,19 @@ class PipelineRunner:
                     # Full LLM path (Claude → Ollama fallback)
                     from app.personality.cat_prompts import get_system_prompt, get_context_note
 
+                    await connection_manager.broadcast_bulk(session_id, pending_events)
+                    pending_events = []
+
                     system_prompt = settings.SYSTEM_PROMPT
+                    context_note = ""
                     if mood_manager:
                         mode = mood_manager.get_response_mode()
-                        system_prompt = (
-                            get_system_prompt(mood_manager.current_mood, mode)
-                            + get_context_note(context)
-                        )
+                        system_prompt = get_system_prompt(mood_manager.current_mood, mode)
+                        context_note = get_context_note(context)
                         logger.info(f"LLM: mood={mood_manager.current_mood}, mode={mode}")
 
-                    reply_sentences = await asyncio.to_thread(
-                        _collect_sentences, transcript, context, system_prompt
+                    reply_sentences = await run_in_pool(
+                        _collect_sentences, transcript, context, system_prompt, context_note
                     )
 
             # ── Step 3: TTS + broadcast each sentence ───────────────────────
@@ -197,18 +294,19 @@ class PipelineRunner:
             session.current_turn.processing_time_ms = int((time.time() - t_start) * 1000)
 
             if full_reply:
-                await connection_manager.broadcast_reply_text(
-                    session_id, full_reply, turn_id
+                pending_events.append(
+                    connection_manager.reply_text_event(session_id, full_reply, turn_id)
                 )
+            await connection_manager.broadcast_bulk(session_id, pending_events)
 
-            audio_dir = os.path.join(settings.AUDIO_DIR, session_id)
-            os.makedirs(audio_dir, exist_ok=True)
+            audio_dir = session.audio_dir
             base_url = (
                 settings.PUBLIC_URL
                 if settings.PUBLIC_URL
                 else f"http://{settings.SERVICE_HOST}:{settings.SERVICE_PORT}"
             )
 
+            connection_manager.expect_playback_ack(session_id)
             any_audio = False
             for seg_idx, sentence in enumerate(reply_sentences):
                 if not sentence.strip():
@@ -217,40 +315,52 @@ class PipelineRunner:
                 audio_path = os.path.join(audio_dir, filename)
 
                 tts = _create_tts_processor()
-                success = await asyncio.to_thread(tts.synthesize, sentence, audio_path)
+                success = await run_in_pool(tts.synthesize, sentence, audio_path)
                 if not success:
                     logger.error(f"TTS failed for segment {seg_idx}")
                     continue
 
+                # The pitch pass hands back the WAV it wrote, so the file
+                # only has to be read again when no pitch shift ran
+                audio_bytes = None
                 if settings.CAT_VOICE_PITCH_SEMITONES != 0.0:
-                    from app.utils.audio_pitch import pitch_shift_wav_inplace
-                    await asyncio.to_thread(
+                    audio_bytes = await asyncio.to_thread(
                         pitch_shift_wav_inplace, audio_path, settings.CAT_VOICE_PITCH_SEMITONES
                     )
 
-                from app.utils.wav_utils import get_wav_info
-                wav_info = await asyncio.to_thread(get_wav_info, audio_path)
+                if settings.TTS_INLINE_WS_AUDIO:
+                    if audio_bytes is None:
+                        audio_bytes = await asyncio.to_thread(_read_file, audio_path)
+                    wav_info = get_wav_info_from_bytes(audio_bytes)
+                    await connection_manager.broadcast_audio_bytes(session_id, audio_bytes)
+                elif audio_bytes is not None:
+                    wav_info = get_wav_info_from_bytes(audio_bytes)
+                else:
+                    wav_info = await asyncio.to_thread(get_wav_info, audio_path)
                 duration_ms = int(wav_info.get("duration", 0.0) * 1000)
                 sample_rate_hz = wav_info.get("sample_rate", settings.TTS_SAMPLE_RATE)
 
                 audio_url = f"{base_url}/api/audio/{session_id}/{filename}"
-                await connection_manager.broadcast_audio_ready(
-                    session_id, turn_id, audio_url,
-                    duration_ms=duration_ms, sample_rate_hz=sample_rate_hz,
-                )
+                segment_events = [
+                    connection_manager.audio_ready_event(
+                        session_id, turn_id, audio_url,
+                        duration_ms=duration_ms, sample_rate_hz=sample_rate_hz,
+                        inline=settings.TTS_INLINE_WS_AUDIO,
+                    )
+                ]
+                if not any_audio:
+                    # Mark as speaking as soon as the first chunk is ready
+                    segment_events.append(
+                        connection_manager.state_event(session_id, SessionStatus.SPEAKING, turn_id)
+                    )
+                    session.status = SessionStatus.SPEAKING
+                await connection_manager.broadcast_bulk(session_id, segment_events)
                 logger.info(
                     f"Segment {seg_idx} ready in {(time.time()-t_start)*1000:.0f}ms: "
                     f"'{sentence}' → {audio_url}"
                 )
                 any_audio = True
 
-                if seg_idx == 0:
-                    # Mark as speaking as soon as the first chunk is ready
-                    await connection_manager.broadcast_state(
-                        session_id, SessionStatus.SPEAKING, turn_id
-                    )
-                    session.status = SessionStatus.SPEAKING
-
             if not any_audio:
                 await connection_manager.broadcast_error(
                     session_id, "TTS_ERROR", "Failed to synthesize response audio", turn_id
@@ -261,17 +371,13 @@ class PipelineRunner:
 
             session.complete_turn()
             if len(session.turns) > 0:
-                asyncio.create_task(
+                self._spawn(
                     session_manager.persist_turn(session_id, session.turns[-1])
                 )
 
-            await asyncio.sleep(0.5)
-            await connection_manager.broadcast_state(session_id, SessionStatus.IDLE, None)
-            session.status = SessionStatus.IDLE
-
-            logger.info(
-                f"Turn {turn_id} complete in {(time.time()-t_start)*1000:.0f}ms"
-            )
+            # The finalize task takes over resuming the proactive engine
+            self._spawn(self._finalize_turn(session, turn_id, any_audio, t_start))
+            finalize_scheduled = True
             return True
 
         except Exception as e:
@@ -283,10 +389,10 @@ class PipelineRunner:
             return False
 
         finally:
-            engine = session_manager.get_proactive_engine(session_id)
-            if engine:
-                engine.resume()
-
+            if not finalize_scheduled:
+                engine = session_manager.get_proactive_engine(session_id)
+                if engine:
+                    engine.resume()
 
 
 # Global pipeline runner instance
@@ -303,7 +409,22 @@ def get_pipeline_runner() -> PipelineRunner:
     return _runner_instance
 
 
-async def process_audio_stream(session_id: str, audio_data: bytes, sample_rate: int = None):
+async def shutdown_pipeline_runner():
+    """Let in-flight turn finalization finish, then stop the model thread pool"""
+    if _runner_instance is not None:
+        await _runner_instance.wait_for_background_tasks()
+    shutdown_pool()
+    if settings.QWEN_TTS_WORKER_PROCESS:
+        from app.pipeline.processors.tts_worker import shutdown_workers
+        shutdown_workers()
+
+
+async def process_audio_stream(
+    session_id: str,
+    audio_data: bytes,
+    sample_rate: int = None,
+    vad_segments: Optional[List[Dict[str, int]]] = None,
+):
     """
     Process audio received from WebSocket stream
 
@@ -312,39 +433,44 @@ async def process_audio_stream(session_id: str, audio_data: bytes, sample_rate:
         audio_data: Raw PCM16 audio bytes from browser AudioWorklet
         sample_rate: Actual sample rate from the client's AudioContext.
                      On Android Chrome this may be 44100 or 48000 instead of 16000.
+        vad_segments: Speech segments from streaming VAD, in samples at
+                      AUDIO_SAMPLE_RATE (ignored if the audio is resampled)
     """
     logger.info(f"Processing audio stream for session {session_id}: {len(audio_data)} bytes")
 
     try:
         # Convert raw PCM16 bytes to numpy array
-        # AudioWorklet sends Int16Array (little-endian, 2 bytes per sample)
-        pcm16_data = np.frombuffer(audio_data, dtype=np.int16)
-
-        # Convert PCM16 to float32 in range [-1.0, 1.0]
-        audio = pcm16_data.astype(np.float32) / 32768.0
+        # AudioWorklet sends Int16Array (little-endian, 2 bytes per sample).
+        # frombuffer is a zero-copy, read-only view over the received bytes;
+        # it is never written to.
+        audio = np.frombuffer(audio_data, dtype=np.int16)
 
         # Use client-reported sample rate if available, otherwise fall back to config.
         # Android Chrome may capture at 44100/48000Hz instead of the requested 16kHz.
         if sample_rate is None:
             sample_rate = settings.AUDIO_SAMPLE_RATE
 
-        logger.info(f"Converted PCM audio: {len(audio)} samples at {sample_rate}Hz")
+        logger.info(f"Received PCM audio: {len(audio)} samples at {sample_rate}Hz")
 
         # Resample to 16kHz if needed. The pipeline processors (Silero VAD, noise
         # reducer) are initialized at 16kHz and cannot handle other rates. Android
         # Chrome often captures at 44100 or 48000Hz when the AudioContext can't use
         # the requested 16kHz rate.
+        # At the native rate the audio stays int16 (half the bytes) until
+        # the pipeline converts it once at the DSP/model boundary.
         target_rate = settings.AUDIO_SAMPLE_RATE
         if sample_rate != target_rate:
             logger.info(f"Resampling audio from {sample_rate}Hz to {target_rate}Hz for pipeline")
-            from app.utils.audio_io import resample_audio
-            audio = resample_audio(audio, sample_rate, target_rate)
+            from app.utils.audio_io import resample_audio, pcm16_to_float32
+            audio = resample_audio(pcm16_to_float32(audio), sample_rate, target_rate)
             sample_rate = target_rate
             logger.info(f"Resampled audio: {len(audio)} samples at {sample_rate}Hz")
+            # Streaming VAD ran on the client-rate samples; its offsets don't apply
+            vad_segments = None
 
         # Process through pipeline
         runner = get_pipeline_runner()
-        await runner.process_session_audio(session_id, audio, sample_rate)
+        await runner.process_session_audio(session_id, audio, sample_rate, vad_segments)
 
     except Exception as e:
         logger.error(f"Error processing audio stream: {e}", exc_info=True)
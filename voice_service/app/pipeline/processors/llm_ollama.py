@@ -2,9 +2,13 @@
 LLM Processor using Ollama
 Generates responses to non-math queries
 """
+import hashlib
 import json
 import re
+import threading
+from collections import OrderedDict
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 from typing import Generator, List, Dict, Optional
 import time
@@ -16,6 +20,108 @@ _SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session: callers build a fresh OllamaLLMProcessor per turn, so
+# the connection pool lives at module level to keep the Ollama socket warm
+_http_session: Optional[requests.Session] = None
+
+
+# Exact-match reply cache shared by all processor instances (LRU order)
+_response_cache: "OrderedDict[str, str]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _cache_key(
+    prompt: str,
+    context: Optional[List[Dict[str, str]]],
+    system_prompt: str,
+    context_note: str = "",
+) -> str:
+    """Hash everything that determines the reply"""
+    raw = json.dumps([system_prompt, context or [], context_note, prompt], sort_keys=True)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _cache_get(key: str) -> Optional[str]:
+    """Look up a cached reply, marking it most recently used"""
+    with _response_cache_lock:
+        reply = _response_cache.get(key)
+        if reply is not None:
+            _response_cache.move_to_end(key)
+        return reply
+
+
+def _cache_put(key: str, reply: str):
+    """Store a reply, evicting the least recently used entry when full"""
+    if settings.LLM_RESPONSE_CACHE_SIZE <= 0 or not reply:
+        return
+    with _response_cache_lock:
+        _response_cache[key] = reply
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > settings.LLM_RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+# (base_url, model) pairs a warmup has already been tried for, whether it
+# worked or not — turns never retry it
+_warmup_attempted: set = set()
+_warmup_lock = threading.Lock()
+
+
+def _get_http_session() -> requests.Session:
+    """Get the shared keep-alive session for Ollama requests"""
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"Connection": "keep-alive"})
+        _http_session = session
+    return _http_session
+
+
+def warmup_ollama(base_url: str = None, model: str = None) -> bool:
+    """
+    Make Ollama load the model before the first real turn
+
+    Tried once per (base_url, model) per process; a failure is remembered
+    too, so a cold or missing Ollama never delays turns with retries (the
+    first real request loads the model instead). The lock only guards the
+    bookkeeping, never the HTTP call.
+
+    Blocking; called via asyncio.to_thread from the startup warmup.
+
+    Returns:
+        True if this call loaded the model
+    """
+    base_url = base_url or settings.OLLAMA_BASE_URL
+    model = model or settings.OLLAMA_MODEL
+    key = (base_url, model)
+    with _warmup_lock:
+        if key in _warmup_attempted:
+            return False
+        _warmup_attempted.add(key)
+
+    start_time = time.time()
+    try:
+        response = _get_http_session().post(
+            f"{base_url}/api/generate",
+            json={
+                "model": model,
+                "prompt": "hi",
+                "stream": False,
+                "keep_alive": settings.OLLAMA_KEEP_ALIVE,
+                "options": {"num_predict": 1},
+            },
+            timeout=settings.OLLAMA_WARMUP_TIMEOUT,
+        )
+        response.raise_for_status()
+    except Exception as e:
+        logger.warning(f"Ollama warmup failed (not retried): {e}")
+        return False
+
+    logger.info(f"Ollama model {model} warmed up in {time.time() - start_time:.2f}s")
+    return True
+
 
 class OllamaLLMProcessor:
     """LLM processor using Ollama local inference"""
@@ -37,108 +143,161 @@ class OllamaLLMProcessor:
         self.base_url = base_url or settings.OLLAMA_BASE_URL
         self.model = model or settings.OLLAMA_MODEL
         self.timeout = timeout or settings.OLLAMA_TIMEOUT
+        self.session = _get_http_session()
 
+        # No network calls here: a processor is built per turn, and the
+        # model is loaded once at startup by warmup_ollama()
         logger.info(
             f"LLM initialized: model={self.model}, "
             f"url={self.base_url}"
         )
 
-        # Verify Ollama is accessible
-        self._check_connection()
+    def _build_payload(
+        self,
+        prompt: str,
+        context: Optional[List[Dict[str, str]]],
+        system_prompt: str,
+        context_note: str = "",
+    ) -> dict:
+        """
+        Build the /api/chat request body (always streamed)
 
-    def _check_connection(self):
-        """Check if Ollama is accessible"""
-        try:
-            response = requests.get(self.base_url, timeout=5)
-            logger.info("Ollama connection verified")
-        except Exception as e:
-            logger.warning(f"Could not connect to Ollama: {e}")
+        The static system prompt is always the first message, byte-for-byte,
+        so Ollama can reuse its cached prefix across turns; per-turn text
+        (history, context note, prompt) only ever follows it.
+        """
+        messages = [{"role": "system", "content": system_prompt}]
+        if context:
+            for turn in context:
+                messages.append({"role": "user", "content": turn["user"]})
+                messages.append({"role": "assistant", "content": turn["assistant"]})
+        if context_note:
+            messages.append({"role": "system", "content": context_note.strip()})
+        # Brevity is already enforced by the cat system prompts and
+        # LLM_MAX_TOKENS — no need to repeat it in the user message
+        messages.append({"role": "user", "content": prompt})
+
+        options = {
+            "temperature": settings.LLM_TEMPERATURE,
+            "top_p": settings.LLM_TOP_P,
+            "num_predict": settings.LLM_MAX_TOKENS,
+            "num_ctx": settings.LLM_NUM_CTX,
+        }
+        if settings.LLM_NUM_THREAD > 0:
+            options["num_thread"] = settings.LLM_NUM_THREAD
+        if settings.LLM_NUM_KEEP > 0:
+            options["num_keep"] = settings.LLM_NUM_KEEP
+
+        return {
+            "model": self.model,
+            "messages": messages,
+            "stream": True,
+            "keep_alive": settings.OLLAMA_KEEP_ALIVE,
+            "options": options,
+        }
+
+    def generate_stream(
+        self,
+        prompt: str,
+        context: List[Dict[str, str]] = None,
+        system_prompt: str = None,
+        context_note: str = "",
+    ) -> Generator[str, None, None]:
+        """
+        Stream the LLM response token by token
+
+        Args:
+            prompt: User prompt/question
+            context: Conversation context (list of {user, assistant} dicts)
+            system_prompt: System prompt (default from settings)
+            context_note: Per-turn note sent after the history, keeping
+                the system prompt itself static
+
+        Yields:
+            Content fragments as Ollama produces them
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        if system_prompt is None:
+            system_prompt = settings.SYSTEM_PROMPT
+
+        payload = self._build_payload(prompt, context, system_prompt, context_note)
+
+        with self.session.post(
+            f"{self.base_url}/api/chat",
+            json=payload,
+            stream=True,
+            timeout=self.timeout,
+        ) as resp:
+            resp.raise_for_status()
+            for raw_line in resp.iter_lines():
+                if not raw_line:
+                    continue
+                try:
+                    chunk = json.loads(raw_line)
+                except json.JSONDecodeError:
+                    continue
+
+                token = chunk.get("message", {}).get("content", "")
+                if token:
+                    yield token
+
+                if chunk.get("done"):
+                    break
 
     def generate(
         self,
         prompt: str,
         context: List[Dict[str, str]] = None,
-        system_prompt: str = None
+        system_prompt: str = None,
+        context_note: str = "",
     ) -> Optional[str]:
         """
         Generate response using Ollama
 
+        Thin wrapper over generate_stream for callers that need the whole
+        reply at once.
+
         Args:
             prompt: User prompt/question
             context: Conversation context (list of {user, assistant} dicts)
             system_prompt: System prompt (default from settings)
+            context_note: Per-turn note sent after the history
 
         Returns:
             Generated response or None if generation failed
         """
+        logger.info(f"Generating LLM response for: '{prompt}'")
+
         if system_prompt is None:
             system_prompt = settings.SYSTEM_PROMPT
-
-        logger.info(f"Generating LLM response for: '{prompt}'")
+        key = _cache_key(prompt, context, system_prompt, context_note)
+        cached = _cache_get(key)
+        if cached is not None:
+            logger.info(f"LLM cache hit: '{cached}'")
+            return cached
 
         start_time = time.time()
 
         try:
-            # Build messages for chat endpoint
-            messages = []
-
-            # Add system message
-            messages.append({
-                "role": "system",
-                "content": system_prompt
-            })
-
-            # Add context messages
-            if context:
-                for turn in context:
-                    messages.append({"role": "user", "content": turn["user"]})
-                    messages.append({"role": "assistant", "content": turn["assistant"]})
-
-            # Add current user message (brevity is already enforced by
-            # the cat system prompts and LLM_MAX_TOKENS — no need to repeat)
-            messages.append({"role": "user", "content": prompt})
-
-            # Call Ollama API
-            options = {
-                "temperature": settings.LLM_TEMPERATURE,
-                "top_p": settings.LLM_TOP_P,
-                "num_predict": settings.LLM_MAX_TOKENS,
-                "num_ctx": settings.LLM_NUM_CTX,
-            }
-            if settings.LLM_NUM_THREAD > 0:
-                options["num_thread"] = settings.LLM_NUM_THREAD
-
-            payload = {
-                "model": self.model,
-                "messages": messages,
-                "stream": False,
-                "options": options,
-            }
-
-            response = requests.post(
-                f"{self.base_url}/api/chat",
-                json=payload,
-                timeout=self.timeout
-            )
-
-            response.raise_for_status()
-            result = response.json()
+            generated_text = "".join(
+                self.generate_stream(prompt, context, system_prompt, context_note)
+            ).strip()
 
-            # Extract response
-            if "message" in result and "content" in result["message"]:
-                generated_text = result["message"]["content"].strip()
+            if not generated_text:
+                logger.error("Ollama returned an empty response")
+                return None
 
-                elapsed_time = time.time() - start_time
+            elapsed_time = time.time() - start_time
 
-                logger.info(
-                    f"LLM response generated: '{generated_text}' "
-                    f"({elapsed_time:.2f}s)"
-                )
+            logger.info(
+                f"LLM response generated: '{generated_text}' "
+                f"({elapsed_time:.2f}s)"
+            )
 
-                return generated_text
-            else:
-                logger.error(f"Unexpected Ollama response format: {result}")
-                return None
+            _cache_put(key, generated_text)
+            return generated_text
 
         except requests.exceptions.Timeout:
             logger.error(f"Ollama request timed out after {self.timeout}s")
@@ -157,6 +316,7 @@ class OllamaLLMProcessor:
         prompt: str,
         context: List[Dict[str, str]] = None,
         system_prompt: str = None,
+        context_note: str = "",
     ) -> Generator[str, None, None]:
         """
         Stream the LLM response and yield one complete sentence at a time.
@@ -170,69 +330,42 @@ class OllamaLLMProcessor:
         """
         if system_prompt is None:
             system_prompt = settings.SYSTEM_PROMPT
-
-        messages = [{"role": "system", "content": system_prompt}]
-        if context:
-            for turn in context:
-                messages.append({"role": "user", "content": turn["user"]})
-                messages.append({"role": "assistant", "content": turn["assistant"]})
-        messages.append({"role": "user", "content": prompt})
-
-        options = {
-            "temperature": settings.LLM_TEMPERATURE,
-            "top_p": settings.LLM_TOP_P,
-            "num_predict": settings.LLM_MAX_TOKENS,
-            "num_ctx": settings.LLM_NUM_CTX,
-        }
-        if settings.LLM_NUM_THREAD > 0:
-            options["num_thread"] = settings.LLM_NUM_THREAD
-
-        payload = {
-            "model": self.model,
-            "messages": messages,
-            "stream": True,
-            "options": options,
-        }
-
+        key = _cache_key(prompt, context, system_prompt, context_note)
+        cached = _cache_get(key)
+        if cached is not None:
+            logger.info(f"LLM cache hit: '{cached}'")
+            for sentence in _SENTENCE_END.split(cached):
+                if sentence.strip():
+                    yield sentence.strip()
+            return
+
+        sentences: List[str] = []
         buffer = ""
         try:
-            with requests.post(
-                f"{self.base_url}/api/chat",
-                json=payload,
-                stream=True,
-                timeout=self.timeout,
-            ) as resp:
-                resp.raise_for_status()
-                for raw_line in resp.iter_lines():
-                    if not raw_line:
-                        continue
-                    try:
-                        chunk = json.loads(raw_line)
-                    except json.JSONDecodeError:
-                        continue
-
-                    token = chunk.get("message", {}).get("content", "")
-                    buffer += token
-
-                    # Yield every time a sentence boundary is found
-                    while True:
-                        m = _SENTENCE_END.search(buffer)
-                        if not m:
-                            break
-                        sentence = buffer[: m.start() + 1].strip()
-                        buffer = buffer[m.end():]
-                        if sentence:
-                            logger.debug(f"LLM sentence: '{sentence}'")
-                            yield sentence
-
-                    if chunk.get("done"):
+            for token in self.generate_stream(prompt, context, system_prompt, context_note):
+                buffer += token
+
+                # Yield every time a sentence boundary is found
+                while True:
+                    m = _SENTENCE_END.search(buffer)
+                    if not m:
                         break
+                    sentence = buffer[: m.start() + 1].strip()
+                    buffer = buffer[m.end():]
+                    if sentence:
+                        logger.debug(f"LLM sentence: '{sentence}'")
+                        sentences.append(sentence)
+                        yield sentence
 
             # Yield any remaining text after the stream ends
             remainder = buffer.strip()
             if remainder:
+                sentences.append(remainder)
                 yield remainder
 
+            # Only complete replies are cached (not error fallbacks)
+            _cache_put(key, " ".join(sentences))
+
         except Exception as e:
             logger.error(f"Error in LLM stream: {e}", exc_info=True)
             # Fall back to whatever was buffered so far
@@ -5,12 +5,70 @@ Runs on the full accumulated audio BEFORE VAD processing.
 """
 import numpy as np
 import noisereduce as nr
+import scipy.fft
 import logging
+import threading
+from typing import Optional
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# STFT layout for the in-house stationary gate (same as the noisereduce call)
+_N_FFT = 512
+_WIN_LENGTH = 256
+_HOP_LENGTH = 128
+_WINDOW = np.hanning(_WIN_LENGTH).astype(np.float32)
+# Quietest fraction of frames used as the noise profile
+_NOISE_FRAME_FRACTION = 0.1
+# Gate threshold as a multiple of the noise magnitude per bin
+_GATE_THRESHOLD = 1.5
+# SNR estimate: 20 ms frames; the noise floor is a low percentile of their RMS
+_SNR_FRAME_SECONDS = 0.02
+_NOISE_FLOOR_PERCENTILE = 10
+# Frames below this RMS are digital silence (muted mic, zero padding), not
+# the room's noise floor, and are left out of the estimate
+_DIGITAL_SILENCE_RMS = 1e-5
+
+try:
+    # Optional: JIT-compiled, multi-threaded gate kernel
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+def _gate_spectrum_numpy(spec: np.ndarray, threshold: np.ndarray, prop_decrease: float) -> None:
+    """Apply the soft spectral gate to spec in place (NumPy path)"""
+    mag = np.abs(spec)
+    mask = np.clip((mag - threshold) / np.maximum(mag, 1e-10), 0.0, 1.0)
+    spec *= 1.0 - prop_decrease * (1.0 - mask)
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _gate_spectrum(spec, threshold, prop_decrease):
+        """Apply the soft spectral gate to spec in place (one pass per frame)"""
+        n_frames, n_bins = spec.shape
+        for i in prange(n_frames):
+            for k in range(n_bins):
+                mag = abs(spec[i, k])
+                mask = (mag - threshold[k]) / max(mag, 1e-10)
+                mask = min(max(mask, 0.0), 1.0)
+                spec[i, k] *= 1.0 - prop_decrease * (1.0 - mask)
+else:
+    _gate_spectrum = _gate_spectrum_numpy
+
+
+def _rms(x: np.ndarray) -> float:
+    """RMS without materializing x**2 (dot product runs as one SIMD/BLAS kernel)"""
+    if x.size == 0:
+        return 0.0
+    return float(np.sqrt(np.dot(x, x) / x.size))
+
+
+def _next_pow2(n: int) -> int:
+    return 1 << max(0, n - 1).bit_length()
+
 
 class NoiseReducer:
     """Server-side noise reduction using spectral gating"""
@@ -39,12 +97,103 @@ class NoiseReducer:
             settings, 'NOISE_REDUCE_PROP_DECREASE', 0.6
         )
         self.stationary = stationary
+        # Per-thread scratch buffers for the stationary gate
+        # (NOISE_REDUCE_STATIONARY), grown to the next power of two and
+        # reused (the pipeline runs turns on several worker threads at
+        # once). The default noisereduce path allocates its own buffers.
+        self._local = threading.local()
 
         logger.info(
             f"NoiseReducer initialized: sample_rate={self.sample_rate}Hz, "
             f"prop_decrease={self.prop_decrease}, stationary={self.stationary}"
         )
 
+    def _estimate_snr_db(self, audio: np.ndarray) -> Optional[float]:
+        """
+        Rough SNR: the audio is cut into 20 ms frames, the noise floor is a
+        low percentile of the frame RMS (the pauses around and between
+        words) and is compared with the RMS of the whole utterance.
+        Digitally silent frames are ignored so a zeroed lead-in can't pass
+        for a clean recording.
+
+        Returns:
+            SNR in dB, or None if there is too little non-silent audio
+        """
+        frame_len = int(_SNR_FRAME_SECONDS * self.sample_rate)
+        n_frames = len(audio) // frame_len
+        if n_frames < 10:
+            return None
+
+        frames = audio[:n_frames * frame_len].reshape(n_frames, frame_len)
+        frame_rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) / frame_len)
+        frame_rms = frame_rms[frame_rms > _DIGITAL_SILENCE_RMS]
+        if len(frame_rms) < 10:
+            return None
+
+        noise_rms = float(np.percentile(frame_rms, _NOISE_FLOOR_PERCENTILE))
+        signal_rms = float(np.sqrt(np.mean(frame_rms ** 2)))
+        return float(20 * np.log10(signal_rms / max(noise_rms, 1e-8)))
+
+    def _workspace(self, size: int):
+        """Get this thread's (padded, out, norm) buffers, each of length size"""
+        buf = getattr(self._local, "buf", None)
+        if buf is None or buf.shape[1] < size:
+            buf = np.empty((3, _next_pow2(size)), dtype=np.float32)
+            self._local.buf = buf
+        return buf[0, :size], buf[1, :size], buf[2, :size]
+
+    def _reduce_stationary(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Stationary spectral gate: batch rfft over all frames, a per-bin noise
+        profile from the quietest frames, a soft mask, then irfft and
+        overlap-add.
+
+        Args:
+            audio: Audio data as float32 numpy array
+
+        Returns:
+            Noise-reduced audio of the same length — a view into this
+            thread's scratch buffer, overwritten by the next call
+        """
+        n = len(audio)
+
+        # Pad so every sample is covered by two frames
+        padded, out, norm = self._workspace(n + 2 * _WIN_LENGTH + _HOP_LENGTH)
+        padded[:_WIN_LENGTH] = 0.0
+        padded[_WIN_LENGTH:_WIN_LENGTH + n] = audio
+        padded[_WIN_LENGTH + n:] = 0.0
+        frames = np.lib.stride_tricks.sliding_window_view(padded, _WIN_LENGTH)[::_HOP_LENGTH]
+        n_frames = frames.shape[0]
+
+        spec = scipy.fft.rfft(frames * _WINDOW, n=_N_FFT, axis=-1, workers=-1)
+        mag = np.abs(spec)
+
+        # Noise profile: mean magnitude of the lowest-energy frames
+        n_noise = max(1, int(n_frames * _NOISE_FRAME_FRACTION))
+        quietest = np.argpartition(mag.sum(axis=1), n_noise - 1)[:n_noise]
+        threshold = _GATE_THRESHOLD * mag[quietest].mean(axis=0)
+
+        # Soft mask, scaled by prop_decrease (0 = leave audio alone)
+        _gate_spectrum(spec, threshold, float(self.prop_decrease))
+
+        out_frames = scipy.fft.irfft(spec, n=_N_FFT, axis=-1, workers=-1)
+        out_frames = out_frames[:, :_WIN_LENGTH] * _WINDOW
+
+        # Weighted overlap-add
+        idx = (np.arange(n_frames) * _HOP_LENGTH)[:, None] + np.arange(_WIN_LENGTH)
+        out.fill(0.0)
+        norm.fill(0.0)
+        np.add.at(out, idx, out_frames)
+        np.add.at(norm, idx, np.broadcast_to(_WINDOW ** 2, out_frames.shape))
+
+        out = out[_WIN_LENGTH:_WIN_LENGTH + n]
+        norm = norm[_WIN_LENGTH:_WIN_LENGTH + n]
+        # Normalize and clip in the same buffer — the result goes straight to
+        # VAD/STT without another full-length pass
+        np.divide(out, np.maximum(norm, 1e-8), out=out)
+        np.clip(out, -1.0, 1.0, out=out)
+        return out
+
     def process(self, audio: np.ndarray) -> np.ndarray:
         """
         Reduce noise in audio.
@@ -57,7 +206,9 @@ class NoiseReducer:
             audio: Audio data as float32 numpy array, range [-1.0, 1.0]
 
         Returns:
-            Noise-reduced audio as float32 numpy array
+            Noise-reduced audio as float32 numpy array.  In stationary mode
+            this is a view into a reused buffer: consume it (VAD/STT) before
+            the next call on the same thread, or copy it to keep it.
         """
         if len(audio) == 0:
             return audio
@@ -67,23 +218,33 @@ class NoiseReducer:
 
         try:
             # Calculate input RMS for logging
-            input_rms = np.sqrt(np.mean(audio ** 2))
-
-            reduced = nr.reduce_noise(
-                y=audio,
-                sr=self.sample_rate,
-                stationary=self.stationary,
-                prop_decrease=self.prop_decrease,
-                n_fft=512,
-                win_length=256,
-                hop_length=128,
-            )
+            input_rms = _rms(audio)
+
+            snr_db = self._estimate_snr_db(audio)
+            if snr_db is not None and snr_db > settings.NOISE_REDUCE_SNR_SKIP_DB:
+                logger.info(f"Clean audio (SNR {snr_db:.1f} dB), skipping noise reduction")
+                return audio
 
-            # Ensure output stays in valid range
-            reduced = np.clip(reduced, -1.0, 1.0).astype(np.float32)
+            if self.stationary:
+                # Already float32 and clipped by the overlap-add pass
+                reduced = self._reduce_stationary(audio)
+            else:
+                reduced = nr.reduce_noise(
+                    y=audio,
+                    sr=self.sample_rate,
+                    stationary=False,
+                    prop_decrease=self.prop_decrease,
+                    n_fft=_N_FFT,
+                    win_length=_WIN_LENGTH,
+                    hop_length=_HOP_LENGTH,
+                )
+                # Ensure output stays in valid range (noisereduce returns a
+                # fresh array, so clip it in place)
+                reduced = np.asarray(reduced, dtype=np.float32)
+                np.clip(reduced, -1.0, 1.0, out=reduced)
 
             # Calculate output RMS for logging
-            output_rms = np.sqrt(np.mean(reduced ** 2))
+            output_rms = _rms(reduced)
             reduction_db = 0.0
             if input_rms > 0 and output_rms > 0:
                 reduction_db = 20 * np.log10(output_rms / input_rms)
@@ -3,12 +3,15 @@ Response Shaper Processor
 Enforces kid-mode constraints on responses
 """
 import logging
+import threading
+from collections import OrderedDict
+from typing import Optional
 
 from app.config import settings
 from app.utils.safety_filter import (
+    analyze_text,
     contains_unsafe_content,
     get_safe_fallback,
-    count_sentences,
     count_words,
     truncate_to_sentences,
     truncate_to_words
@@ -16,6 +19,9 @@ from app.utils.safety_filter import (
 
 logger = logging.getLogger(__name__)
 
+# Recently shaped replies (identical LLM/pool outputs are common)
+_SHAPE_CACHE_SIZE = 128
+
 
 class ResponseShaperProcessor:
     """Shapes responses to be kid-friendly and concise"""
@@ -34,6 +40,10 @@ class ResponseShaperProcessor:
         """
         self.max_sentences = max_sentences or settings.MAX_RESPONSE_SENTENCES
         self.max_words = max_words or settings.MAX_RESPONSE_WORDS
+        # The shaper is shared by pipeline worker threads: the lock keeps the
+        # LRU bookkeeping (get / move_to_end / popitem) atomic
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
         logger.info(
             f"Response shaper initialized: "
@@ -52,14 +62,39 @@ class ResponseShaperProcessor:
         """
         logger.info(f"Shaping response: '{text}'")
 
-        # Check for unsafe content first
-        if contains_unsafe_content(text):
-            logger.warning("Unsafe content detected, using fallback")
+        with self._cache_lock:
+            cached = self._cache.get(text)
+            if cached is not None:
+                self._cache.move_to_end(text)
+        if cached is not None:
+            logger.info(f"Shaped response (cached): '{cached}'")
+            return cached
+
+        shaped = self._shape(text)
+        if shaped is None:
+            # Unsafe text is never cached: the fallback is picked at random
+            # per reply
             return get_safe_fallback()
 
-        # Count sentences and words
-        num_sentences = count_sentences(text)
-        num_words = count_words(text)
+        with self._cache_lock:
+            self._cache[text] = shaped
+            self._cache.move_to_end(text)
+            if len(self._cache) > _SHAPE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return shaped
+
+    def _shape(self, text: str) -> Optional[str]:
+        """
+        Shape a response that is not in the cache
+
+        Returns:
+            Shaped text, or None if the text (or its truncation) is unsafe
+        """
+        # One pass for the safety check and both counts
+        num_sentences, num_words, unsafe = analyze_text(text)
+        if unsafe:
+            logger.warning("Unsafe content detected, using fallback")
+            return None
 
         logger.debug(
             f"Original: {num_sentences} sentences, {num_words} words"
@@ -72,17 +107,18 @@ class ResponseShaperProcessor:
         if num_sentences > self.max_sentences:
             shaped_text = truncate_to_sentences(shaped_text, self.max_sentences)
             logger.info(f"Truncated to {self.max_sentences} sentences")
+            num_words = count_words(shaped_text)
 
         # Then truncate to max words (respecting sentence boundaries)
-        num_words_after = count_words(shaped_text)
-        if num_words_after > self.max_words:
+        if num_words > self.max_words:
             shaped_text = truncate_to_words(shaped_text, self.max_words)
             logger.info(f"Truncated to ~{self.max_words} words")
 
-        # Final check for unsafe content (in case truncation revealed something)
-        if contains_unsafe_content(shaped_text):
+        # Re-joining words can bring keywords together, so check truncated
+        # text again (untouched text was already checked above)
+        if shaped_text != text and contains_unsafe_content(shaped_text):
             logger.warning("Unsafe content in shaped response, using fallback")
-            return get_safe_fallback()
+            return None
 
         logger.info(f"Shaped response: '{shaped_text}'")
 
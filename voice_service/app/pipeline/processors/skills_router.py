@@ -6,8 +6,7 @@ import logging
 from typing import Optional, Tuple
 
 from app.utils.text_math import (
-    is_math_query,
-    parse_math_expression,
+    match_math,
     compute_math,
     format_math_response
 )
@@ -36,34 +35,25 @@ class SkillsRouterProcessor:
         """
         logger.info(f"Routing transcript: '{transcript}'")
 
-        # Check if math query
-        if is_math_query(transcript):
-            logger.info("Math query detected")
+        # Detect and parse in one pass
+        parsed = match_math(transcript)
 
-            # Try to parse and compute
-            parsed = parse_math_expression(transcript)
+        if parsed:
+            operator, a, b = parsed
+            logger.info(f"Math expression: {a} {operator} {b}")
 
-            if parsed:
-                operator, a, b = parsed
-                logger.info(f"Math expression: {a} {operator} {b}")
+            # Compute result
+            result, error = compute_math(operator, a, b)
 
-                # Compute result
-                result, error = compute_math(operator, a, b)
+            if error:
+                # Error in computation (e.g., divide by zero)
+                logger.warning(f"Math error: {error}")
+                return ("math", error)
 
-                if error:
-                    # Error in computation (e.g., divide by zero)
-                    logger.warning(f"Math error: {error}")
-                    return ("math", error)
-
-                # Format response
-                response = format_math_response(operator, a, b, result)
-                logger.info(f"Math response: '{response}'")
-                return ("math", response)
-
-            else:
-                # Looks like math but couldn't parse
-                logger.warning("Math query detected but could not parse expression")
-                # Fall through to LLM
+            # Format response
+            response = format_math_response(operator, a, b, result)
+            logger.info(f"Math response: '{response}'")
+            return ("math", response)
 
         # Route to LLM
         logger.info("Routing to LLM")
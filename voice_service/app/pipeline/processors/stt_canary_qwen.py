@@ -1,9 +1,14 @@
 """
 Speech-to-Text (STT) Processor using NVIDIA Canary-Qwen-2.5B (NeMo).
 """
+import contextlib
 import logging
+import os
+import queue
 import tempfile
-from typing import Optional
+import threading
+from concurrent.futures import Future
+from typing import List, Optional
 
 import numpy as np
 import soundfile as sf
@@ -15,6 +20,9 @@ logger = logging.getLogger(__name__)
 
 _canary_model = None
 
+# RAM-backed directory for the file-path fallback (Linux); None = system default
+_TMPFS_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
 
 def _get_device():
     device = settings.CANARY_QWEN_DEVICE
@@ -23,6 +31,27 @@ def _get_device():
     return device
 
 
+def _get_dtype(device: str) -> torch.dtype:
+    name = settings.CANARY_QWEN_DTYPE.lower()
+    if name == "auto":
+        if device.startswith("cuda"):
+            return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        return torch.float32
+    return getattr(torch, name)
+
+
+def _attention_context(model):
+    """Prefer the fused SDPA kernels (FlashAttention / mem-efficient) on GPU"""
+    if next(model.parameters()).is_cuda:
+        from torch.nn.attention import SDPBackend, sdpa_kernel
+        return sdpa_kernel([
+            SDPBackend.FLASH_ATTENTION,
+            SDPBackend.EFFICIENT_ATTENTION,
+            SDPBackend.MATH,
+        ])
+    return contextlib.nullcontext()
+
+
 def _get_canary_model():
     global _canary_model
     if _canary_model is None:
@@ -36,10 +65,14 @@ def _get_canary_model():
             ) from e
 
         device = _get_device()
+        dtype = _get_dtype(device)
         _canary_model = SALM.from_pretrained(settings.CANARY_QWEN_MODEL_ID)
-        _canary_model.to(device)
+        _canary_model.to(device=device, dtype=dtype)
         _canary_model.eval()
-        logger.info(f"Canary-Qwen model loaded on {device}")
+        if settings.CANARY_QWEN_COMPILE:
+            # In-place compile keeps the SALM type (generate, tokenizer, ...)
+            _canary_model.compile(mode="reduce-overhead", fullgraph=False)
+        logger.info(f"Canary-Qwen model loaded on {device} ({dtype})")
     return _canary_model
 
 
@@ -51,14 +84,67 @@ class CanaryQwenSTTProcessor:
     def __init__(self):
         self.model = _get_canary_model()
 
-    def _build_prompt(self, model, audio_path: str) -> list:
+    def _build_prompt(self, model, audio_path: Optional[str] = None) -> list:
         """
-        Build the NeMo Canary prompt with audio locator tag.
+        Build the NeMo Canary prompt (one conversation) with audio locator tag.
+
+        Without audio_path the audio is supplied separately as a tensor.
         """
         prompt_text = settings.CANARY_QWEN_PROMPT or "Transcribe the following:"
         if model.audio_locator_tag not in prompt_text:
             prompt_text = f"{prompt_text} {model.audio_locator_tag}"
-        return [[{"role": "user", "content": prompt_text, "audio": [audio_path]}]]
+        turn = {"role": "user", "content": prompt_text}
+        if audio_path is not None:
+            turn["audio"] = [audio_path]
+        return [turn]
+
+    def _generate(self, model, **kwargs):
+        with torch.inference_mode(), _attention_context(model):
+            return model.generate(
+                max_new_tokens=settings.CANARY_QWEN_MAX_TOKENS,
+                temperature=settings.CANARY_QWEN_TEMPERATURE,
+                top_p=settings.CANARY_QWEN_TOP_P,
+                **kwargs,
+            )
+
+    def _generate_batch(self, model, audios: List[np.ndarray], sample_rate: int):
+        """
+        Run one generate call over several in-memory waveforms.
+
+        Waveforms are zero-padded into a single batch tensor with their true
+        lengths in audio_lens.  Falls back to WAV files in tmpfs for NeMo
+        builds whose generate() only accepts audio file paths.
+        """
+        device = next(model.parameters()).device
+        lens = [len(a) for a in audios]
+        batch = np.zeros((len(audios), max(lens)), dtype=np.float32)
+        for i, a in enumerate(audios):
+            batch[i, :len(a)] = a
+        try:
+            return self._generate(
+                model,
+                prompts=[self._build_prompt(model) for _ in audios],
+                audios=torch.from_numpy(batch).to(device),
+                audio_lens=torch.tensor(lens, device=device),
+            )
+        except TypeError:
+            logger.debug("generate() has no tensor audio input, using tmpfs WAVs")
+
+        temp_paths = []
+        try:
+            for a in audios:
+                with tempfile.NamedTemporaryFile(suffix=".wav", dir=_TMPFS_DIR, delete=False) as temp_file:
+                    temp_paths.append(temp_file.name)
+                    sf.write(temp_file, a, sample_rate, format="WAV", subtype="PCM_16")
+            return self._generate(
+                model, prompts=[self._build_prompt(model, path) for path in temp_paths]
+            )
+        finally:
+            for path in temp_paths:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
 
     def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> Optional[str]:
         """
@@ -70,44 +156,101 @@ class CanaryQwenSTTProcessor:
 
             logger.info(f"Transcribing audio with Canary-Qwen: {len(audio)} samples, {len(audio)/sample_rate:.2f}s")
 
-            # Write audio to temp WAV (Canary expects file path)
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_path = temp_file.name
-                sf.write(temp_path, audio, sample_rate, subtype="PCM_16")
+            text = _get_batcher(self).submit(audio, sample_rate).result()
 
-            try:
-                model = self.model
-                prompt = self._build_prompt(model, temp_path)
-                with torch.no_grad():
-                    outputs = model.generate(
-                        prompts=prompt,
-                        max_new_tokens=settings.CANARY_QWEN_MAX_TOKENS,
-                        temperature=settings.CANARY_QWEN_TEMPERATURE,
-                        top_p=settings.CANARY_QWEN_TOP_P,
-                    )
-                # Canary returns token ids; decode with tokenizer
-                if isinstance(outputs, list) and outputs:
-                    token_ids = outputs[0]
-                    text = model.tokenizer.ids_to_text(token_ids.cpu()).strip()
-                else:
-                    text = ""
-
-                if text:
-                    logger.info(f"Transcription complete: '{text}'")
-                    return text
-                logger.warning("Transcription returned empty text")
-                return None
-            finally:
-                try:
-                    import os
-                    os.unlink(temp_path)
-                except Exception:
-                    pass
+            if text:
+                logger.info(f"Transcription complete: '{text}'")
+                return text
+            logger.warning("Transcription returned empty text")
+            return None
 
         except Exception as e:
             logger.error(f"Error during Canary-Qwen transcription: {e}", exc_info=True)
             return None
 
 
+class _CanaryBatcher:
+    """
+    Coalesces concurrent transcribe calls into batched generate calls.
+
+    Callers (pipeline worker threads) enqueue audio and block on a Future; a
+    single worker thread waits up to CANARY_QWEN_BATCH_WINDOW_MS for more
+    requests, runs one generate over the batch and fans the texts out.
+    """
+
+    def __init__(self, processor: CanaryQwenSTTProcessor):
+        self.processor = processor
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="canary-batcher", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, audio: np.ndarray, sample_rate: int) -> Future:
+        future: Future = Future()
+        self._queue.put((audio, sample_rate, future))
+        return future
+
+    def _run(self):
+        window = settings.CANARY_QWEN_BATCH_WINDOW_MS / 1000.0
+        while True:
+            items = [self._queue.get()]
+            sample_rate = items[0][1]
+            while len(items) < settings.CANARY_QWEN_MAX_BATCH:
+                try:
+                    item = self._queue.get(timeout=window)
+                except queue.Empty:
+                    break
+                if item[1] != sample_rate:
+                    # Different rate can't share the batch — requeue it
+                    self._queue.put(item)
+                    break
+                items.append(item)
+
+            try:
+                texts = self._transcribe_batch([a for a, _, _ in items], sample_rate)
+                for (_, _, future), text in zip(items, texts):
+                    future.set_result(text)
+            except Exception as e:
+                for _, _, future in items:
+                    future.set_exception(e)
+
+    def _transcribe_batch(self, audios: List[np.ndarray], sample_rate: int) -> List[str]:
+        model = self.processor.model
+        if len(audios) > 1:
+            logger.info(f"Canary-Qwen batch of {len(audios)} utterances")
+
+        # Waveforms arrive as fp32; autocast lines them up with half weights
+        param = next(model.parameters())
+        autocast = (
+            torch.autocast("cuda", dtype=param.dtype)
+            if param.is_cuda and param.dtype in (torch.bfloat16, torch.float16)
+            else contextlib.nullcontext()
+        )
+        with autocast:
+            outputs = self.processor._generate_batch(model, audios, sample_rate)
+
+        # Canary returns token ids per prompt; decode with tokenizer
+        texts = []
+        for i in range(len(audios)):
+            if outputs is not None and len(outputs) > i:
+                texts.append(model.tokenizer.ids_to_text(outputs[i].cpu()).strip())
+            else:
+                texts.append("")
+        return texts
+
+
+_batcher: Optional[_CanaryBatcher] = None
+_batcher_lock = threading.Lock()
+
+
+def _get_batcher(processor: CanaryQwenSTTProcessor) -> _CanaryBatcher:
+    global _batcher
+    with _batcher_lock:
+        if _batcher is None:
+            _batcher = _CanaryBatcher(processor)
+        return _batcher
+
+
 # Alias for backward compatibility
 STTProcessor = CanaryQwenSTTProcessor
@@ -3,16 +3,37 @@ Speech-to-Text (STT) Processor using ElevenLabs Scribe API
 High-accuracy cloud-based speech recognition
 """
 import logging
-import tempfile
+import time
 import numpy as np
 import soundfile as sf
 from typing import Optional
 from io import BytesIO
 
 from app.config import settings
+from app.utils.http_clients import get_async_http_client, get_http_client
+from app.utils.retry import async_retry_call, retry_call
 
 logger = logging.getLogger(__name__)
 
+# ElevenLabs uses 3-letter language codes like "eng", "spa", etc.
+# Map common 2-letter codes to 3-letter codes
+_LANG_MAP = {
+    "en": "eng",
+    "es": "spa",
+    "fr": "fra",
+    "de": "deu",
+    "it": "ita",
+    "pt": "por",
+    "pl": "pol",
+    "nl": "nld",
+    "ja": "jpn",
+    "zh": "cmn",
+    "ko": "kor",
+    "ar": "ara",
+    "hi": "hin",
+    "ru": "rus",
+    "tr": "tur",
+}
 
 class ElevenLabsSTTProcessor:
     """
@@ -41,13 +62,63 @@ class ElevenLabsSTTProcessor:
                 "Get your API key from: https://elevenlabs.io"
             )
 
-        # Initialize ElevenLabs client
-        self.client = ElevenLabs(api_key=api_key)
+        # Initialize ElevenLabs client on the shared connection pool
+        self.api_key = api_key
+        self.client = ElevenLabs(api_key=api_key, httpx_client=get_http_client())
+        self._async_client = None
         self.model = settings.ELEVENLABS_STT_MODEL
         self.language = settings.STT_LANGUAGE
+        self.language_code = _LANG_MAP.get(self.language) if self.language else None
 
         logger.info(f"ElevenLabs STT processor initialized: model={self.model}, language={self.language}")
 
+    def _convert_kwargs(self, audio: np.ndarray, sample_rate: int) -> dict:
+        """Build the speech_to_text.convert arguments for one utterance"""
+        # Encode the WAV in memory for upload (no temp file round-trip)
+        audio_data = BytesIO()
+        sf.write(audio_data, audio, sample_rate, format='WAV', subtype='PCM_16')
+        audio_data.seek(0)
+
+        return dict(
+            file=audio_data,
+            model_id=self.model,
+            language_code=self.language_code,  # None will auto-detect
+            tag_audio_events=False,  # Don't need laughter/applause tags for kid game
+            diarize=False,  # Don't need speaker identification
+        )
+
+    def _extract_text(self, transcription, start_time: float) -> Optional[str]:
+        """Pull the transcript text out of a Scribe response"""
+        processing_time = time.time() - start_time
+
+        # The response has a 'text' attribute
+        text = transcription.text.strip() if hasattr(transcription, 'text') else str(transcription).strip()
+
+        if text:
+            logger.info(
+                f"Transcription complete: '{text}' "
+                f"({processing_time:.2f}s)"
+            )
+            return text
+        else:
+            logger.warning("Transcription returned empty text")
+            return None
+
+    def _log_error(self, e: Exception):
+        logger.error(f"Error during transcription: {e}", exc_info=True)
+
+        # Check for common errors
+        if "invalid_api_key" in str(e).lower():
+            logger.error(
+                "Invalid API key. Please check your ELEVENLABS_API_KEY. "
+                "Get your API key from: https://elevenlabs.io"
+            )
+        elif "quota" in str(e).lower() or "limit" in str(e).lower():
+            logger.error(
+                "ElevenLabs quota exceeded. "
+                "You may need to add credits or upgrade your plan."
+            )
+
     def transcribe(
         self,
         audio: np.ndarray,
@@ -63,95 +134,60 @@ class ElevenLabsSTTProcessor:
         Returns:
             Transcribed text (or None if failed)
         """
-        import time
         start_time = time.time()
 
         try:
             logger.info(f"Transcribing audio: {len(audio)} samples, {len(audio)/sample_rate:.2f}s")
 
-            # Create temporary WAV file for upload
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-                temp_path = temp_file.name
-
-                # Write audio to WAV file
-                sf.write(temp_path, audio, sample_rate, subtype='PCM_16')
-
-                # Read the file into BytesIO for API upload
-                with open(temp_path, 'rb') as audio_file:
-                    audio_data = BytesIO(audio_file.read())
-
-            # Clean up temp file
-            import os
-            try:
-                os.unlink(temp_path)
-            except:
-                pass
-
-            # Convert language code format
-            # ElevenLabs uses 3-letter codes like "eng", "spa", etc.
-            language_code = None
-            if self.language:
-                # Map common 2-letter codes to 3-letter codes
-                lang_map = {
-                    "en": "eng",
-                    "es": "spa",
-                    "fr": "fra",
-                    "de": "deu",
-                    "it": "ita",
-                    "pt": "por",
-                    "pl": "pol",
-                    "nl": "nld",
-                    "ja": "jpn",
-                    "zh": "cmn",
-                    "ko": "kor",
-                    "ar": "ara",
-                    "hi": "hin",
-                    "ru": "rus",
-                    "tr": "tur",
-                }
-                language_code = lang_map.get(self.language, None)
-
-            # Call ElevenLabs Scribe API
-            transcription = self.client.speech_to_text.convert(
-                file=audio_data,
-                model_id=self.model,
-                language_code=language_code,  # None will auto-detect
-                tag_audio_events=False,  # Don't need laughter/applause tags for kid game
-                diarize=False,  # Don't need speaker identification
+            # Call ElevenLabs Scribe API (the upload buffer is rebuilt per attempt)
+            transcription = retry_call(
+                lambda: self.client.speech_to_text.convert(
+                    **self._convert_kwargs(audio, sample_rate)
+                )
             )
+            return self._extract_text(transcription, start_time)
+
+        except Exception as e:
+            self._log_error(e)
+            return None
+
+    async def transcribe_async(
+        self,
+        audio: np.ndarray,
+        sample_rate: int = 16000
+    ) -> Optional[str]:
+        """
+        Transcribe audio without blocking the event loop
 
-            processing_time = time.time() - start_time
+        Uses the async SDK client on a shared httpx.AsyncClient pool.
 
-            # Extract text from response
-            # The response has a 'text' attribute
-            text = transcription.text.strip() if hasattr(transcription, 'text') else str(transcription).strip()
+        Args:
+            audio: Audio data as numpy array
+            sample_rate: Sample rate in Hz
 
-            if text:
-                logger.info(
-                    f"Transcription complete: '{text}' "
-                    f"({processing_time:.2f}s)"
-                )
-                return text
-            else:
-                logger.warning("Transcription returned empty text")
-                return None
+        Returns:
+            Transcribed text (or None if failed)
+        """
+        start_time = time.time()
 
-        except Exception as e:
-            processing_time = time.time() - start_time
-            logger.error(f"Error during transcription: {e}", exc_info=True)
-
-            # Check for common errors
-            if "invalid_api_key" in str(e).lower():
-                logger.error(
-                    "Invalid API key. Please check your ELEVENLABS_API_KEY. "
-                    "Get your API key from: https://elevenlabs.io"
+        try:
+            if self._async_client is None:
+                from elevenlabs.client import AsyncElevenLabs
+                self._async_client = AsyncElevenLabs(
+                    api_key=self.api_key, httpx_client=get_async_http_client()
                 )
-            elif "quota" in str(e).lower() or "limit" in str(e).lower():
-                logger.error(
-                    "ElevenLabs quota exceeded. "
-                    "You may need to add credits or upgrade your plan."
+
+            logger.info(f"Transcribing audio (async): {len(audio)} samples, {len(audio)/sample_rate:.2f}s")
+
+            transcription = await async_retry_call(
+                lambda: self._async_client.speech_to_text.convert(
+                    **self._convert_kwargs(audio, sample_rate)
                 )
+            )
+            return self._extract_text(transcription, start_time)
 
+        except Exception as e:
+            self._log_error(e)
             return None
 
 
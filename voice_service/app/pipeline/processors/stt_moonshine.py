@@ -95,19 +95,23 @@ class MoonshineSTTProcessor:
             )
 
             # transcribe_without_streaming accepts List[float] and sample_rate
-            audio_list = audio.astype(np.float32).tolist()
+            # (the public API; its internal C call has no declared argtypes)
+            audio_list = audio.astype(np.float32, copy=False).tolist()
             transcript = self.transcriber.transcribe_without_streaming(
                 audio_list, sample_rate
             )
 
             # Transcript has .lines, each with .text
-            if not transcript or not transcript.lines:
+            if transcript is None or not transcript.lines:
                 logger.warning("Transcription returned no lines")
                 return None
 
-            text = " ".join(
-                line.text for line in transcript.lines if line.text
-            ).strip()
+            # Most utterances come back as a single line — skip the join
+            texts = [line.text for line in transcript.lines if line.text]
+            if len(texts) == 1:
+                text = texts[0].strip()
+            else:
+                text = " ".join(texts).strip()
 
             if text:
                 logger.info(f"Transcription complete: '{text}'")
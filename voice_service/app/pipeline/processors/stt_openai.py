@@ -2,13 +2,18 @@
 Speech-to-Text (STT) Processor using OpenAI Whisper API
 High-accuracy cloud-based speech recognition
 """
+import asyncio
 import logging
-import tempfile
+import time
 import numpy as np
 import soundfile as sf
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+from io import BytesIO
 
 from app.config import settings
+from app.utils.async_loop import run_coroutine
+from app.utils.http_clients import get_async_http_client, get_http_client
+from app.utils.retry import async_retry_call, retry_call
 
 logger = logging.getLogger(__name__)
 
@@ -40,13 +45,63 @@ class OpenAIWhisperProcessor:
                 "Get your API key from: https://platform.openai.com/api-keys"
             )
 
-        # Initialize OpenAI client
-        self.client = OpenAI(api_key=api_key)
+        # Initialize OpenAI client on the shared connection pool
+        # (async clients are created on first use, one per event loop:
+        # transcribe_batch runs on the background loop, turns on the
+        # service loop, and an httpx pool can't cross loops)
+        self.api_key = api_key
+        # Retries are handled by retry_call (the SDK's own are turned off)
+        self.client = OpenAI(api_key=api_key, http_client=get_http_client(), max_retries=0)
+        self._aclients: Dict[asyncio.AbstractEventLoop, object] = {}
         self.model = settings.OPENAI_WHISPER_MODEL
         self.language = settings.STT_LANGUAGE
 
         logger.info(f"OpenAI Whisper processor initialized: model={self.model}, language={self.language}")
 
+    def _create_kwargs(self, audio: np.ndarray, sample_rate: int) -> dict:
+        """Build the transcriptions.create arguments for one utterance"""
+        # Encode the WAV in memory for upload (no temp file round-trip)
+        audio_data = BytesIO()
+        sf.write(audio_data, audio, sample_rate, format='WAV', subtype='PCM_16')
+
+        return dict(
+            model=self.model,
+            file=("audio.wav", audio_data.getvalue(), "audio/wav"),
+            language=self.language,
+        )
+
+    def _extract_text(self, transcript, start_time: float) -> Optional[str]:
+        """Pull the transcript text out of an API response"""
+        processing_time = time.time() - start_time
+
+        # Extract text from response
+        text = transcript.text.strip()
+
+        if text:
+            logger.info(
+                f"Transcription complete: '{text}' "
+                f"({processing_time:.2f}s)"
+            )
+            return text
+        else:
+            logger.warning("Transcription returned empty text")
+            return None
+
+    def _log_error(self, e: Exception):
+        logger.error(f"Error during transcription: {e}", exc_info=True)
+
+        # Check for common errors
+        if "invalid_api_key" in str(e).lower():
+            logger.error(
+                "Invalid API key. Please check your OPENAI_API_KEY. "
+                "Get your API key from: https://platform.openai.com/api-keys"
+            )
+        elif "quota" in str(e).lower():
+            logger.error(
+                "OpenAI quota exceeded. "
+                "You may need to add credits or upgrade your plan."
+            )
+
     def transcribe(
         self,
         audio: np.ndarray,
@@ -62,67 +117,106 @@ class OpenAIWhisperProcessor:
         Returns:
             Transcribed text (or None if failed)
         """
-        import time
         start_time = time.time()
 
         try:
             logger.info(f"Transcribing audio: {len(audio)} samples, {len(audio)/sample_rate:.2f}s")
 
-            # Create temporary WAV file for upload
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-                temp_path = temp_file.name
-
-                # Write audio to WAV file
-                sf.write(temp_path, audio, sample_rate, subtype='PCM_16')
-
-                # Open file and send to OpenAI Whisper API
-                with open(temp_path, 'rb') as audio_file:
-                    transcript = self.client.audio.transcriptions.create(
-                        model=self.model,
-                        file=audio_file,
-                        language=self.language
-                    )
-
-            # Clean up temp file
-            import os
-            try:
-                os.unlink(temp_path)
-            except:
-                pass
-
-            processing_time = time.time() - start_time
-
-            # Extract text from response
-            text = transcript.text.strip()
-
-            if text:
-                logger.info(
-                    f"Transcription complete: '{text}' "
-                    f"({processing_time:.2f}s)"
-                )
-                return text
-            else:
-                logger.warning("Transcription returned empty text")
-                return None
+            transcript = retry_call(
+                self.client.audio.transcriptions.create,
+                **self._create_kwargs(audio, sample_rate)
+            )
+            return self._extract_text(transcript, start_time)
 
         except Exception as e:
-            processing_time = time.time() - start_time
-            logger.error(f"Error during transcription: {e}", exc_info=True)
-
-            # Check for common errors
-            if "invalid_api_key" in str(e).lower():
-                logger.error(
-                    "Invalid API key. Please check your OPENAI_API_KEY. "
-                    "Get your API key from: https://platform.openai.com/api-keys"
-                )
-            elif "quota" in str(e).lower():
-                logger.error(
-                    "OpenAI quota exceeded. "
-                    "You may need to add credits or upgrade your plan."
+            self._log_error(e)
+            return None
+
+    async def transcribe_async(
+        self,
+        audio: np.ndarray,
+        sample_rate: int = 16000
+    ) -> Optional[str]:
+        """
+        Transcribe audio without blocking the event loop (AsyncOpenAI)
+
+        Args:
+            audio: Audio data as numpy array
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            Transcribed text (or None if failed)
+        """
+        start_time = time.time()
+
+        try:
+            loop = asyncio.get_running_loop()
+            aclient = self._aclients.get(loop)
+            if aclient is None:
+                from openai import AsyncOpenAI
+                aclient = AsyncOpenAI(
+                    api_key=self.api_key, http_client=get_async_http_client(), max_retries=0
                 )
+                self._aclients[loop] = aclient
 
+            logger.info(f"Transcribing audio (async): {len(audio)} samples, {len(audio)/sample_rate:.2f}s")
+
+            transcript = await async_retry_call(
+                aclient.audio.transcriptions.create,
+                **self._create_kwargs(audio, sample_rate)
+            )
+            return self._extract_text(transcript, start_time)
+
+        except Exception as e:
+            self._log_error(e)
             return None
 
+    async def transcribe_many(
+        self,
+        items: List[Tuple[np.ndarray, int]]
+    ) -> List[Optional[str]]:
+        """
+        Transcribe a batch of utterances with concurrent uploads
+
+        At most OPENAI_STT_CONCURRENCY requests are in flight at once, so a
+        large batch overlaps round trips without tripping the rate limit.
+
+        Args:
+            items: List of (audio, sample_rate) pairs
+
+        Returns:
+            Transcripts in the same order as items (None where one failed)
+        """
+        sem = asyncio.Semaphore(settings.OPENAI_STT_CONCURRENCY)
+
+        async def bounded(audio: np.ndarray, sample_rate: int) -> Optional[str]:
+            async with sem:
+                return await self.transcribe_async(audio, sample_rate)
+
+        return await asyncio.gather(*(bounded(audio, sr) for audio, sr in items))
+
+    def transcribe_batch(
+        self,
+        clips: List[np.ndarray],
+        sample_rate: int = 16000
+    ) -> List[Optional[str]]:
+        """
+        Transcribe a list of clips for offline use (session review, evaluation)
+
+        Blocking entry point for sync callers; the uploads run concurrently
+        on the shared background loop via transcribe_many, through that
+        loop's own async client.
+
+        Args:
+            clips: Audio clips as numpy arrays
+            sample_rate: Sample rate in Hz (shared by all clips)
+
+        Returns:
+            Transcripts in the same order as clips (None where one failed)
+        """
+        logger.info(f"Transcribing batch of {len(clips)} clips")
+        return run_coroutine(self.transcribe_many([(clip, sample_rate) for clip in clips]))
+
 
 # Alias for backward compatibility
 STTProcessor = OpenAIWhisperProcessor
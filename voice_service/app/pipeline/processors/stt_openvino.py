@@ -0,0 +1,112 @@
+"""
+Speech-to-Text (STT) Processor using Distil-Whisper on OpenVINO.
+INT8 (NNCF weight-compressed) encoder-decoder for fast CPU inference on Intel hosts.
+"""
+import logging
+import time
+from typing import Optional
+
+import numpy as np
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_ov_model = None
+_ov_processor = None
+
+
+def _get_openvino_model():
+    global _ov_model, _ov_processor
+    if _ov_model is not None:
+        return _ov_model, _ov_processor
+
+    model_id = settings.OPENVINO_STT_MODEL_ID
+    logger.info(f"Loading Distil-Whisper (OpenVINO): {model_id}")
+
+    try:
+        from optimum.intel.openvino import OVModelForSpeechSeq2Seq
+        from transformers import AutoProcessor
+    except ImportError as e:
+        raise ImportError(
+            "optimum-intel is required for OpenVINO STT. "
+            "Install with: pip install optimum[openvino,nncf]"
+        ) from e
+
+    _ov_processor = AutoProcessor.from_pretrained(model_id)
+    # export=True converts the PyTorch checkpoint to OpenVINO IR on first
+    # load; load_in_8bit applies NNCF 8-bit weight compression
+    _ov_model = OVModelForSpeechSeq2Seq.from_pretrained(
+        model_id,
+        export=True,
+        load_in_8bit=settings.OPENVINO_STT_INT8,
+        device=settings.OPENVINO_STT_DEVICE,
+    )
+    logger.info(
+        f"Distil-Whisper loaded on {settings.OPENVINO_STT_DEVICE} "
+        f"(int8={settings.OPENVINO_STT_INT8})"
+    )
+    return _ov_model, _ov_processor
+
+
+class OpenVINOWhisperSTTProcessor:
+    """
+    Distil-Whisper STT processor on the OpenVINO runtime.
+    English-only; several times faster than Whisper large on CPU.
+    """
+
+    def __init__(self):
+        self.model, self.processor = _get_openvino_model()
+
+    def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> Optional[str]:
+        """
+        Transcribe audio using Distil-Whisper.
+
+        Args:
+            audio: Audio data as float32 numpy array
+            sample_rate: Sample rate in Hz (16000 expected)
+
+        Returns:
+            Transcribed text or None
+        """
+        try:
+            if len(audio) == 0:
+                return None
+
+            logger.info(
+                f"Transcribing audio with Distil-Whisper (OpenVINO): "
+                f"{len(audio)} samples, {len(audio) / sample_rate:.2f}s"
+            )
+            start_time = time.time()
+
+            if sample_rate != 16000:
+                from app.utils.audio_io import resample_audio
+                audio = resample_audio(audio, sample_rate, 16000)
+                sample_rate = 16000
+
+            # Audio goes straight to the feature extractor (no WAV round-trip)
+            features = self.processor(
+                audio, sampling_rate=sample_rate, return_tensors="pt"
+            ).input_features
+            token_ids = self.model.generate(
+                features, max_new_tokens=settings.OPENVINO_STT_MAX_TOKENS
+            )
+            text = self.processor.batch_decode(token_ids, skip_special_tokens=True)[0].strip()
+
+            if text:
+                logger.info(
+                    f"Transcription complete: '{text}' "
+                    f"({time.time() - start_time:.2f}s)"
+                )
+                return text
+
+            logger.warning("Transcription returned empty text")
+            return None
+
+        except Exception as e:
+            logger.error(f"Error during OpenVINO transcription: {e}", exc_info=True)
+            return None
+
+
+# Alias for backward compatibility
+STTProcessor = OpenVINOWhisperSTTProcessor
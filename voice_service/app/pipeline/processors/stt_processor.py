@@ -4,36 +4,61 @@ Uses faster-whisper for audio transcription
 """
 from faster_whisper import WhisperModel
 import numpy as np
+import io
 import logging
-from typing import Optional
+import os
+from typing import Callable, List, Optional, Tuple
 import time
+from functools import lru_cache
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Module-level singleton — model is loaded once and reused across requests.
-# faster-whisper models are large (244MB for small.en) and slow to load;
-# reloading on every pipeline instantiation would add multi-second latency
-# to every request.
-_whisper_model: Optional[WhisperModel] = None
+# Module-level model cache — each model is loaded once and reused across
+# requests. faster-whisper models are large (244MB for small.en) and slow to
+# load; reloading on every pipeline instantiation would add multi-second
+# latency to every request. Keyed by the load arguments, so a config change
+# (e.g. in tests) gets its own model instead of the stale one.
 
 
-def _get_whisper_model() -> WhisperModel:
-    global _whisper_model
-    if _whisper_model is not None:
-        return _whisper_model
+def _resolve_compute_type(device: str) -> str:
+    """int8 weights by default: int8 GEMMs on CPU, int8 + fp16 activations on CUDA"""
+    compute_type = settings.STT_COMPUTE_TYPE
+    if compute_type and compute_type != "auto":
+        return compute_type
+    return "int8_float16" if device == "cuda" else "int8"
+
+
+@lru_cache(maxsize=4)
+def _load_whisper(
+    model_size: str, device: str, compute_type: str, cpu_threads: int, num_workers: int
+) -> WhisperModel:
     logger.info(
-        f"Loading faster-whisper model: {settings.STT_MODEL_SIZE} "
-        f"(device={settings.STT_DEVICE}, compute={settings.STT_COMPUTE_TYPE})"
+        f"Loading faster-whisper model: {model_size} "
+        f"(device={device}, compute={compute_type}, cpu_threads={cpu_threads})"
     )
-    _whisper_model = WhisperModel(
+    model = WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=num_workers,
+    )
+    logger.info(f"faster-whisper model loaded: {model_size}")
+    return model
+
+
+def _get_whisper_model() -> WhisperModel:
+    """The faster-whisper model for the current settings (loaded on first call)"""
+    device = settings.STT_DEVICE
+    return _load_whisper(
         settings.STT_MODEL_SIZE,
-        device=settings.STT_DEVICE,
-        compute_type=settings.STT_COMPUTE_TYPE,
+        device,
+        _resolve_compute_type(device),
+        settings.STT_CPU_THREADS or max(1, (os.cpu_count() or 2) // 2),
+        settings.STT_NUM_WORKERS,
     )
-    logger.info(f"faster-whisper model loaded: {settings.STT_MODEL_SIZE}")
-    return _whisper_model
 
 
 class STTProcessor:
@@ -42,13 +67,25 @@ class STTProcessor:
     def __init__(self):
         self.model = _get_whisper_model()
 
-    def transcribe(self, audio: np.ndarray, sample_rate: int = None) -> Optional[str]:
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        sample_rate: int = None,
+        on_partial: Optional[Callable[[str], None]] = None,
+        clip_timestamps: Optional[List[float]] = None,
+    ) -> Optional[str]:
         """
         Transcribe audio to text
 
         Args:
-            audio: Audio data as float32 numpy array
+            audio: Mono float32 audio at 16 kHz (other dtypes, stereo and
+                   other rates are accepted but cost a conversion)
             sample_rate: Sample rate in Hz
+            on_partial: Optional callback, called with each segment's text as
+                        soon as the decoder yields it (before the full
+                        transcript is done)
+            clip_timestamps: Optional [start, end, start, end, ...] seconds;
+                             only these spans of audio are decoded
 
         Returns:
             Transcribed text or None if transcription failed
@@ -64,6 +101,13 @@ class STTProcessor:
         start_time = time.time()
 
         try:
+            # Normalize to contiguous mono float32 once, up front, so
+            # faster-whisper takes the buffer as is instead of copying it
+            if audio.ndim == 2:
+                audio = audio.mean(axis=1, dtype=np.float32)
+            if audio.dtype != np.float32 or not audio.flags['C_CONTIGUOUS']:
+                audio = np.ascontiguousarray(audio, dtype=np.float32)
+
             # faster-whisper expects 16kHz audio
             if sample_rate != 16000:
                 logger.warning(
@@ -83,17 +127,21 @@ class STTProcessor:
                 vad_filter=False,  # We already did VAD
                 condition_on_previous_text=False,
                 initial_prompt=settings.STT_INITIAL_PROMPT or None,
+                clip_timestamps=clip_timestamps or "0",
             )
 
-            # Collect all segments
-            transcript_parts = []
+            # Write segments as the lazy generator yields them
+            buf = io.StringIO()
             for segment in segments:
-                transcript_parts.append(segment.text)
+                buf.write(segment.text)
+                buf.write(" ")
                 logger.debug(
                     f"Segment [{segment.start:.2f}s -> {segment.end:.2f}s]: {segment.text}"
                 )
+                if on_partial is not None:
+                    on_partial(segment.text)
 
-            transcript = " ".join(transcript_parts).strip()
+            transcript = buf.getvalue().strip()
             elapsed_time = time.time() - start_time
 
             if transcript:
@@ -110,3 +158,34 @@ class STTProcessor:
         except Exception as e:
             logger.error(f"Error during transcription: {e}", exc_info=True)
             return None
+
+    def transcribe_segments(
+        self,
+        audio: np.ndarray,
+        segments: List[Tuple[int, int]],
+        sample_rate: int = None,
+        on_partial: Optional[Callable[[str], None]] = None,
+    ) -> Optional[str]:
+        """
+        Transcribe only the given speech segments of audio.
+
+        The whole buffer is handed to faster-whisper once, with the segments
+        as clip timestamps, so the VAD output is never copied into a
+        separate speech-only array.
+
+        Args:
+            audio: Mono float32 audio
+            segments: (start, end) sample indices from VAD
+            sample_rate: Sample rate in Hz
+            on_partial: Optional per-segment text callback (see transcribe)
+
+        Returns:
+            Transcribed text or None if transcription failed
+        """
+        if sample_rate is None:
+            sample_rate = settings.AUDIO_SAMPLE_RATE
+
+        clip_timestamps = [t / sample_rate for span in segments for t in span]
+        return self.transcribe(
+            audio, sample_rate, on_partial=on_partial, clip_timestamps=clip_timestamps
+        )
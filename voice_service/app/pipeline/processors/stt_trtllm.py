@@ -0,0 +1,137 @@
+"""
+Speech-to-Text (STT) Processor using Whisper on TensorRT-LLM.
+Prebuilt INT8 weight-only encoder/decoder engines for CUDA deployments.
+
+Engines are built ahead of time with trtllm-build (see the TensorRT-LLM
+whisper example, --use_weight_only --weight_only_precision int8) into
+TRTLLM_ENGINE_DIR/encoder and TRTLLM_ENGINE_DIR/decoder.
+"""
+import logging
+import time
+from typing import Optional
+
+import numpy as np
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_trt_runner = None
+_trt_processor = None
+
+
+def _get_trtllm_runner():
+    global _trt_runner, _trt_processor
+    if _trt_runner is not None:
+        return _trt_runner, _trt_processor
+
+    engine_dir = settings.TRTLLM_ENGINE_DIR
+    logger.info(f"Loading TensorRT-LLM Whisper engines from {engine_dir}")
+
+    try:
+        from tensorrt_llm.runtime import ModelRunnerCpp
+        from transformers import WhisperProcessor
+    except ImportError as e:
+        raise ImportError(
+            "tensorrt_llm is required for TensorRT-LLM Whisper STT. "
+            "Install with: pip install tensorrt_llm (CUDA only)"
+        ) from e
+
+    # Feature extractor + tokenizer matching the checkpoint the engines were built from
+    _trt_processor = WhisperProcessor.from_pretrained(settings.TRTLLM_WHISPER_MODEL_ID)
+    _trt_runner = ModelRunnerCpp.from_dir(
+        engine_dir=engine_dir,
+        is_enc_dec=True,
+        max_batch_size=1,
+        max_input_len=3000,
+        max_output_len=settings.TRTLLM_MAX_NEW_TOKENS,
+        max_beam_width=settings.STT_BEAM_SIZE,
+    )
+    logger.info("TensorRT-LLM Whisper engines loaded")
+    return _trt_runner, _trt_processor
+
+
+class TensorRTWhisperSTTProcessor:
+    """
+    Whisper STT processor on TensorRT-LLM engines (CUDA only).
+    """
+
+    def __init__(self):
+        self.runner, self.processor = _get_trtllm_runner()
+        tokenizer = self.processor.tokenizer
+        # Decoder prompt: transcribe in the configured language, no timestamps
+        self.prompt_ids = tokenizer.convert_tokens_to_ids([
+            "<|startoftranscript|>",
+            f"<|{settings.STT_LANGUAGE}|>",
+            "<|transcribe|>",
+            "<|notimestamps|>",
+        ])
+        self.eot_id = tokenizer.convert_tokens_to_ids("<|endoftext|>")
+
+    def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> Optional[str]:
+        """
+        Transcribe audio using the TensorRT-LLM Whisper engines.
+
+        Args:
+            audio: Audio data as float32 numpy array
+            sample_rate: Sample rate in Hz (16000 expected)
+
+        Returns:
+            Transcribed text or None
+        """
+        try:
+            import torch
+
+            if len(audio) == 0:
+                return None
+
+            logger.info(
+                f"Transcribing audio with TensorRT-LLM Whisper: "
+                f"{len(audio)} samples, {len(audio) / sample_rate:.2f}s"
+            )
+            start_time = time.time()
+
+            if sample_rate != 16000:
+                from app.utils.audio_io import resample_audio
+                audio = resample_audio(audio, sample_rate, 16000)
+                sample_rate = 16000
+
+            # Log-mel features: (1, n_mels, 3000) -> one (frames, n_mels) fp16 tensor
+            mel = self.processor.feature_extractor(
+                audio, sampling_rate=sample_rate, return_tensors="pt"
+            ).input_features
+            features = mel[0].transpose(0, 1).to(device="cuda", dtype=torch.float16)
+
+            outputs = self.runner.generate(
+                batch_input_ids=[torch.tensor(self.prompt_ids, dtype=torch.int32)],
+                encoder_input_features=[features],
+                encoder_output_lengths=[features.shape[0] // 2],
+                max_new_tokens=settings.TRTLLM_MAX_NEW_TOKENS,
+                end_id=self.eot_id,
+                pad_id=self.eot_id,
+                num_beams=settings.STT_BEAM_SIZE,
+                return_dict=True,
+            )
+            torch.cuda.synchronize()
+
+            # Best beam of the only batch item, minus the prompt tokens
+            token_ids = outputs["output_ids"][0][0].tolist()[len(self.prompt_ids):]
+            text = self.processor.tokenizer.decode(token_ids, skip_special_tokens=True).strip()
+
+            if text:
+                logger.info(
+                    f"Transcription complete: '{text}' "
+                    f"({time.time() - start_time:.2f}s)"
+                )
+                return text
+
+            logger.warning("Transcription returned empty text")
+            return None
+
+        except Exception as e:
+            logger.error(f"Error during TensorRT-LLM transcription: {e}", exc_info=True)
+            return None
+
+
+# Alias for backward compatibility
+STTProcessor = TensorRTWhisperSTTProcessor
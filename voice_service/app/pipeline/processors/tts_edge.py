@@ -11,9 +11,11 @@ import logging
 import os
 import subprocess
 import tempfile
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from app.config import settings
+from app.utils.async_loop import run_coroutine
+from app.utils.retry import async_retry_call
 
 logger = logging.getLogger(__name__)
 
@@ -70,8 +72,11 @@ class EdgeTTSProcessor:
                 tmp_mp3 = tmp.name
 
             try:
-                communicate = edge_tts.Communicate(text, self.voice)
-                await communicate.save(tmp_mp3)
+                # A Communicate streams once, so each attempt builds a new one
+                async def save():
+                    await edge_tts.Communicate(text, self.voice).save(tmp_mp3)
+
+                await async_retry_call(save)
 
                 # Verify MP3 was written
                 if not os.path.exists(tmp_mp3) or os.path.getsize(tmp_mp3) == 0:
@@ -117,20 +122,44 @@ class EdgeTTSProcessor:
         """
         Synchronous wrapper for synthesize_async.
 
-        Runs the async coroutine in a fresh event loop so it can be
-        called from a ThreadPoolExecutor (asyncio.to_thread).
+        Runs the coroutine on the shared background event loop so it can be
+        called from a worker thread without creating a loop per call.
         """
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(self.synthesize_async(text, output_path))
-            finally:
-                loop.close()
+            return run_coroutine(self.synthesize_async(text, output_path))
         except Exception as e:
             logger.error(f"Error in synchronous wrapper: {e}", exc_info=True)
             return False
 
+    async def synthesize_many_async(
+        self, pairs: List[Tuple[str, str]], max_concurrency: int = 8
+    ) -> List[bool]:
+        """
+        Synthesize several (text, output_path) pairs concurrently.
+
+        At most max_concurrency requests are in flight at once.
+
+        Returns:
+            Success flags in the same order as pairs
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(text: str, output_path: str) -> bool:
+            async with sem:
+                return await self.synthesize_async(text, output_path)
+
+        return await asyncio.gather(*(bounded(t, p) for t, p in pairs))
+
+    def synthesize_many(
+        self, pairs: List[Tuple[str, str]], max_concurrency: int = 8
+    ) -> List[bool]:
+        """Synchronous wrapper for synthesize_many_async"""
+        try:
+            return run_coroutine(self.synthesize_many_async(pairs, max_concurrency))
+        except Exception as e:
+            logger.error(f"Error in synchronous wrapper: {e}", exc_info=True)
+            return [False] * len(pairs)
+
     @staticmethod
     async def list_voices():
         """List all available Edge TTS voices"""
@@ -2,12 +2,16 @@
 Text-to-Speech (TTS) Processor using ElevenLabs API
 High-quality cloud-based TTS for fast, natural-sounding speech
 """
+import io
 import os
 import logging
 import asyncio
+import wave
 from typing import Optional
 
 from app.config import settings
+from app.utils.http_clients import get_http_client
+from app.utils.retry import retry_call
 
 logger = logging.getLogger(__name__)
 
@@ -49,120 +53,136 @@ class ElevenLabsTTSProcessor:
                 "Get your API key from: https://elevenlabs.io"
             )
 
-        # Initialize ElevenLabs client
-        self.client = ElevenLabs(api_key=api_key)
+        # Initialize ElevenLabs client on the shared connection pool
+        self.client = ElevenLabs(api_key=api_key, httpx_client=get_http_client())
         self.voice = voice
         self.model = settings.ELEVENLABS_MODEL
 
         logger.info("ElevenLabs TTS processor initialized successfully")
 
-    async def synthesize_async(self, text: str, output_path: str) -> bool:
+    def _stream_wav(self, text: str, dest) -> float:
         """
-        Synthesize text to audio file (async)
+        Stream synthesized PCM straight into a WAV writer
+
+        Chunks are written as they arrive from the API, so the full PCM is
+        never held in memory and the download overlaps the write.
 
         Args:
             text: Text to synthesize
-            output_path: Path to save audio file (WAV format)
+            dest: File path or writable binary file object
 
         Returns:
-            True if successful, False otherwise
+            Duration of the written audio in seconds
         """
-        logger.info(f"Synthesizing text: '{text}'")
+        logger.info("Calling ElevenLabs API...")
+
+        # Call the API (returns an iterator of audio chunks)
+        # Using PCM format for WAV output
+        audio_generator = self.client.text_to_speech.convert(
+            text=text,
+            voice_id=self.voice,
+            model_id=self.model,
+            output_format="pcm_24000"
+        )
+
+        # ElevenLabs PCM format: 24000 Hz, mono, 16-bit little-endian —
+        # chunks are whole frames, so they go to the writer as is
+        with wave.open(dest, 'wb') as wav_file:
+            wav_file.setnchannels(1)  # Mono
+            wav_file.setsampwidth(2)  # 16-bit = 2 bytes
+            wav_file.setframerate(24000)  # 24kHz
+            for chunk in audio_generator:
+                if chunk:
+                    wav_file.writeframes(chunk)
+            n_frames = wav_file.getnframes()
 
-        try:
-            # Ensure output directory exists
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        return n_frames / 24000
 
-            # Generate speech using ElevenLabs API
-            logger.info("Calling ElevenLabs API...")
+    def _log_error(self, e: Exception):
+        logger.error(f"Error during TTS synthesis: {e}", exc_info=True)
 
-            # Call the API (returns an iterator of audio chunks)
-            # Using PCM format for WAV output
-            audio_generator = self.client.text_to_speech.convert(
-                text=text,
-                voice_id=self.voice,
-                model_id=self.model,
-                output_format="pcm_24000"
+        # Check for common errors
+        if "invalid_api_key" in str(e).lower():
+            logger.error(
+                "Invalid API key. Please check your ELEVENLABS_API_KEY. "
+                "Get your API key from: https://elevenlabs.io"
+            )
+        elif "quota_exceeded" in str(e).lower():
+            logger.error(
+                "ElevenLabs quota exceeded. "
+                "You may need to upgrade your plan or wait for quota reset."
             )
 
-            # Collect all audio chunks
-            audio_chunks = []
-            for chunk in audio_generator:
-                if chunk:
-                    audio_chunks.append(chunk)
+    def synthesize_bytes(self, text: str) -> Optional[bytes]:
+        """
+        Synthesize text to an in-memory WAV (no file involved)
 
-            # Combine all chunks into a single audio file
-            audio_data = b''.join(audio_chunks)
+        Args:
+            text: Text to synthesize
 
-            # Convert raw PCM data to WAV file with proper headers
-            # ElevenLabs PCM format: 24000 Hz, mono, 16-bit
-            import wave
-            import numpy as np
+        Returns:
+            WAV file bytes, or None on failure
+        """
+        logger.info(f"Synthesizing text: '{text}'")
 
-            # Convert bytes to numpy array (16-bit PCM)
-            audio_array = np.frombuffer(audio_data, dtype=np.int16)
+        try:
+            def attempt():
+                buf = io.BytesIO()
+                return self._stream_wav(text, buf), buf.getvalue()
 
-            # Write as WAV file with proper headers
-            with wave.open(output_path, 'wb') as wav_file:
-                wav_file.setnchannels(1)  # Mono
-                wav_file.setsampwidth(2)  # 16-bit = 2 bytes
-                wav_file.setframerate(24000)  # 24kHz
-                wav_file.writeframes(audio_array.tobytes())
+            duration, wav_bytes = retry_call(attempt)
+            logger.info(f"TTS complete: {len(wav_bytes)} bytes, {duration:.2f}s")
+            return wav_bytes
 
-            # Get file info
-            file_size = os.path.getsize(output_path)
+        except Exception as e:
+            self._log_error(e)
+            return None
 
-            # Estimate duration (ElevenLabs typically outputs MP3 at ~128kbps)
-            # For more accurate duration, we'd need to parse the audio file
-            estimated_duration = file_size / 16000  # Rough estimate
+    def synthesize(self, text: str, output_path: str) -> bool:
+        """
+        Synthesize text to audio file
+
+        The SDK client is synchronous, so this runs directly on the calling
+        (worker) thread with no event loop involved.
+
+        Args:
+            text: Text to synthesize
+            output_path: Path to save audio file (WAV format)
 
+        Returns:
+            True if successful, False otherwise
+        """
+        logger.info(f"Synthesizing text: '{text}'")
+
+        try:
+            # Ensure output directory exists
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            # A retry rewrites the file from the start
+            duration = retry_call(self._stream_wav, text, output_path)
             logger.info(
                 f"TTS complete: {output_path} "
-                f"({file_size} bytes, ~{estimated_duration:.2f}s)"
+                f"({os.path.getsize(output_path)} bytes, {duration:.2f}s)"
             )
             return True
 
         except Exception as e:
-            logger.error(f"Error during TTS synthesis: {e}", exc_info=True)
-
-            # Check for common errors
-            if "invalid_api_key" in str(e).lower():
-                logger.error(
-                    "Invalid API key. Please check your ELEVENLABS_API_KEY. "
-                    "Get your API key from: https://elevenlabs.io"
-                )
-            elif "quota_exceeded" in str(e).lower():
-                logger.error(
-                    "ElevenLabs quota exceeded. "
-                    "You may need to upgrade your plan or wait for quota reset."
-                )
-
+            self._log_error(e)
             return False
 
-    def synthesize(self, text: str, output_path: str) -> bool:
+    async def synthesize_async(self, text: str, output_path: str) -> bool:
         """
-        Synchronous wrapper for synthesize_async
+        Synthesize text to audio file (async)
+
+        Runs the blocking SDK call in a worker thread so the event loop stays free.
 
         Args:
             text: Text to synthesize
-            output_path: Path to save audio file
+            output_path: Path to save audio file (WAV format)
 
         Returns:
             True if successful, False otherwise
         """
-        # Run async function in event loop
-        # Always create a new event loop when running in a thread pool
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(self.synthesize_async(text, output_path))
-                return result
-            finally:
-                loop.close()
-        except Exception as e:
-            logger.error(f"Error in synchronous wrapper: {e}", exc_info=True)
-            return False
+        return await asyncio.to_thread(self.synthesize, text, output_path)
 
 
 # Alias for backward compatibility
@@ -3,15 +3,64 @@ Text-to-Speech (TTS) Processor using Kokoro
 High-quality neural TTS optimized for conversational speech
 """
 import os
+import re
 import logging
+import threading
 import numpy as np
 import soundfile as sf
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 
 from app.config import settings
+from app.utils.audio_io import float_to_pcm16
+from app.utils.waveform_cache import WaveformCache
+from app.utils.wav_utils import silent_wav_bytes
 
 logger = logging.getLogger(__name__)
 
+# Rendered lines, keyed by (voice, text, speed)
+_waveform_cache = WaveformCache(settings.TTS_CACHE_MAX_SECONDS)
+
+# Renders in progress, keyed like the cache: concurrent sessions asking for
+# the same line wait on one inference instead of each running their own
+_inflight: dict = {}
+_inflight_lock = threading.Lock()
+
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+# Sentence-level synthesis pool (created on first multi-sentence request)
+_sentence_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_sentence_pool() -> ThreadPoolExecutor:
+    global _sentence_pool
+    if _sentence_pool is None:
+        _sentence_pool = ThreadPoolExecutor(
+            max_workers=settings.KOKORO_PARALLEL, thread_name_prefix="kokoro"
+        )
+    return _sentence_pool
+
+
+@lru_cache(maxsize=2)
+def _load_kokoro(model_path: str, voices_path: str):
+    """
+    Load Kokoro once per model/voices pair and share it across processor
+    instances. With sentence-parallel synthesis, each ONNX Runtime run is
+    limited to one intra-op thread so parallel sentences don't oversubscribe
+    the cores.
+    """
+    from kokoro_onnx import Kokoro
+
+    if settings.KOKORO_PARALLEL > 1 and hasattr(Kokoro, "from_session"):
+        import onnxruntime as ort
+
+        sess_options = ort.SessionOptions()
+        sess_options.intra_op_num_threads = 1
+        session = ort.InferenceSession(model_path, sess_options=sess_options)
+        return Kokoro.from_session(session, voices_path)
+    return Kokoro(model_path, voices_path)
+
 
 class KokoroTTSProcessor:
     """
@@ -64,12 +113,74 @@ class KokoroTTSProcessor:
         logger.info(f"Loading voices from: {self.voices_path}")
 
         try:
-            self.kokoro = Kokoro(self.model_path, self.voices_path)
+            self.kokoro = _load_kokoro(self.model_path, self.voices_path)
             logger.info("Kokoro TTS processor initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Kokoro: {e}", exc_info=True)
             raise
 
+    def _create(self, text: str, speed: float):
+        """
+        Run Kokoro over text, one sentence per worker for multi-sentence
+        input; the chunks are joined back in order.
+
+        Returns:
+            Tuple of (samples, sample_rate)
+        """
+        chunks = [c for c in _SENTENCE_SPLIT.split(text.strip()) if c]
+        if len(chunks) <= 1 or settings.KOKORO_PARALLEL <= 1:
+            return self.kokoro.create(text, voice=self.voice, speed=speed, lang="en-us")
+
+        results = list(_get_sentence_pool().map(
+            lambda chunk: self.kokoro.create(chunk, voice=self.voice, speed=speed, lang="en-us"),
+            chunks,
+        ))
+        sample_rate = results[0][1]
+        samples = np.concatenate([np.asarray(r[0], dtype=np.float32) for r in results])
+        return samples, sample_rate
+
+    def _render(self, text: str, speed: float):
+        """
+        PCM16 waveform for text, from the cache, an identical render already
+        in flight, or a new inference (in that order).
+
+        Returns:
+            Tuple of (int16 samples, sample_rate)
+        """
+        key = (self.voice, text, speed)
+        cached = _waveform_cache.get(key)
+        if cached is not None:
+            logger.info("Kokoro cache hit")
+            return cached
+
+        with _inflight_lock:
+            future = _inflight.get(key)
+            owner = future is None
+            if owner:
+                future = _inflight[key] = Future()
+
+        if not owner:
+            logger.info("Kokoro joining in-flight render")
+            return future.result()
+
+        try:
+            # Generate speech using Kokoro
+            logger.info("Running TTS synthesis...")
+            samples, sample_rate = self._create(text, speed)
+
+            # Normalize (if it peaks above 1.0) and convert to PCM16 in
+            # one pass; the cache keeps the int16 samples
+            samples = float_to_pcm16(samples)
+            _waveform_cache.put(key, samples, sample_rate)
+            future.set_result((samples, sample_rate))
+            return samples, sample_rate
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+
     def synthesize(self, text: str, output_path: str, speed: float = 1.0) -> bool:
         """
         Synthesize text to audio file
@@ -88,27 +199,9 @@ class KokoroTTSProcessor:
             # Ensure output directory exists
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-            # Generate speech using Kokoro
-            logger.info("Running TTS synthesis...")
-            samples, sample_rate = self.kokoro.create(
-                text,
-                voice=self.voice,
-                speed=speed,
-                lang="en-us"
-            )
-
-            # Ensure samples are in correct format
-            if isinstance(samples, list):
-                samples = np.array(samples, dtype=np.float32)
-            elif not isinstance(samples, np.ndarray):
-                samples = np.array(samples, dtype=np.float32)
+            samples, sample_rate = self._render(text, speed)
 
-            # Normalize to [-1, 1] if needed
-            max_val = np.abs(samples).max()
-            if max_val > 1.0:
-                samples = samples / max_val
-
-            # Save as WAV file
+            # Save as WAV file (int16 in, PCM_16 out — no conversion)
             sf.write(output_path, samples, sample_rate, subtype='PCM_16')
 
             # Get file info
@@ -133,13 +226,15 @@ class KokoroTTSProcessor:
         """
         Create a fallback silent audio file
 
+        The silent WAV is built once and reused, so repeated failures (e.g.
+        a misconfigured voice) only cost a file write.
+
         Args:
             output_path: Output file path
             duration: Duration in seconds
         """
-        samples = int(duration * self.sample_rate)
-        audio = np.zeros(samples, dtype=np.float32)
-        sf.write(output_path, audio, self.sample_rate, subtype='PCM_16')
+        with open(output_path, 'wb') as f:
+            f.write(silent_wav_bytes(duration, self.sample_rate))
         logger.info(f"Created fallback audio: {output_path} ({duration}s)")
 
 
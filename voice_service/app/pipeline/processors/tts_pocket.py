@@ -4,17 +4,21 @@ Ultra-lightweight 100M-parameter TTS that runs efficiently on CPU.
 """
 import logging
 import os
-from typing import Optional
+from typing import Iterable, Optional
 
 import numpy as np
 import soundfile as sf
 
 from app.config import settings
+from app.utils.audio_io import float_to_pcm16
+from app.utils.waveform_cache import WaveformCache
 
 logger = logging.getLogger(__name__)
 
 _pocket_model = None
 _pocket_voice_state = None
+# Rendered lines, keyed by (voice, text)
+_waveform_cache = WaveformCache(settings.TTS_CACHE_MAX_SECONDS)
 
 
 def _get_pocket_model():
@@ -49,6 +53,38 @@ class PocketTTSProcessor:
     def __init__(self):
         self.model, self.voice_state = _get_pocket_model()
 
+    def _render(self, text: str):
+        """Waveform for text as (int16 samples, sample_rate), from the cache if possible"""
+        key = (settings.POCKET_TTS_VOICE, text)
+        cached = _waveform_cache.get(key)
+        if cached is not None:
+            logger.info("Pocket-TTS cache hit")
+            return cached
+
+        audio = self.model.generate_audio(self.voice_state, text)
+        if audio is None:
+            return None, None
+
+        # Convert to numpy if it's a torch tensor, then straight to PCM16
+        # (the cache keeps the int16 samples)
+        audio_np = audio.numpy() if hasattr(audio, "numpy") else np.asarray(audio)
+        audio_np = float_to_pcm16(audio_np)
+
+        sample_rate = self.model.sample_rate
+        _waveform_cache.put(key, audio_np, sample_rate)
+        return audio_np, sample_rate
+
+    def prewarm(self, texts: Iterable[str]):
+        """Render fixed lines into the waveform cache ahead of use"""
+        count = 0
+        for text in texts:
+            try:
+                if self._render(text)[0] is not None:
+                    count += 1
+            except Exception as e:
+                logger.warning(f"Pocket-TTS prewarm failed for '{text}': {e}")
+        logger.info(f"Pocket-TTS cache prewarmed with {count} lines")
+
     def synthesize(self, text: str, output_path: str) -> bool:
         """
         Synthesize text to a WAV file.
@@ -65,18 +101,12 @@ class PocketTTSProcessor:
         try:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-            audio = self.model.generate_audio(self.voice_state, text)
-
-            if audio is None:
+            audio_np, sample_rate = self._render(text)
+            if audio_np is None:
                 logger.error("Pocket-TTS returned no audio")
                 return False
 
-            # Convert to numpy if it's a torch tensor
-            audio_np = audio.numpy() if hasattr(audio, "numpy") else np.asarray(audio)
-            audio_np = audio_np.astype(np.float32)
-
-            sample_rate = self.model.sample_rate
-            sf.write(output_path, audio_np, sample_rate)
+            sf.write(output_path, audio_np, sample_rate, subtype='PCM_16')
 
             file_size = os.path.getsize(output_path)
             duration = len(audio_np) / float(sample_rate)
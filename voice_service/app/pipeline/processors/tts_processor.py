@@ -5,8 +5,11 @@ Uses pyttsx3 for offline TTS with Windows voices
 import pyttsx3
 import logging
 import os
+import queue
 import tempfile
-from typing import Optional
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
 
 from app.config import settings
 from app.utils.wav_utils import get_wav_duration
@@ -15,7 +18,14 @@ logger = logging.getLogger(__name__)
 
 
 class TTSProcessor:
-    """Text-to-Speech processor using pyttsx3"""
+    """
+    Text-to-Speech processor using pyttsx3
+
+    The pyttsx3 engine (and its SAPI5 COM state) is not reentrant and must
+    stay on the thread that created it, so one daemon thread owns it and
+    serves calls from a queue. synthesize() can be called from any thread
+    and blocks only its caller.
+    """
 
     def __init__(self, voice_id: Optional[str] = None):
         """
@@ -26,6 +36,32 @@ class TTSProcessor:
         """
         logger.info("Initializing TTS processor...")
 
+        self._jobs: "queue.Queue[tuple[Callable, Future]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="pyttsx3", daemon=True)
+        self._thread.start()
+
+        # Engine setup runs on the owner thread too
+        self._call(self._init_engine, voice_id)
+
+    def _run(self):
+        """Owner thread: run queued calls one at a time"""
+        while True:
+            func, future = self._jobs.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func())
+            except BaseException as e:
+                future.set_exception(e)
+
+    def _call(self, func: Callable, *args) -> Any:
+        """Run func(*args) on the owner thread and wait for its result"""
+        future: Future = Future()
+        self._jobs.put((lambda: func(*args), future))
+        return future.result()
+
+    def _init_engine(self, voice_id: Optional[str]):
+        """Create and configure the engine (owner thread only)"""
         # Initialize pyttsx3 engine
         self.engine = pyttsx3.init()
 
@@ -87,6 +123,10 @@ class TTSProcessor:
         Returns:
             True if successful, False otherwise
         """
+        return self._call(self._synthesize, text, output_path)
+
+    def _synthesize(self, text: str, output_path: str) -> bool:
+        """Synthesize on the owner thread"""
         logger.info(f"Synthesizing text: '{text}'")
 
         try:
@@ -124,7 +164,7 @@ class TTSProcessor:
         Returns:
             List of voice objects
         """
-        return self.engine.getProperty('voices')
+        return self._call(self.engine.getProperty, 'voices')
 
     def list_voices(self):
         """Print available voices for debugging"""
@@ -2,9 +2,12 @@
 Text-to-Speech (TTS) Processor using Qwen3-TTS
 Local, open-source neural TTS with streaming-capable models.
 """
+import inspect
 import logging
 import os
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import List, Optional
 
 import numpy as np
 import soundfile as sf
@@ -15,7 +18,14 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 _qwen_model = None
-_qwen_model_id = None
+_qwen_model_key = None
+# Model key the warmup generate has run for
+_qwen_warm_key = None
+# Supported speakers per model id (some variants read a config file for it)
+_supported_speakers_cache: dict = {}
+
+# Layer names kept in full precision when quantizing (embeddings, output heads)
+_QUANT_SKIP = ("embed", "lm_head", "head")
 
 
 def _get_torch_dtype(dtype_name: str):
@@ -27,10 +37,83 @@ def _get_torch_dtype(dtype_name: str):
     return torch.float32
 
 
+def _fp8_supported() -> bool:
+    """FP8 matmuls need an Ada (sm_89) or Hopper (sm_90) class GPU"""
+    return torch.cuda.is_available() and torch.cuda.get_device_capability() >= (8, 9)
+
+
+def _quantize(model, quant: str):
+    """
+    Quantize the wrapped transformer's Linear layers in place.
+
+    int8 uses PyTorch dynamic quantization (CPU); int4 uses torchao
+    weight-only int4 and fp8 uses torchao FP8 weights with dynamic FP8
+    activations (CUDA). Embeddings and output heads stay in full precision.
+    """
+    module = getattr(model, "model", model)
+    if not isinstance(module, torch.nn.Module):
+        logger.warning("Qwen3-TTS model exposes no nn.Module; skipping quantization")
+        return model
+
+    def keep_linear(layer, name):
+        return isinstance(layer, torch.nn.Linear) and not any(k in name for k in _QUANT_SKIP)
+
+    if quant == "int8":
+        qconfig = torch.ao.quantization.default_dynamic_qconfig
+        spec = {name: qconfig for name, layer in module.named_modules() if keep_linear(layer, name)}
+        quantized = torch.ao.quantization.quantize_dynamic(module, spec, dtype=torch.qint8)
+        if module is not model:
+            model.model = quantized
+        else:
+            model = quantized
+    elif quant in ("int4", "fp8"):
+        try:
+            from torchao.quantization import (
+                float8_dynamic_activation_float8_weight,
+                int4_weight_only,
+                quantize_,
+            )
+        except ImportError as e:
+            raise ImportError(
+                f"torchao is required for QWEN_TTS_QUANT={quant}. "
+                "Install with: pip install torchao"
+            ) from e
+        if quant == "int4":
+            config = int4_weight_only()
+        else:
+            config = float8_dynamic_activation_float8_weight()
+        quantize_(module, config, filter_fn=keep_linear)
+    else:
+        raise ValueError(
+            f"Unknown QWEN_TTS_QUANT '{quant}'. Supported: 'none', 'int8', 'int4', 'fp8'"
+        )
+
+    logger.info(f"Qwen3-TTS quantized to {quant}")
+    return model
+
+
+def _compile(model):
+    """
+    Compile the wrapped transformer with torch.compile (reduce-overhead:
+    fused kernels plus CUDA graphs on GPU). Compilation itself happens on
+    the first generate, i.e. the warmup pass.
+    """
+    module = getattr(model, "model", None)
+    if not isinstance(module, torch.nn.Module) or not hasattr(torch, "compile"):
+        logger.warning("Qwen3-TTS model can't be compiled; running eager")
+        return
+    try:
+        model.model = torch.compile(module, mode="reduce-overhead", fullgraph=False)
+        logger.info("Qwen3-TTS compiled with torch.compile")
+    except Exception as e:
+        logger.warning(f"torch.compile failed for Qwen3-TTS ({e}); running eager")
+
+
 def _get_qwen_model():
-    global _qwen_model, _qwen_model_id
+    global _qwen_model, _qwen_model_key
     model_id = settings.QWEN_TTS_MODEL_ID
-    if _qwen_model is None or _qwen_model_id != model_id:
+    quant = (settings.QWEN_TTS_QUANT or "none").lower()
+    if _qwen_model is None or _qwen_model_key != (model_id, quant):
         logger.info(f"Loading Qwen3-TTS model: {model_id}")
         try:
             from qwen_tts import Qwen3TTSModel
@@ -41,6 +124,17 @@ def _get_qwen_model():
             ) from e
 
         dtype = _get_torch_dtype(settings.QWEN_TTS_DTYPE)
+        if quant == "fp8":
+            if _fp8_supported():
+                # FP8 kernels take bf16 activations in and out
+                dtype = torch.bfloat16
+            else:
+                logger.warning(
+                    "QWEN_TTS_QUANT=fp8 needs a CUDA GPU with compute capability "
+                    ">= 8.9; falling back to bf16 weights"
+                )
+                dtype = torch.bfloat16 if torch.cuda.is_available() else dtype
+                quant = "none"
         kwargs = {
             "device_map": settings.QWEN_TTS_DEVICE,
             "dtype": dtype,
@@ -49,11 +143,35 @@ def _get_qwen_model():
             kwargs["attn_implementation"] = settings.QWEN_TTS_ATTN_IMPL
 
         _qwen_model = Qwen3TTSModel.from_pretrained(model_id, **kwargs)
-        _qwen_model_id = model_id
+        module = getattr(_qwen_model, "model", _qwen_model)
+        if isinstance(module, torch.nn.Module):
+            module.eval()
+        if quant not in ("none", "bf16", ""):
+            _qwen_model = _quantize(_qwen_model, quant)
+        if settings.QWEN_TTS_COMPILE:
+            _compile(_qwen_model)
+        _qwen_model_key = (model_id, (settings.QWEN_TTS_QUANT or "none").lower())
         logger.info("Qwen3-TTS model loaded successfully")
     return _qwen_model
 
 
+def _write_wav(output_path: str, audio, sample_rate: int):
+    """Write one generated waveform (tensor or array) as a WAV file"""
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    if isinstance(audio, torch.Tensor):
+        audio = audio.detach().cpu().numpy()
+    audio = np.asarray(audio, dtype=np.float32)
+
+    sf.write(output_path, audio, sample_rate)
+
+    file_size = os.path.getsize(output_path)
+    duration = len(audio) / float(sample_rate)
+    logger.info(
+        f"TTS complete: {output_path} "
+        f"({file_size} bytes, {duration:.2f}s)"
+    )
+
+
 class Qwen3TTSProcessor:
     """
     Qwen3-TTS processor for local speech synthesis
@@ -67,7 +185,10 @@ class Qwen3TTSProcessor:
 
         # Validate speaker if available
         try:
-            speakers = self.model.get_supported_speakers()
+            speakers = _supported_speakers_cache.get(settings.QWEN_TTS_MODEL_ID)
+            if not speakers:
+                speakers = self.model.get_supported_speakers()
+                _supported_speakers_cache[settings.QWEN_TTS_MODEL_ID] = speakers
             if not self.speaker or self.speaker.lower() == "auto":
                 self.speaker = speakers[0]
             elif self.speaker not in speakers:
@@ -80,34 +201,149 @@ class Qwen3TTSProcessor:
             # Some variants may not expose speaker list
             pass
 
+        if "VoiceDesign" in settings.QWEN_TTS_MODEL_ID and not self.instruction:
+            self.instruction = "Warm, friendly voice for a young child."
+        self._instruct_kwargs = self._encode_instruction()
+
         logger.info(
             f"Qwen3-TTS initialized: model={settings.QWEN_TTS_MODEL_ID}, "
             f"language={self.language}, speaker={self.speaker}"
         )
 
-    def _generate(self, text: str):
+        if settings.MODEL_WARMUP:
+            self._warmup()
+
+    def _encode_instruction(self) -> dict:
+        """
+        Encode the fixed instruction once, if the model can take it
+        pre-encoded (an encode_instruct method plus an instruct_embeds
+        argument on its generate call), so each utterance skips one text
+        encoder pass. Returns the generate kwargs to use instead of the
+        instruct string, or {} to keep the string path.
+        """
+        encode = getattr(self.model, "encode_instruct", None)
+        if not self.instruction or not callable(encode):
+            return {}
+
+        if "VoiceDesign" in settings.QWEN_TTS_MODEL_ID:
+            generate = getattr(self.model, "generate_voice_design", None)
+        else:
+            generate = getattr(self.model, "generate_custom_voice", None)
+        try:
+            if generate is None or "instruct_embeds" not in inspect.signature(generate).parameters:
+                return {}
+            with torch.inference_mode():
+                embeds = encode(self.instruction)
+            logger.info("Qwen3-TTS instruction embeddings cached")
+            return {"instruct_embeds": embeds}
+        except Exception as e:
+            logger.warning(f"Could not cache Qwen3-TTS instruction embeddings: {e}")
+            return {}
+
+    def _warmup(self):
+        """Generate once and discard, so the first reply skips kernel autotune"""
+        global _qwen_warm_key
+        if _qwen_warm_key == _qwen_model_key:
+            return
+        try:
+            self._generate(".")
+            _qwen_warm_key = _qwen_model_key
+            logger.info("Qwen3-TTS warmed up")
+        except Exception as e:
+            logger.warning(f"Qwen3-TTS warmup failed: {e}")
+
+    def _generate_call(self, text):
+        """
+        Pick the generate method and its kwargs for the model variant.
+
+        Returns:
+            (method_name, kwargs) for one text, or a list of texts as a batch
+        """
         model_id = settings.QWEN_TTS_MODEL_ID
         language = self.language if self.language and self.language.lower() != "auto" else "Auto"
-        instruct = self.instruction if self.instruction else None
+        speaker = self.speaker
+
+        if isinstance(text, list):
+            # Batched input takes one language/speaker/instruct per text
+            language = [language] * len(text)
+            speaker = [speaker] * len(text)
+            instruct_kwargs = {"instruct": [self.instruction or None] * len(text)}
+        else:
+            # Cached instruction embeddings when the model takes them
+            instruct_kwargs = self._instruct_kwargs or {"instruct": self.instruction or None}
 
         if "VoiceDesign" in model_id:
-            return self.model.generate_voice_design(
-                text=text,
-                language=language,
-                instruct=instruct or "Warm, friendly voice for a young child.",
-            )
+            return "generate_voice_design", dict(text=text, language=language, **instruct_kwargs)
         if "CustomVoice" in model_id:
-            return self.model.generate_custom_voice(
-                text=text,
-                language=language,
-                speaker=self.speaker,
-                instruct=instruct,
+            return "generate_custom_voice", dict(
+                text=text, language=language, speaker=speaker, **instruct_kwargs
             )
         raise ValueError(
             "QWEN_TTS_MODEL_ID must be a VoiceDesign or CustomVoice variant. "
             "Base variants require voice cloning inputs and are not supported yet."
         )
 
+    def _inference_context(self):
+        """
+        No autograd bookkeeping; bf16 autocast on CUDA (a no-op for weights
+        already loaded in bf16/fp16)
+        """
+        on_cuda = settings.QWEN_TTS_DEVICE.lower().startswith("cuda")
+        stack = ExitStack()
+        stack.enter_context(torch.inference_mode())
+        stack.enter_context(torch.autocast(device_type="cuda", dtype=torch.bfloat16, enabled=on_cuda))
+        return stack
+
+    def _generate(self, text):
+        """Run the model on one text, or a list of texts as one batch"""
+        method, kwargs = self._generate_call(text)
+        with self._inference_context():
+            return getattr(self.model, method)(**kwargs)
+
+    def _synthesize_streaming(self, text: str, output_path: str) -> Optional[bool]:
+        """
+        Write audio chunks to the WAV file as the model decodes them, if the
+        model has a streaming generate variant.
+
+        Returns:
+            True/False for success, or None if streaming isn't available
+        """
+        method, kwargs = self._generate_call(text)
+        stream = getattr(self.model, f"{method}_stream", None)
+        if not callable(stream):
+            return None
+
+        frames = 0
+        sample_rate = None
+        out = None
+        try:
+            with self._inference_context():
+                for chunk, chunk_rate in stream(**kwargs):
+                    if out is None:
+                        sample_rate = chunk_rate
+                        out = sf.SoundFile(
+                            output_path, mode="w", samplerate=sample_rate,
+                            channels=1, subtype="PCM_16",
+                        )
+                    if isinstance(chunk, torch.Tensor):
+                        chunk = chunk.detach().to("cpu").numpy()
+                    chunk = np.asarray(chunk, dtype=np.float32).reshape(-1)
+                    out.write(chunk)
+                    frames += len(chunk)
+        finally:
+            if out is not None:
+                out.close()
+
+        if not frames:
+            logger.error("Qwen3-TTS stream returned no audio")
+            return False
+
+        logger.info(
+            f"TTS complete: {output_path} "
+            f"({os.path.getsize(output_path)} bytes, {frames / float(sample_rate):.2f}s, streamed)"
+        )
+        return True
+
     def synthesize(self, text: str, output_path: str) -> bool:
         """
         Synthesize text to a WAV file.
@@ -121,31 +357,74 @@ class Qwen3TTSProcessor:
         try:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
+            streamed = self._synthesize_streaming(text, output_path)
+            if streamed is not None:
+                return streamed
+
             wavs, sample_rate = self._generate(text)
 
             if not wavs or sample_rate is None:
                 logger.error("Qwen3-TTS returned no audio")
                 return False
 
-            audio = wavs[0]
-            if isinstance(audio, torch.Tensor):
-                audio = audio.detach().cpu().numpy()
-            audio = np.asarray(audio, dtype=np.float32)
-
-            sf.write(output_path, audio, sample_rate)
-
-            file_size = os.path.getsize(output_path)
-            duration = len(audio) / float(sample_rate)
-            logger.info(
-                f"TTS complete: {output_path} "
-                f"({file_size} bytes, {duration:.2f}s)"
-            )
+            _write_wav(output_path, wavs[0], sample_rate)
             return True
 
         except Exception as e:
             logger.error(f"Error during Qwen3-TTS synthesis: {e}", exc_info=True)
             return False
 
+    def synthesize_batch(self, texts: List[str], output_paths: List[str]) -> List[bool]:
+        """
+        Synthesize several texts, up to QWEN_TTS_MAX_BATCH per generate call.
+
+        Batches go through the model's list input in one generate call; the
+        WAV writes run on a small thread pool so they overlap the next
+        batch. Falls back to one call per text if the installed qwen-tts
+        does not take list input.
+
+        Args:
+            texts: Texts to synthesize
+            output_paths: Output WAV path for each text
+
+        Returns:
+            Success flag for each text, in order
+        """
+        results = [False] * len(texts)
+        batch_size = max(1, settings.QWEN_TTS_MAX_BATCH)
+
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="qwen-tts-write") as writer:
+            pending = []
+            for start in range(0, len(texts), batch_size):
+                batch = texts[start:start + batch_size]
+                paths = output_paths[start:start + batch_size]
+                logger.info(f"Synthesizing batch of {len(batch)} with Qwen3-TTS")
+
+                try:
+                    wavs, sample_rate = self._generate(batch)
+                    if not wavs or len(wavs) != len(batch):
+                        raise TypeError("batched generate returned a mismatched result")
+                except TypeError:
+                    # No list support: one call per text
+                    for i, (text, path) in enumerate(zip(batch, paths)):
+                        results[start + i] = self.synthesize(text, path)
+                    continue
+                except Exception as e:
+                    logger.error(f"Error during Qwen3-TTS batch synthesis: {e}", exc_info=True)
+                    continue
+
+                for i, (wav, path) in enumerate(zip(wavs, paths)):
+                    pending.append((start + i, writer.submit(_write_wav, path, wav, sample_rate)))
+
+            for index, future in pending:
+                try:
+                    future.result()
+                    results[index] = True
+                except Exception as e:
+                    logger.error(f"Error writing Qwen3-TTS audio: {e}", exc_info=True)
+
+        return results
+
 
 # Alias for backward compatibility
 TTSProcessor = Qwen3TTSProcessor
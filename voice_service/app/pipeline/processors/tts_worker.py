@@ -0,0 +1,165 @@
+"""
+Persistent Qwen3-TTS worker process
+
+One child process loads Qwen3-TTS once and serves synthesis jobs from a
+queue for the life of the service, resetting per-utterance model state
+between jobs instead of reloading. The parent talks to it through
+TTSWorkerClient, which has the same synthesize() interface as the
+in-process processor.
+
+Protocol (one line per job, tab-separated):
+    parent -> worker: (output_path, text), or None to stop
+    worker -> parent: "OK\\t<path>\\t<duration>" or "ERR\\t<path>"
+"""
+import logging
+import multiprocessing as mp
+import queue
+import threading
+from typing import Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Live clients, stopped by shutdown_workers() at service shutdown
+_clients: list = []
+
+
+def _reset_model_state(model, jobs_done: int):
+    """Drop per-utterance state; release cached GPU blocks every N jobs"""
+    reset = getattr(model, "reset_cache", None)
+    if callable(reset):
+        reset()
+    elif hasattr(model, "past_key_values"):
+        model.past_key_values = None
+
+    every = settings.QWEN_TTS_WORKER_EMPTY_CACHE_EVERY
+    if every > 0 and jobs_done % every == 0:
+        import torch
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+
+def _worker_main(jobs: mp.Queue, results: mp.Queue):
+    """Worker loop: load the model once, then serve jobs until None"""
+    import soundfile as sf
+    from app.pipeline.processors.tts_qwen3 import Qwen3TTSProcessor
+
+    processor = Qwen3TTSProcessor()
+    results.put("READY")
+
+    jobs_done = 0
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+
+        output_path, text = job
+        try:
+            ok = processor.synthesize(text, output_path)
+            if ok:
+                duration = sf.info(output_path).duration
+                results.put(f"OK\t{output_path}\t{duration:.3f}")
+            else:
+                results.put(f"ERR\t{output_path}")
+        except Exception:
+            results.put(f"ERR\t{output_path}")
+        finally:
+            jobs_done += 1
+            _reset_model_state(processor.model, jobs_done)
+
+
+class TTSWorkerClient:
+    """Qwen3-TTS client backed by a persistent worker process"""
+
+    def __init__(self):
+        # spawn, not fork: the parent may already hold torch/CUDA state
+        self._ctx = mp.get_context("spawn")
+        self._lock = threading.Lock()
+        self._process: Optional[mp.Process] = None
+        self._jobs: Optional[mp.Queue] = None
+        self._results: Optional[mp.Queue] = None
+        self._start()
+        _clients.append(self)
+
+    def _start(self):
+        """Start the worker and wait until its model is loaded"""
+        self._jobs = self._ctx.Queue()
+        self._results = self._ctx.Queue()
+        self._process = self._ctx.Process(
+            target=_worker_main,
+            args=(self._jobs, self._results),
+            name="qwen-tts-worker",
+            daemon=True,
+        )
+        self._process.start()
+        logger.info(f"Qwen3-TTS worker process started (pid={self._process.pid})")
+
+        ready = self._results.get(timeout=settings.QWEN_TTS_WORKER_LOAD_TIMEOUT)
+        if ready != "READY":
+            raise RuntimeError(f"Qwen3-TTS worker failed to start: {ready!r}")
+        logger.info("Qwen3-TTS worker ready")
+
+    def _restart(self):
+        """Replace a dead or stuck worker"""
+        logger.warning("Restarting Qwen3-TTS worker process")
+        if self._process is not None and self._process.is_alive():
+            self._process.kill()
+            self._process.join(timeout=5)
+        self._start()
+
+    def synthesize(self, text: str, output_path: str) -> bool:
+        """
+        Synthesize text to a WAV file in the worker process.
+
+        Args:
+            text: Text to synthesize
+            output_path: Path to save WAV file
+
+        Returns:
+            True if successful, False otherwise
+        """
+        # The worker serves one job at a time; the lock keeps each reply
+        # paired with its request
+        with self._lock:
+            try:
+                if self._process is None or not self._process.is_alive():
+                    self._restart()
+
+                self._jobs.put((output_path, text))
+                reply = self._results.get(timeout=settings.QWEN_TTS_WORKER_JOB_TIMEOUT)
+            except queue.Empty:
+                logger.error(f"Qwen3-TTS worker timed out on {output_path}")
+                self._restart()
+                return False
+            except Exception as e:
+                logger.error(f"Qwen3-TTS worker error: {e}", exc_info=True)
+                return False
+
+        parts = reply.split("\t")
+        if parts[0] == "OK" and len(parts) == 3:
+            logger.info(f"TTS complete: {parts[1]} ({float(parts[2]):.2f}s, worker)")
+            return True
+
+        logger.error(f"Qwen3-TTS worker failed: {reply}")
+        return False
+
+    def close(self):
+        """Stop the worker process"""
+        with self._lock:
+            if self._process is None:
+                return
+            try:
+                self._jobs.put(None)
+                self._process.join(timeout=10)
+            finally:
+                if self._process.is_alive():
+                    self._process.kill()
+                self._process = None
+                logger.info("Qwen3-TTS worker stopped")
+
+
+def shutdown_workers():
+    """Stop every worker process started by this service"""
+    while _clients:
+        _clients.pop().close()
@@ -78,45 +78,45 @@ class VADProcessor:
         # Convert to int16 for webrtcvad
         audio_int16 = audio_to_int16(audio)
 
-        # Split into frames
-        frames = self._frame_generator(audio_int16)
-
-        # Detect speech frames
-        speech_frames = []
-        triggered = False
+        # One bytes copy of the whole clip; each frame is a slice of it
+        n_frames = self._frame_count(audio_int16)
+        raw = audio_int16.tobytes()
+        frame_bytes = 2 * self.frame_size
+
+        # Detect the speech segment as a [start, end) frame range
+        start = None
+        end = n_frames
         num_padding_frames = 0
 
-        for frame in frames:
-            is_speech = self.vad.is_speech(frame.tobytes(), self.sample_rate)
+        for i in range(n_frames):
+            offset = i * frame_bytes
+            is_speech = self.vad.is_speech(raw[offset:offset + frame_bytes], self.sample_rate)
 
-            if not triggered:
+            if start is None:
                 if is_speech:
-                    # Start of speech
-                    triggered = True
-                    # Add padding frames before speech
-                    speech_frames.extend([frame] * (self.padding_frames + 1))
+                    # Start of speech, with padding frames before it
+                    start = max(0, i - self.padding_frames)
                     logger.debug("Speech started")
             else:
                 if is_speech:
                     # Continue speech
-                    speech_frames.append(frame)
                     num_padding_frames = 0
                 else:
                     # Possible end of speech
                     num_padding_frames += 1
-                    speech_frames.append(frame)
 
                     if num_padding_frames > self.padding_frames:
                         # End of speech
                         logger.debug("Speech ended")
+                        end = i + 1
                         break
 
-        if not speech_frames:
+        if start is None:
             logger.warning("No speech detected")
             return None
 
-        # Concatenate speech frames
-        speech_audio = np.concatenate(speech_frames)
+        # The segment is a view into the int16 buffer, converted once
+        speech_audio = audio_int16[start * self.frame_size:end * self.frame_size]
 
         # Convert back to float32
         speech_audio = int16_to_audio(speech_audio)
@@ -128,19 +128,14 @@ class VADProcessor:
 
         return speech_audio
 
-    def _frame_generator(self, audio: np.ndarray):
+    def _frame_count(self, audio: np.ndarray) -> int:
         """
-        Generate frames from audio
+        Number of whole frames in audio (a trailing partial frame is dropped)
 
         Args:
             audio: Audio data as int16
 
-        Yields:
-            Audio frames
+        Returns:
+            Frame count
         """
-        n = len(audio)
-        offset = 0
-
-        while offset + self.frame_size <= n:
-            yield audio[offset:offset + self.frame_size]
-            offset += self.frame_size
+        return len(audio) // self.frame_size
@@ -6,9 +6,10 @@ Better accuracy on children's voices, background noise, and edge cases.
 import torch
 import numpy as np
 import logging
-from typing import Optional
+import threading
+from typing import List, Optional, Tuple
 
-from silero_vad import load_silero_vad, get_speech_timestamps
+from silero_vad import load_silero_vad, VADIterator
 
 from app.config import settings
 
@@ -16,18 +17,90 @@ logger = logging.getLogger(__name__)
 
 # Module-level model cache (loaded once, reused across instances)
 _silero_model = None
+_silero_device = torch.device("cpu")
+_silero_dtype = torch.float32
+
+
+def _warmup(model, device: torch.device, dtype: torch.dtype):
+    """Run a couple of silent windows so the first request skips JIT/autotune"""
+    window = torch.zeros(512, device=device, dtype=dtype)
+    with torch.no_grad():
+        for _ in range(2):
+            model(window, 16000)
+    model.reset_states()
+
+
+def _compile(model, device: torch.device, dtype: torch.dtype):
+    """
+    Wrap the model with torch.compile (reduce-overhead) if VAD_COMPILE is
+    set. Compilation happens on the first call, so one window is run here;
+    if the export can't be compiled, the eager model is kept.
+    """
+    if not settings.VAD_COMPILE or not hasattr(torch, "compile"):
+        return model
+    try:
+        compiled = torch.compile(model, mode="reduce-overhead", fullgraph=False)
+        with torch.no_grad():
+            compiled(torch.zeros(512, device=device, dtype=dtype), 16000)
+        model.reset_states()
+        logger.info("Silero VAD compiled with torch.compile")
+        return compiled
+    except Exception as e:
+        logger.warning(f"torch.compile failed for Silero VAD ({e}); using eager model")
+        model.reset_states()
+        return model
 
 
 def _get_silero_model():
-    """Load Silero VAD model (cached singleton)."""
-    global _silero_model
+    """Load Silero VAD model (cached singleton), on CUDA in FP16 if configured."""
+    global _silero_model, _silero_device, _silero_dtype
     if _silero_model is None:
         logger.info("Loading Silero VAD model...")
-        _silero_model = load_silero_vad()
-        logger.info("Silero VAD model loaded successfully")
+        model = load_silero_vad()
+
+        if settings.SILERO_VAD_DEVICE.lower() == "cuda" and torch.cuda.is_available():
+            device = torch.device("cuda")
+            try:
+                model = model.to(device=device, dtype=torch.float16)
+                # Smoke-test one window: not every Silero export runs in half
+                model(torch.zeros(512, device=device, dtype=torch.float16), 16000)
+                model.reset_states()
+                _silero_dtype = torch.float16
+            except Exception as e:
+                logger.warning(f"Silero VAD FP16 failed ({e}); using FP32 on CUDA")
+                model = load_silero_vad().to(device)
+                _silero_dtype = torch.float32
+            _silero_device = device
+
+        model = _compile(model, _silero_device, _silero_dtype)
+        if settings.MODEL_WARMUP:
+            _warmup(model, _silero_device, _silero_dtype)
+        _silero_model = model
+        logger.info(
+            f"Silero VAD model loaded successfully "
+            f"(device={_silero_device}, dtype={_silero_dtype})"
+        )
     return _silero_model
 
 
+def join_segments(audio: np.ndarray, segments: List[Tuple[int, int]]) -> np.ndarray:
+    """
+    Speech audio for segments: a view for one segment; otherwise each span
+    is copied once into a buffer preallocated to the total length.
+    """
+    if len(segments) == 1:
+        start, end = segments[0]
+        return audio[start:end]
+
+    out = np.empty(sum(end - start for start, end in segments), dtype=audio.dtype)
+    offset = 0
+    for start, end in segments:
+        n = end - start
+        np.copyto(out[offset:offset + n], audio[start:end])
+        offset += n
+    return out
+
+
 class SileroVADProcessor:
     """Voice Activity Detection processor using Silero VAD (neural network)"""
 
@@ -75,6 +148,9 @@ class SileroVADProcessor:
 
         # Load model (cached globally)
         self.model = _get_silero_model()
+        # Per-thread pinned host buffers for the CUDA upload (the pipeline
+        # runs turns on several worker threads at once)
+        self._local = threading.local()
 
         logger.info(
             f"Silero VAD initialized: sample_rate={self.sample_rate}Hz, "
@@ -84,50 +160,114 @@ class SileroVADProcessor:
             f"speech_pad={self.speech_pad_ms}ms"
         )
 
-    def process(self, audio: np.ndarray) -> Optional[np.ndarray]:
+    def _to_model_tensor(self, audio: np.ndarray) -> torch.Tensor:
         """
-        Process audio and extract speech segments.
+        Wrap audio as a 1D tensor on the model's device and dtype.
 
-        Same interface as the old VADProcessor — takes float32 audio,
-        returns trimmed float32 audio with only speech, or None.
+        On CPU this is a zero-copy view. On CUDA the samples go through this
+        thread's pinned host buffer (grown as needed, never shrunk) so the
+        upload is a single async DMA.
+        """
+        audio_tensor = torch.from_numpy(np.ascontiguousarray(audio, dtype=np.float32))
+
+        # Ensure 1D (mono)
+        if audio_tensor.dim() > 1:
+            audio_tensor = audio_tensor.squeeze()
+
+        if _silero_device.type != "cuda":
+            return audio_tensor
+
+        n = audio_tensor.numel()
+        pinned = getattr(self._local, "pinned", None)
+        if pinned is None or pinned.numel() < n:
+            size = max(n, settings.VAD_MAX_UTTERANCE_SEC * self.sample_rate)
+            pinned = torch.empty(size, dtype=torch.float32).pin_memory()
+            self._local.pinned = pinned
+        staged = pinned[:n]
+        staged.copy_(audio_tensor)
+        return staged.to(_silero_device, non_blocking=True).to(_silero_dtype)
+
+    def _speech_timestamps(self, audio_tensor: torch.Tensor) -> list:
+        """
+        Find speech segments by driving a VADIterator over fixed windows,
+        the same way streaming_vad.process_chunk does.
+
+        With SILERO_VAD_STOP_AT_FIRST_END the scan stops at the first
+        speech end, so the tail of the clip never goes through the network.
+
+        Returns:
+            List of {'start', 'end'} dicts in samples
+        """
+        window = 512 if self.sample_rate == 16000 else 256
+        n = audio_tensor.numel()
+        min_speech = self.sample_rate * self.min_speech_duration_ms // 1000
+        stop_at_first_end = settings.SILERO_VAD_STOP_AT_FIRST_END
+
+        iterator = VADIterator(
+            self.model,
+            threshold=self.threshold,
+            sampling_rate=self.sample_rate,
+            min_silence_duration_ms=self.min_silence_duration_ms,
+            speech_pad_ms=self.speech_pad_ms,
+        )
+
+        segments = []
+        start = None
+        try:
+            for offset in range(0, n, window):
+                chunk = audio_tensor[offset:offset + window]
+                if chunk.numel() < window:
+                    chunk = torch.nn.functional.pad(chunk, (0, window - chunk.numel()))
+
+                event = iterator(chunk, return_seconds=False)
+                if not event:
+                    continue
+                if "start" in event:
+                    start = event["start"]
+                elif "end" in event and start is not None:
+                    segments.append({"start": start, "end": min(event["end"], n)})
+                    start = None
+                    if stop_at_first_end:
+                        break
+        finally:
+            iterator.reset_states()
+
+        # Speech still open at the end of the clip runs to the last sample
+        if start is not None:
+            segments.append({"start": start, "end": n})
+
+        # Drop clicks and pops shorter than the minimum speech duration
+        return [seg for seg in segments if seg["end"] - seg["start"] >= min_speech]
+
+    def process_segments(self, audio: np.ndarray) -> List[Tuple[int, int]]:
+        """
+        Find speech segments without copying any audio.
 
         Args:
             audio: Audio data as float32 numpy array, range [-1.0, 1.0]
 
         Returns:
-            Trimmed audio containing only speech, or None if no speech detected
+            List of (start, end) sample indices into audio; empty if no
+            speech was detected. If VAD itself fails, the whole clip is
+            returned as one segment rather than losing the utterance.
         """
         logger.info(f"Processing audio with Silero VAD: {len(audio)} samples "
                      f"({len(audio) / self.sample_rate:.2f}s)")
 
         # Convert numpy float32 to torch tensor (Silero requires this)
-        audio_tensor = torch.from_numpy(audio).float()
-
-        # Ensure 1D (mono)
-        if audio_tensor.dim() > 1:
-            audio_tensor = audio_tensor.squeeze()
+        audio_tensor = self._to_model_tensor(audio)
 
         # Get speech timestamps (sample indices)
         try:
-            speech_timestamps = get_speech_timestamps(
-                audio_tensor,
-                self.model,
-                sampling_rate=self.sample_rate,
-                threshold=self.threshold,
-                min_speech_duration_ms=self.min_speech_duration_ms,
-                min_silence_duration_ms=self.min_silence_duration_ms,
-                speech_pad_ms=self.speech_pad_ms,
-                return_seconds=False,  # Return sample indices, not seconds
-            )
+            speech_timestamps = self._speech_timestamps(audio_tensor)
         except Exception as e:
             logger.error(f"Silero VAD processing failed: {e}", exc_info=True)
-            # Fallback: return original audio rather than losing the utterance
             logger.warning("Returning unprocessed audio as fallback")
-            return audio
+            return [(0, len(audio))]
 
         if not speech_timestamps:
             logger.warning("No speech detected by Silero VAD")
-            return None
+            return []
 
         # Log detected segments
         for i, segment in enumerate(speech_timestamps):
@@ -135,19 +275,33 @@ class SileroVADProcessor:
             end_sec = segment['end'] / self.sample_rate
             logger.debug(f"Speech segment {i}: {start_sec:.2f}s - {end_sec:.2f}s")
 
-        # Extract and concatenate all speech segments
-        speech_chunks = []
-        for segment in speech_timestamps:
-            start = segment['start']
-            end = segment['end']
-            speech_chunks.append(audio[start:end])
+        return [(segment['start'], segment['end']) for segment in speech_timestamps]
+
+    def process(self, audio: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Process audio and extract speech segments.
+
+        Same interface as the old VADProcessor — takes float32 audio,
+        returns trimmed float32 audio with only speech, or None. Thin
+        wrapper over process_segments; a single segment comes back as a
+        view of the input, several are concatenated.
+
+        Args:
+            audio: Audio data as float32 numpy array, range [-1.0, 1.0]
+
+        Returns:
+            Trimmed audio containing only speech, or None if no speech detected
+        """
+        segments = self.process_segments(audio)
+        if not segments:
+            return None
 
-        speech_audio = np.concatenate(speech_chunks)
+        speech_audio = join_segments(audio, segments)
 
         logger.info(
             f"Silero VAD complete: {len(audio)} -> {len(speech_audio)} samples "
             f"({len(speech_audio) / self.sample_rate:.2f}s), "
-            f"{len(speech_timestamps)} segment(s)"
+            f"{len(segments)} segment(s)"
         )
 
         return speech_audio
@@ -5,14 +5,18 @@ This does NOT trim audio or run the pipeline. It only signals endpoint.
 import torch
 import numpy as np
 import logging
-from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List
 
 from silero_vad import load_silero_vad, VADIterator
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Initial size of the per-session conversion buffer (grown if a chunk is larger)
+_CHUNK_BUFFER_SAMPLES = 4096
+_PCM16_SCALE = np.float32(1.0 / 32768.0)
+
 
 @dataclass
 class StreamingVADState:
@@ -21,11 +25,22 @@ class StreamingVADState:
     total_samples: int = 0
     pending_endpoint: bool = False
     last_end_sample: Optional[int] = None
+    # Speech segments seen so far ({'start', 'end'} sample dicts) and the
+    # start of the segment still open, reusable by the offline pipeline
+    speech_segments: List[Dict[str, int]] = field(default_factory=list)
+    speech_start: Optional[int] = None
+    # Reused float32 buffer for PCM16 conversion (its numpy view shares memory)
+    _buf: torch.Tensor = field(
+        default_factory=lambda: torch.empty(_CHUNK_BUFFER_SAMPLES, dtype=torch.float32),
+        repr=False,
+    )
 
     def reset(self):
         self.total_samples = 0
         self.pending_endpoint = False
         self.last_end_sample = None
+        self.speech_segments = []
+        self.speech_start = None
         self.vad_iterator.reset_states()
 
 
@@ -35,7 +50,13 @@ _vad_model = None
 def _get_vad_model():
     global _vad_model
     if _vad_model is None:
-        _vad_model = load_silero_vad()
+        model = load_silero_vad()
+        if settings.MODEL_WARMUP:
+            # Step one silent chunk so the first session skips JIT warmup
+            warm = VADIterator(model, sampling_rate=settings.AUDIO_SAMPLE_RATE)
+            warm(torch.zeros(512 if settings.AUDIO_SAMPLE_RATE == 16000 else 256))
+            warm.reset_states()
+        _vad_model = model
     return _vad_model
 
 
@@ -46,6 +67,7 @@ def create_streaming_vad_state(session_id: str) -> StreamingVADState:
         sampling_rate=settings.AUDIO_SAMPLE_RATE,
         threshold=getattr(settings, "SILERO_VAD_THRESHOLD", 0.35),
         min_silence_duration_ms=getattr(settings, "SILERO_VAD_MIN_SILENCE_MS", 150),
+        speech_pad_ms=getattr(settings, "SILERO_VAD_SPEECH_PAD_MS", 60),
     )
     return StreamingVADState(session_id=session_id, vad_iterator=vad_iterator)
 
@@ -58,9 +80,14 @@ def process_chunk(state: StreamingVADState, chunk_bytes: bytes) -> Dict[str, Any
     - end_sample: Optional[int]
     """
     pcm16 = np.frombuffer(chunk_bytes, dtype=np.int16)
-    audio_float = pcm16.astype(np.float32) / 32768.0
-    state.total_samples += len(audio_float)
-    chunk_tensor = torch.from_numpy(audio_float).float()
+    n = len(pcm16)
+    if state._buf.numel() < n:
+        state._buf = torch.empty(n, dtype=torch.float32)
+    # One fused int16 -> float32 scale straight into the session buffer
+    # (multiply by a float32 1/32768: no promotion to float64, no divide)
+    np.multiply(pcm16, _PCM16_SCALE, out=state._buf.numpy()[:n])
+    state.total_samples += n
+    chunk_tensor = state._buf[:n]
 
     try:
         speech_dict = state.vad_iterator(chunk_tensor, return_seconds=False)
@@ -69,6 +96,7 @@ def process_chunk(state: StreamingVADState, chunk_bytes: bytes) -> Dict[str, Any
         return {"end_detected": False, "speech_resumed": False, "end_sample": None}
 
     if speech_dict and "start" in speech_dict:
+        state.speech_start = speech_dict["start"]
         resumed = False
         if state.pending_endpoint:
             resumed = True
@@ -77,8 +105,25 @@ def process_chunk(state: StreamingVADState, chunk_bytes: bytes) -> Dict[str, Any
         return {"end_detected": False, "speech_resumed": resumed, "end_sample": None}
 
     if speech_dict and "end" in speech_dict:
+        if state.speech_start is not None:
+            state.speech_segments.append({"start": state.speech_start, "end": speech_dict["end"]})
+            state.speech_start = None
         state.pending_endpoint = True
         state.last_end_sample = state.total_samples
         return {"end_detected": True, "speech_resumed": False, "end_sample": state.last_end_sample}
 
     return {"end_detected": False, "speech_resumed": False, "end_sample": None}
+
+
+def get_speech_segments(state: StreamingVADState) -> List[Dict[str, int]]:
+    """
+    Speech segments detected so far, in samples from the start of the
+    stream. A segment still open runs to the last sample seen. Segments
+    shorter than SILERO_VAD_MIN_SPEECH_MS are dropped, as the offline VAD
+    does.
+    """
+    segments = list(state.speech_segments)
+    if state.speech_start is not None:
+        segments.append({"start": state.speech_start, "end": state.total_samples})
+    min_speech = settings.AUDIO_SAMPLE_RATE * getattr(settings, "SILERO_VAD_MIN_SPEECH_MS", 250) // 1000
+    return [seg for seg in segments if seg["end"] - seg["start"] >= min_speech]
@@ -3,16 +3,19 @@ Voice Processing Pipeline
 Orchestrates all processors to convert audio to text response
 """
 import logging
+import threading
 import numpy as np
-from typing import Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import time
 
+from app.pipeline.executor import run_in_pool
 from app.pipeline.processors.noise_reducer import NoiseReducer
-from app.pipeline.processors.vad_silero import SileroVADProcessor as VADProcessor
+from app.pipeline.processors.vad_silero import SileroVADProcessor as VADProcessor, join_segments
 from app.pipeline.processors.skills_router import SkillsRouterProcessor
 from app.pipeline.processors.llm_ollama import OllamaLLMProcessor
 from app.pipeline.processors.response_shaper import ResponseShaperProcessor
 from app.config import settings
+from app.utils.audio_io import pcm16_to_float32
 
 logger = logging.getLogger(__name__)
 
@@ -36,38 +39,152 @@ def _create_stt_processor():
         from app.pipeline.processors.stt_elevenlabs import ElevenLabsSTTProcessor
         logger.info(f"Using ElevenLabs STT engine (model={settings.ELEVENLABS_STT_MODEL})")
         return ElevenLabsSTTProcessor()
+    elif engine == "openvino-distil":
+        from app.pipeline.processors.stt_openvino import OpenVINOWhisperSTTProcessor
+        logger.info(f"Using Distil-Whisper OpenVINO STT engine (model={settings.OPENVINO_STT_MODEL_ID})")
+        return OpenVINOWhisperSTTProcessor()
+    elif engine == "trtllm-whisper":
+        from app.pipeline.processors.stt_trtllm import TensorRTWhisperSTTProcessor
+        logger.info(f"Using TensorRT-LLM Whisper STT engine (engines={settings.TRTLLM_ENGINE_DIR})")
+        return TensorRTWhisperSTTProcessor()
     else:
         raise ValueError(
             f"Unknown STT_ENGINE '{engine}'. "
-            f"Supported: 'whisper', 'moonshine', 'canary-qwen', 'elevenlabs'"
+            f"Supported: 'whisper', 'moonshine', 'canary-qwen', 'elevenlabs', 'openvino-distil', 'trtllm-whisper'"
         )
 
 
+def _release_vram():
+    """
+    Return cached CUDA blocks to the driver between stages (opt-in via
+    FREE_VRAM_BETWEEN_STAGES). Lets STT, LLM and TTS models share a small
+    GPU; costs re-allocation on the next stage, so it stays off by default.
+    """
+    if not settings.FREE_VRAM_BETWEEN_STAGES:
+        return
+    import torch
+    if torch.cuda.is_available():
+        torch.cuda.synchronize()
+        torch.cuda.empty_cache()
+
+
+def _clip_segments(
+    vad_segments: Optional[List[Dict[str, int]]],
+    n_samples: int,
+) -> List[Tuple[int, int]]:
+    """(start, end) pairs from streaming VAD segments, clipped to the audio"""
+    if not vad_segments:
+        return []
+    spans = []
+    for seg in vad_segments:
+        start, end = max(0, int(seg["start"])), min(n_samples, int(seg["end"]))
+        if end > start:
+            spans.append((start, end))
+    return spans
+
+
 class VoicePipeline:
     """Voice processing pipeline"""
 
     def __init__(self):
-        """Initialize voice pipeline with all processors"""
+        """
+        Initialize voice pipeline.
+
+        Noise reduction and routing are cheap and built here; VAD, STT, LLM
+        and the response shaper are built on first use (or by the startup
+        warmup), so constructing the pipeline never blocks on a model load.
+        """
         logger.info("Initializing voice pipeline...")
 
-        # Initialize processors
-        self.noise_reducer = NoiseReducer()
-        self.vad = VADProcessor()
-        self.stt = _create_stt_processor()
+        self.noise_reducer = NoiseReducer(stationary=settings.NOISE_REDUCE_STATIONARY)
         self.skills_router = SkillsRouterProcessor()
-        self.llm = OllamaLLMProcessor()
-        self.response_shaper = ResponseShaperProcessor()
+
+        self._vad = None
+        self._stt = None
+        self._llm = None
+        self._response_shaper = None
+        # Several pool threads may touch a processor first at the same time
+        self._init_lock = threading.Lock()
 
         logger.info("Voice pipeline initialized successfully")
 
+    def _lazy(self, attr: str, factory):
+        """Build self.<attr> with factory on first use (once across threads)"""
+        value = getattr(self, attr)
+        if value is None:
+            with self._init_lock:
+                value = getattr(self, attr)
+                if value is None:
+                    value = factory()
+                    setattr(self, attr, value)
+        return value
+
+    @property
+    def vad(self):
+        return self._lazy("_vad", VADProcessor)
+
+    @property
+    def stt(self):
+        return self._lazy("_stt", _create_stt_processor)
+
+    @property
+    def llm(self):
+        return self._lazy("_llm", OllamaLLMProcessor)
+
+    @property
+    def response_shaper(self):
+        return self._lazy("_response_shaper", ResponseShaperProcessor)
+
+    def _transcribe(
+        self,
+        audio: np.ndarray,
+        sample_rate: int,
+        vad_segments: Optional[List[Dict[str, int]]] = None,
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Noise reduction -> VAD -> STT.
+
+        vad_segments from streaming endpointing, when given, stand in for
+        the offline VAD pass.
+
+        Returns:
+            (transcript, error) — exactly one of them is set
+        """
+        if audio.dtype == np.int16:
+            audio = pcm16_to_float32(audio)
+        clean_audio = self.noise_reducer.process(audio)
+        segments = _clip_segments(vad_segments, len(clean_audio))
+        if not segments:
+            segments = self.vad.process_segments(clean_audio)
+        else:
+            logger.info(f"Reusing {len(segments)} streaming VAD segment(s), skipping offline VAD")
+        if not segments:
+            return None, "No speech detected"
+
+        # Engines that take segment offsets decode straight from the
+        # denoised buffer; the rest get a view (one segment) or one joined copy
+        if hasattr(self.stt, "transcribe_segments"):
+            transcript = self.stt.transcribe_segments(clean_audio, segments, sample_rate)
+        else:
+            vad_audio = join_segments(clean_audio, segments)
+            transcript = self.stt.transcribe(vad_audio, sample_rate)
+        _release_vram()
+        if not transcript:
+            return None, "Transcription failed or empty"
+        return transcript, None
+
     def transcribe_and_route(
         self,
         audio: np.ndarray,
         sample_rate: int = None,
+        vad_segments: Optional[List[Dict[str, int]]] = None,
     ) -> Dict[str, Any]:
         """
         Run the pipeline up through STT + skills routing, but stop before LLM.
 
+        Audio may be float32 or raw int16 PCM; int16 is converted to float32
+        once here, right before noise reduction.
+
         Returns dict with keys:
           transcript, route, math_response, error
         """
@@ -82,15 +199,9 @@ class VoicePipeline:
         }
 
         try:
-            clean_audio = self.noise_reducer.process(audio)
-            vad_audio = self.vad.process(clean_audio)
-            if vad_audio is None:
-                result["error"] = "No speech detected"
-                return result
-
-            transcript = self.stt.transcribe(vad_audio, sample_rate)
-            if not transcript:
-                result["error"] = "Transcription failed or empty"
+            transcript, error = self._transcribe(audio, sample_rate, vad_segments=vad_segments)
+            if error:
+                result["error"] = error
                 return result
 
             result["transcript"] = transcript
@@ -105,21 +216,33 @@ class VoicePipeline:
 
         return result
 
+    async def transcribe_and_route_async(
+        self,
+        audio: np.ndarray,
+        sample_rate: int = None,
+        vad_segments: Optional[List[Dict[str, int]]] = None,
+    ) -> Dict[str, Any]:
+        """transcribe_and_route on the shared pipeline thread pool"""
+        return await run_in_pool(self.transcribe_and_route, audio, sample_rate, vad_segments)
+
     def process(
         self,
         audio: np.ndarray,
         sample_rate: int = None,
         context: list = None,
         system_prompt: str = None,
+        vad_segments: Optional[List[Dict[str, int]]] = None,
     ) -> Dict[str, Any]:
         """
         Process audio through complete pipeline
 
         Args:
-            audio: Audio data as float32 numpy array
+            audio: Audio data as float32 or int16 PCM numpy array
             sample_rate: Sample rate in Hz
             context: Conversation context (previous turns)
             system_prompt: Optional override for the LLM system prompt
+            vad_segments: Optional speech segments from streaming VAD
+                          ({'start', 'end'} samples); skips the VAD pass
 
         Returns:
             Dictionary with:
@@ -147,25 +270,11 @@ class VoicePipeline:
             logger.info("Starting voice pipeline processing")
             logger.info("=" * 60)
 
-            # Step 1: Noise Reduction
-            logger.info("Step 1: Noise reduction...")
-            clean_audio = self.noise_reducer.process(audio)
-
-            # Step 2: VAD - Trim silence
-            logger.info("Step 2: VAD processing...")
-            vad_audio = self.vad.process(clean_audio)
-
-            if vad_audio is None:
-                result["error"] = "No speech detected"
-                logger.warning(result["error"])
-                return result
-
-            # Step 3: STT - Transcribe
-            logger.info("Step 3: STT processing...")
-            transcript = self.stt.transcribe(vad_audio, sample_rate)
-
-            if not transcript:
-                result["error"] = "Transcription failed or empty"
+            # Steps 1-3: Noise reduction -> VAD -> STT
+            logger.info("Steps 1-3: Noise reduction, VAD, STT...")
+            transcript, error = self._transcribe(audio, sample_rate, vad_segments=vad_segments)
+            if error:
+                result["error"] = error
                 logger.warning(result["error"])
                 return result
 
@@ -191,6 +300,8 @@ class VoicePipeline:
                     system_prompt=system_prompt,
                 )
 
+                _release_vram()
+
                 if not llm_response:
                     result["error"] = "LLM generation failed"
                     logger.warning(result["error"])
@@ -3,19 +3,59 @@ import asyncio
 import logging
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
 
+# Cap on audio directories removed at once (each rmtree holds directory fds)
+_MAX_CONCURRENT_DELETES = 32
+
+
+def _remove_flat_dir(path: str) -> None:
+    """Remove a directory of plain files (session audio dirs are flat)
+
+    Unlinks straight from the scandir entries, whose file type comes with
+    the directory listing, and hands any nested directory to shutil.rmtree.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def _remove_audio_dir(session_id: str) -> bool:
+    """Delete one session's audio directory (runs on a cleanup worker thread)
+
+    Returns:
+        True if a directory was deleted
+    """
+    audio_dir = os.path.join(settings.AUDIO_DIR, session_id)
+    try:
+        _remove_flat_dir(audio_dir)
+    except FileNotFoundError:
+        return False
+    except Exception as e:
+        logger.error(f"Failed to delete audio directory {audio_dir}: {e}")
+        return False
+
+    logger.debug(f"Deleted audio directory: {audio_dir}")
+    return True
+
+
 async def cleanup_old_data_task() -> None:
     """Background task to delete sessions and audio older than retention period
 
     This task runs continuously, sleeping for CLEANUP_INTERVAL_HOURS between runs.
     It deletes:
-    1. Database records (sessions and turns) older than DATA_RETENTION_DAYS
-    2. Associated audio files from disk
+    1. Database records (sessions and turns) older than DATA_RETENTION_DAYS,
+       in a single DELETE ... RETURNING statement
+    2. Associated audio files from disk, a bounded number at a time
 
     The task gracefully handles cancellation and errors.
     """
@@ -42,38 +82,27 @@ async def cleanup_old_data_task() -> None:
             async with get_db_session() as db_session:
                 repo = SessionRepository(db_session)
 
-                # Get expired sessions
-                expired = await repo.get_expired_sessions(cutoff_date)
-                logger.info(f"Found {len(expired)} expired sessions to delete")
-
-                if not expired:
-                    logger.info("No expired sessions found, cleanup complete")
-                    continue
-
-                # Delete audio files first
-                audio_deleted = 0
-                for session in expired:
-                    audio_dir = os.path.join(settings.AUDIO_DIR, session.session_id)
-                    if os.path.exists(audio_dir):
-                        try:
-                            shutil.rmtree(audio_dir)
-                            audio_deleted += 1
-                            logger.debug(f"Deleted audio directory: {audio_dir}")
-                        except Exception as e:
-                            logger.error(f"Failed to delete audio directory {audio_dir}: {e}")
-
-                logger.info(f"Deleted {audio_deleted} audio directories")
-
-                # Delete from database (cascades to turns)
-                deleted_count = 0
-                for session in expired:
-                    try:
-                        if await repo.delete(session.session_id):
-                            deleted_count += 1
-                    except Exception as e:
-                        logger.error(f"Failed to delete session {session.session_id}: {e}")
-
-                logger.info(f"Cleanup completed: deleted {deleted_count} sessions from database")
+                # Delete from database in one round-trip (cascades to turns)
+                expired_ids = await repo.delete_expired(cutoff_date)
+
+            if not expired_ids:
+                logger.info("No expired sessions found, cleanup complete")
+                continue
+
+            logger.info(f"Deleted {len(expired_ids)} expired sessions from database")
+
+            # Then remove their audio directories concurrently, on a pool of
+            # our own so the sweep never ties up the loop's default executor
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(
+                max_workers=min(_MAX_CONCURRENT_DELETES, len(expired_ids)),
+                thread_name_prefix="cleanup",
+            ) as pool:
+                results = await asyncio.gather(
+                    *(loop.run_in_executor(pool, _remove_audio_dir, session_id)
+                      for session_id in expired_ids)
+                )
+            logger.info(f"Cleanup completed: deleted {sum(results)} audio directories")
 
         except asyncio.CancelledError:
             logger.info("Cleanup task cancelled, shutting down")
@@ -0,0 +1,38 @@
+"""
+Persistent background event loop for running coroutines from sync code
+
+Sync wrappers around async clients (edge-tts, ElevenLabs) are called from
+worker threads. Submitting to one long-lived loop avoids building and
+tearing down an event loop on every call.
+"""
+import asyncio
+import logging
+import threading
+from typing import Any, Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared loop, starting its daemon thread on first use"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="background-loop", daemon=True
+            ).start()
+            logger.info("Background event loop started")
+    return _loop
+
+
+def run_coroutine(coro: Coroutine) -> Any:
+    """
+    Run a coroutine on the background loop and block until it finishes
+
+    Must not be called from the background loop itself (it would deadlock).
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_background_loop()).result()
@@ -5,13 +5,24 @@ import sounddevice as sd
 import soundfile as sf
 import numpy as np
 import logging
-from typing import Optional, Tuple
+import math
+import threading
+from typing import Dict, Optional, Tuple
 import os
 
 from app.config import settings
 
+try:
+    # Optional: SIMD (AVX2/NEON) resampler, used over resample_poly when installed
+    import soxr
+except ImportError:
+    soxr = None
+
 logger = logging.getLogger(__name__)
 
+# Header size of the PCM_16 WAV files libsndfile writes
+_WAV_HEADER_BYTES = 44
+
 
 def capture_audio(duration: float, sample_rate: int = None) -> np.ndarray:
     """
@@ -51,12 +62,39 @@ def capture_audio(duration: float, sample_rate: int = None) -> np.ndarray:
         raise
 
 
+def pcm16_to_float32(pcm: np.ndarray) -> np.ndarray:
+    """
+    Convert int16 PCM to float32 in range [-1.0, 1.0]
+
+    Single pass into one preallocated buffer (no int16->float32 temporary).
+    """
+    audio = np.empty(pcm.size, dtype=np.float32)
+    np.multiply(pcm, np.float32(1.0 / 32768.0), out=audio)
+    return audio
+
+
+def float_to_pcm16(samples) -> np.ndarray:
+    """
+    Convert float audio to int16 PCM, scaling down only if it peaks above 1.0
+
+    One peak scan, one fused scale pass, one cast; sf.write with an int16
+    buffer and subtype PCM_16 then writes the samples as they are.
+    """
+    samples = np.asarray(samples, dtype=np.float32)
+    if samples.size == 0:
+        return np.zeros(0, dtype=np.int16)
+    # max/min instead of abs().max() — no temporary array
+    peak = max(float(samples.max()), -float(samples.min()))
+    scaled = np.multiply(samples, np.float32(32767.0 / max(peak, 1.0)))
+    return scaled.astype(np.int16)
+
+
 def save_wav(audio: np.ndarray, file_path: str, sample_rate: int = None) -> None:
     """
     Save audio data to WAV file
 
     Args:
-        audio: Audio data as numpy array
+        audio: Audio data as numpy array (float32, or int16 PCM)
         file_path: Path to save WAV file
         sample_rate: Sample rate in Hz (default from settings)
     """
@@ -69,18 +107,24 @@ def save_wav(audio: np.ndarray, file_path: str, sample_rate: int = None) -> None
     logger.info(f"Saving WAV to: {file_path}")
 
     try:
-        # Ensure audio is in correct format
-        if audio.dtype != np.float32:
-            audio = audio.astype(np.float32)
-
-        # Clip to valid range
-        audio = np.clip(audio, -1.0, 1.0)
-
-        # Save as WAV
-        sf.write(file_path, audio, sample_rate)
-
-        file_size = os.path.getsize(file_path)
-        logger.info(f"WAV saved: {file_size} bytes")
+        # int16 PCM is already in the file's sample format — write it as is
+        if audio.dtype != np.int16:
+            if audio.dtype != np.float32:
+                # astype already made a private copy: clip that in place
+                audio = audio.astype(np.float32)
+                np.clip(audio, -1.0, 1.0, out=audio)
+            else:
+                # Clip to valid range (never modify the caller's array)
+                audio = np.clip(audio, -1.0, 1.0)
+
+        # libsndfile converts float to PCM_16 (rounded) chunk by chunk while
+        # writing, so no int16 copy of the whole clip is made here
+        channels = 1 if audio.ndim == 1 else audio.shape[1]
+        with sf.SoundFile(file_path, 'w', sample_rate, channels, 'PCM_16') as wav:
+            wav.write(audio)
+
+        # Canonical 44-byte PCM header + 2 bytes per sample, no extra stat
+        logger.info(f"WAV saved: {_WAV_HEADER_BYTES + audio.size * 2} bytes")
 
     except Exception as e:
         logger.error(f"Error saving WAV: {e}", exc_info=True)
@@ -102,9 +146,19 @@ def load_wav(file_path: str) -> Tuple[np.ndarray, int]:
     try:
         audio, sample_rate = sf.read(file_path, dtype='float32')
 
-        # Convert to mono if stereo
-        if len(audio.shape) > 1:
-            audio = np.mean(audio, axis=1)
+        # Convert to mono if stereo: element-wise adds over the channel
+        # columns into one buffer, then an in-place scale (a mean reduction
+        # along the 2-wide channel axis is far slower)
+        if audio.ndim > 1:
+            n_channels = audio.shape[1]
+            if n_channels == 1:
+                audio = audio[:, 0].copy()
+            else:
+                mono = np.add(audio[:, 0], audio[:, 1])
+                for channel in range(2, n_channels):
+                    np.add(mono, audio[:, channel], out=mono)
+                np.multiply(mono, np.float32(1.0 / n_channels), out=mono)
+                audio = mono
 
         logger.info(f"Loaded {len(audio)} samples at {sample_rate}Hz")
         return audio, sample_rate
@@ -114,10 +168,57 @@ def load_wav(file_path: str) -> Tuple[np.ndarray, int]:
         raise
 
 
+# Polyphase anti-aliasing filters, designed once per (up, down) rate pair
+# and shared by every session: (taps scaled by up and pre-padded to centre
+# the output, samples to trim from the front of the upfirdn output)
+_FIR_CACHE: Dict[Tuple[int, int], Tuple[np.ndarray, int]] = {}
+_FIR_CACHE_LOCK = threading.Lock()
+
+
+def _resample_filter(up: int, down: int) -> Tuple[np.ndarray, int]:
+    """
+    Anti-aliasing FIR filter for polyphase resampling, cached per rate pair.
+
+    Same design resample_poly uses internally (Kaiser window, beta 5.0,
+    10 zero-crossings per side, gain of up), zero-padded in front so the
+    output samples land at the filter centre.
+    """
+    key = (up, down)
+    cached = _FIR_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    with _FIR_CACHE_LOCK:
+        cached = _FIR_CACHE.get(key)
+        if cached is None:
+            from scipy import signal
+
+            max_rate = max(up, down)
+            half_len = 10 * max_rate
+            h = signal.firwin(2 * half_len + 1, 1.0 / max_rate, window=("kaiser", 5.0))
+            n_pre_pad = down - half_len % down
+            h = np.concatenate((np.zeros(n_pre_pad), h * up)).astype(np.float32)
+            cached = (h, (half_len + n_pre_pad) // down)
+            _FIR_CACHE[key] = cached
+    return cached
+
+
+def _upfirdn_len(len_h: int, n_in: int, up: int, down: int) -> int:
+    """Output length of upfirdn for a filter of len_h taps"""
+    return -(-((n_in + (len_h + (-len_h % up)) // up - 1) * up) // down)
+
+
 def resample_audio(audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
     """
     Resample audio to different sample rate
 
+    Uses soxr (SIMD-vectorized, "HQ" quality) when it is installed.
+    Otherwise falls back to polyphase filtering (the resample_poly filter,
+    cached per rate pair and applied with scipy.signal.upfirdn) with the
+    rate ratio reduced to lowest terms, e.g. 48000 -> 16000 is
+    up=1, down=3 and 44100 -> 16000 is up=160, down=441. This is
+    O(N * taps) rather than the full-length FFTs of scipy.signal.resample.
+
     Args:
         audio: Audio data
         orig_sr: Original sample rate
@@ -132,15 +233,34 @@ def resample_audio(audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarra
     logger.info(f"Resampling: {orig_sr}Hz -> {target_sr}Hz")
 
     try:
+        # Contiguous float32 in, so neither backend makes an internal copy
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+
+        if soxr is not None:
+            return soxr.resample(audio, orig_sr, target_sr, quality="HQ")
+
         from scipy import signal
 
-        # Calculate resampling ratio
-        num_samples = int(len(audio) * target_sr / orig_sr)
+        # Reduce the rate ratio to the smallest polyphase filter bank
+        g = math.gcd(orig_sr, target_sr)
+        up, down = target_sr // g, orig_sr // g
+
+        # Polyphase filter straight through upfirdn with the cached taps
+        # (the same result as resample_poly, without redesigning the filter)
+        h, n_pre_remove = _resample_filter(up, down)
+        n_in = len(audio)
+        n_out = -(-n_in * up // down)
+
+        # Short inputs need trailing zero taps to cover every output sample
+        n_post_pad = 0
+        while _upfirdn_len(len(h) + n_post_pad, n_in, up, down) < n_out + n_pre_remove:
+            n_post_pad += 1
+        if n_post_pad:
+            h = np.concatenate((h, np.zeros(n_post_pad, dtype=np.float32)))
 
-        # Resample
-        resampled = signal.resample(audio, num_samples)
+        resampled = signal.upfirdn(h, audio, up, down)[n_pre_remove:n_pre_remove + n_out]
 
-        return resampled.astype(np.float32)
+        return resampled.astype(np.float32, copy=False)
 
     except Exception as e:
         logger.error(f"Error resampling: {e}", exc_info=True)
@@ -159,18 +279,17 @@ def normalize_audio(audio: np.ndarray, target_level: float = 0.5) -> np.ndarray:
         Normalized audio
     """
     try:
-        # Calculate RMS
-        rms = np.sqrt(np.mean(audio ** 2))
+        # RMS via a dot product — one BLAS pass, no squared temporary
+        flat = np.ravel(audio)
+        rms = float(np.sqrt(np.dot(flat, flat) / flat.size)) if flat.size else 0.0
 
-        if rms > 0:
-            # Scale to target level
-            scaling_factor = target_level / rms
-            audio = audio * scaling_factor
+        # Scale into one new buffer, then clip it in place (the input is
+        # left untouched)
+        scaling_factor = target_level / rms if rms > 0 else 1.0
+        out = np.multiply(audio, scaling_factor)
+        np.clip(out, -1.0, 1.0, out=out)
 
-        # Clip to prevent clipping
-        audio = np.clip(audio, -1.0, 1.0)
-
-        return audio
+        return out
 
     except Exception as e:
         logger.error(f"Error normalizing audio: {e}", exc_info=True)
@@ -187,10 +306,12 @@ def audio_to_int16(audio: np.ndarray) -> np.ndarray:
     Returns:
         Audio as int16
     """
-    # Scale to int16 range
-    audio = np.clip(audio, -1.0, 1.0)
-    audio = (audio * 32767).astype(np.int16)
-    return audio
+    # Clip into a scratch buffer (the input is left untouched), then scale
+    # straight into the int16 output; the unsafe cast truncates like astype
+    clipped = np.clip(audio, -1.0, 1.0)
+    out = np.empty(clipped.shape, dtype=np.int16)
+    np.multiply(clipped, clipped.dtype.type(32767.0), out=out, casting='unsafe')
+    return out
 
 
 def int16_to_audio(audio: np.ndarray) -> np.ndarray:
@@ -203,5 +324,7 @@ def int16_to_audio(audio: np.ndarray) -> np.ndarray:
     Returns:
         Audio as float32 (-1.0 to 1.0)
     """
-    audio = audio.astype(np.float32) / 32767.0
-    return audio
+    # Fused cast + scale into one preallocated buffer
+    out = np.empty(audio.shape, dtype=np.float32)
+    np.multiply(audio, np.float32(1.0 / 32767.0), out=out)
+    return out
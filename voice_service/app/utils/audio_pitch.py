@@ -17,9 +17,11 @@ The pitch_factor ratio is approximated with a small rational number
 resample_poly can use a compact polyphase filter bank.  The approximation
 error is < 0.5 semitones for all values in the ±8 semitone range.
 """
+import io
 import logging
 import math
 from fractions import Fraction
+from typing import Optional
 
 import numpy as np
 import soundfile as sf
@@ -69,16 +71,20 @@ def shift_pitch(audio: np.ndarray, semitones: float) -> np.ndarray:
     return stretched.astype(np.float32)
 
 
-def pitch_shift_wav_inplace(path: str, semitones: float) -> None:
+def pitch_shift_wav_inplace(path: str, semitones: float) -> Optional[bytes]:
     """
     Read a WAV file, shift its pitch, and overwrite it in place.
 
     Args:
         path:      Absolute path to the WAV file.
         semitones: Semitones to shift (positive = higher).
+
+    Returns:
+        The WAV bytes that were written, so callers can use them without
+        re-reading the file; None if nothing was written.
     """
     if abs(semitones) < 0.01:
-        return
+        return None
 
     try:
         audio, sample_rate = sf.read(path, dtype="float32")
@@ -90,9 +96,15 @@ def pitch_shift_wav_inplace(path: str, semitones: float) -> None:
         else:
             shifted = shift_pitch(audio, semitones)
 
-        sf.write(path, shifted, sample_rate)
+        buffer = io.BytesIO()
+        sf.write(buffer, shifted, sample_rate, format="WAV", subtype="PCM_16")
+        wav_bytes = buffer.getvalue()
+        with open(path, "wb") as f:
+            f.write(wav_bytes)
         logger.debug(f"Pitch shifted {path} by {semitones:+.1f} semitones")
+        return wav_bytes
 
     except Exception as e:
         # Pitch shift is a "nice to have" — log and continue rather than fail
         logger.warning(f"Pitch shift failed for {path}: {e}")
+        return None
@@ -0,0 +1,92 @@
+"""
+Shared httpx connection pools for the cloud STT/TTS SDKs
+
+The OpenAI and ElevenLabs clients all reuse these, so TLS sessions to the
+vendor APIs stay warm across turns and concurrent calls share one bounded
+keep-alive pool (one per event loop for async calls) instead of each SDK
+client growing its own.
+"""
+import asyncio
+import logging
+import threading
+from typing import Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+# Retries here cover connection failures only (no response received)
+_CONNECT_RETRIES = 3
+
+_client: Optional[httpx.Client] = None
+# One async client per event loop: an AsyncClient's connection pool belongs
+# to the loop it runs on (the service loop, plus the background loop that
+# sync batch wrappers submit to)
+_async_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+_async_clients_lock = threading.Lock()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_http_client() -> httpx.Client:
+    """Shared blocking client (created on first use)"""
+    global _client
+    if _client is None:
+        http2 = _http2_available()
+        _client = httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=http2, limits=_LIMITS, retries=_CONNECT_RETRIES
+            ),
+            timeout=_TIMEOUT,
+        )
+    return _client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Shared async client for the running event loop (created on first use)
+
+    Must be called from a coroutine on the loop that will use the client.
+    """
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        client = _async_clients.get(loop)
+        if client is None:
+            http2 = _http2_available()
+            client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    http2=http2, limits=_LIMITS, retries=_CONNECT_RETRIES
+                ),
+                timeout=_TIMEOUT,
+            )
+            _async_clients[loop] = client
+    return client
+
+
+async def close_http_clients():
+    """Close all shared clients (called on service shutdown)"""
+    global _client
+    current = asyncio.get_running_loop()
+    with _async_clients_lock:
+        async_clients = list(_async_clients.items())
+        _async_clients.clear()
+    # Each async client is closed on its own loop
+    for loop, client in async_clients:
+        if loop is current:
+            await client.aclose()
+        elif loop.is_running():
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            )
+    if _client is not None:
+        _client.close()
+        _client = None
+    logger.info("Shared HTTP clients closed")
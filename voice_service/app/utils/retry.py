@@ -0,0 +1,78 @@
+"""
+Retry with exponential backoff for cloud STT/TTS calls
+
+Rate limits (429), gateway/server errors (5xx) and network timeouts are
+retried with jittered exponential backoff. Auth and quota failures are
+not — retrying those only delays the error.
+"""
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_RETRIABLE_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504})
+_NON_RETRIABLE_MARKERS = ("invalid_api_key", "insufficient_quota", "quota_exceeded")
+# Matched by class name so the SDKs stay optional imports
+_TRANSIENT_TYPE_NAMES = frozenset({
+    "APITimeoutError", "APIConnectionError", "RateLimitError",  # openai
+    "ClientConnectionError", "ServerTimeoutError",  # aiohttp
+    "NoAudioReceived", "WebSocketError",  # edge-tts
+})
+
+
+def is_transient(e: Exception) -> bool:
+    """Whether a failed cloud call is worth retrying"""
+    message = str(e).lower()
+    if any(marker in message for marker in _NON_RETRIABLE_MARKERS):
+        return False
+    if isinstance(e, (httpx.TransportError, TimeoutError, ConnectionError)):
+        return True
+    # SDK API errors (openai, elevenlabs) carry the HTTP status
+    status = getattr(e, "status_code", None)
+    if status is None:
+        status = getattr(getattr(e, "response", None), "status_code", None)
+    if status in _RETRIABLE_STATUS:
+        return True
+    # SDK-specific timeout/connection types (openai, aiohttp under edge-tts)
+    return any(cls.__name__ in _TRANSIENT_TYPE_NAMES for cls in type(e).__mro__)
+
+
+def _backoff(attempt: int) -> float:
+    """Full-jitter delay before retry number attempt (1-based)"""
+    cap = min(settings.CLOUD_RETRY_MAX_DELAY, settings.CLOUD_RETRY_BASE_DELAY * (2 ** (attempt - 1)))
+    return random.uniform(0, cap)
+
+
+def retry_call(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Call func, retrying transient failures; the last error is re-raised"""
+    attempts = max(1, settings.CLOUD_RETRY_ATTEMPTS)
+    for attempt in range(1, attempts + 1):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if attempt == attempts or not is_transient(e):
+                raise
+            delay = _backoff(attempt)
+            logger.warning(f"Transient error ({e}), retry {attempt}/{attempts - 1} in {delay:.2f}s")
+            time.sleep(delay)
+
+
+async def async_retry_call(func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+    """Await func(...), retrying transient failures; the last error is re-raised"""
+    attempts = max(1, settings.CLOUD_RETRY_ATTEMPTS)
+    for attempt in range(1, attempts + 1):
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            if attempt == attempts or not is_transient(e):
+                raise
+            delay = _backoff(attempt)
+            logger.warning(f"Transient error ({e}), retry {attempt}/{attempts - 1} in {delay:.2f}s")
+            await asyncio.sleep(delay)
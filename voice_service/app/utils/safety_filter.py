@@ -2,13 +2,96 @@
 Safety filter utilities for kid-mode content filtering
 """
 import logging
-from typing import List
+import re
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
 
 from app.config import settings
 
+try:
+    # Optional: Aho-Corasick automaton, one linear pass over the text for
+    # any number of keywords
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 
+_SENTENCE_ENDERS = ".!?"
+_SENTENCE_END_PATTERN = re.compile(r"[.!?]")
+
+
+@lru_cache(maxsize=8)
+def _unsafe_matcher(keywords: Tuple[str, ...]) -> Optional[Callable[[str], Optional[str]]]:
+    """
+    Build a case-insensitive keyword matcher once per keyword list
+
+    Returns:
+        Function mapping text to the first unsafe keyword found (or None),
+        or None if there are no keywords
+    """
+    keywords = tuple(k.lower() for k in keywords if k)
+    if not keywords:
+        return None
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+
+        def match(text: str) -> Optional[str]:
+            for _, keyword in automaton.iter(text.lower()):
+                return keyword
+            return None
+
+        return match
+
+    pattern = re.compile(
+        "|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)),
+        re.IGNORECASE,
+    )
+
+    def match(text: str) -> Optional[str]:
+        found = pattern.search(text)
+        return found.group() if found else None
+
+    return match
+
+
+def reset_unsafe_keywords():
+    """Drop cached matchers (call after changing settings.UNSAFE_KEYWORDS in place)"""
+    _unsafe_matcher.cache_clear()
+
+
+def _find_unsafe(text: str, keywords: Optional[List[str]]) -> Optional[str]:
+    """Return the first unsafe keyword in text, logging it, or None"""
+    if keywords is None:
+        keywords = settings.UNSAFE_KEYWORDS
+
+    matcher = _unsafe_matcher(tuple(keywords))
+    keyword = matcher(text) if matcher else None
+    if keyword:
+        logger.warning(f"Unsafe keyword detected: '{keyword}'")
+    return keyword
+
+
+def analyze_text(text: str, keywords: List[str] = None) -> Tuple[int, int, bool]:
+    """
+    Count sentences and words and check for unsafe keywords in one call
+
+    Args:
+        text: Text to analyze
+        keywords: List of unsafe keywords (default from settings)
+
+    Returns:
+        Tuple of (num_sentences, num_words, unsafe)
+    """
+    unsafe = _find_unsafe(text, keywords) is not None
+    return count_sentences(text), count_words(text), unsafe
+
+
 def contains_unsafe_content(text: str, keywords: List[str] = None) -> bool:
     """
     Check if text contains unsafe keywords
@@ -20,17 +103,7 @@ def contains_unsafe_content(text: str, keywords: List[str] = None) -> bool:
     Returns:
         True if unsafe content detected
     """
-    if keywords is None:
-        keywords = settings.UNSAFE_KEYWORDS
-
-    text_lower = text.lower()
-
-    for keyword in keywords:
-        if keyword.lower() in text_lower:
-            logger.warning(f"Unsafe keyword detected: '{keyword}'")
-            return True
-
-    return False
+    return _find_unsafe(text, keywords) is not None
 
 
 def get_safe_fallback() -> str:
@@ -54,12 +127,7 @@ def count_sentences(text: str) -> int:
         Number of sentences
     """
     # Simple sentence counting (periods, exclamation marks, question marks)
-    sentence_enders = ['.', '!', '?']
-
-    count = 0
-    for char in text:
-        if char in sentence_enders:
-            count += 1
+    count = sum(text.count(ender) for ender in _SENTENCE_ENDERS)
 
     # If no sentence enders, count as 1 sentence if non-empty
     if count == 0 and text.strip():
@@ -93,17 +161,13 @@ def truncate_to_sentences(text: str, max_sentences: int = 2) -> str:
     Returns:
         Truncated text
     """
-    sentence_enders = ['.', '!', '?']
-
-    sentence_count = 0
     truncate_pos = len(text)
 
-    for i, char in enumerate(text):
-        if char in sentence_enders:
-            sentence_count += 1
-            if sentence_count >= max_sentences:
-                truncate_pos = i + 1
-                break
+    # Cut just after the Nth sentence ender
+    for sentence_count, match in enumerate(_SENTENCE_END_PATTERN.finditer(text), 1):
+        if sentence_count >= max_sentences:
+            truncate_pos = match.end()
+            break
 
     return text[:truncate_pos].strip()
 
@@ -130,13 +194,7 @@ def truncate_to_words(text: str, max_words: int = 35) -> str:
     truncated_text = ' '.join(truncated_words)
 
     # Try to find last sentence ender
-    sentence_enders = ['.', '!', '?']
-    last_ender = -1
-
-    for i in range(len(truncated_text) - 1, -1, -1):
-        if truncated_text[i] in sentence_enders:
-            last_ender = i
-            break
+    last_ender = max(truncated_text.rfind(ender) for ender in _SENTENCE_ENDERS)
 
     # If found sentence ender in last 80% of text, use that
     if last_ender > len(truncated_text) * 0.8:
@@ -4,8 +4,17 @@ Converts spoken math questions to deterministic calculations
 """
 import re
 import logging
+import threading
+from functools import lru_cache
+from operator import add, mul, sub
 from typing import Optional, Tuple
 
+try:
+    # Optional: Hyperscan compiles the operator keyword scan to a DFA
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,6 +54,37 @@ OPERATORS = {
     "divided": "divide",
 }
 
+# Precompiled patterns (these run on every transcript via the skills router)
+# Operator keywords as whole words/phrases, longest first so "divided by"
+# wins over "divided" and "divide" at the same position
+_OPERATOR_PATTERN = re.compile(
+    r"\b(" + "|".join(re.escape(op) for op in sorted(OPERATORS, key=len, reverse=True)) + r")\b"
+)
+# A run of number words ("two hundred thirty-four"), optionally led by
+# "a"/"an" for one ("a hundred"), longest alternatives first
+_NUMBER_WORD_ALTERNATION = "|".join(sorted(NUMBER_WORDS, key=len, reverse=True))
+_NUMBER_WORD_PATTERN = re.compile(
+    r"\b((?:an|a|" + _NUMBER_WORD_ALTERNATION + r")"
+    r"(?:[\s-]+(?:" + _NUMBER_WORD_ALTERNATION + r"))*)\b"
+)
+# Scale words multiply what came before them instead of adding to it
+_HUNDRED = NUMBER_WORDS["hundred"]
+_THOUSAND = NUMBER_WORDS["thousand"]
+_WHAT_IS_PATTERN = re.compile(r"what is|what's")
+_DIGIT_PATTERN = re.compile(r"\d")
+_QUESTION_WORDS_PATTERN = re.compile(r'\b(what is|what\'s|whats|tell me|calculate)\b')
+_NUMBER_PATTERN = re.compile(r'-?\d+\.?\d*')
+
+# Reverse lookup for small numbers (0-20) used in spoken answers
+_SMALL_NUMBER_WORDS = {v: k for k, v in NUMBER_WORDS.items() if v <= 20}
+
+# Operations that can't fail (divide is handled separately for zero)
+_ARITHMETIC = {
+    "add": add,
+    "subtract": sub,
+    "multiply": mul,
+}
+
 # Response templates
 RESPONSE_TEMPLATES = {
     "add": "{a} plus {b} is {result}.",
@@ -54,6 +94,44 @@ RESPONSE_TEMPLATES = {
 }
 
 
+def _build_operator_detector():
+    """Return a function telling whether lowercased text has an operator keyword"""
+    if hyperscan is None:
+        return lambda text: _OPERATOR_PATTERN.search(text) is not None
+
+    # Same expression as the regex; SINGLEMATCH reports at most one hit
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[_OPERATOR_PATTERN.pattern.encode()],
+        ids=[0],
+        elements=1,
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH],
+    )
+    # The database is read-only and shared, but a scratch space serves one
+    # scan at a time: each pipeline thread gets its own
+    local = threading.local()
+
+    def detect(text: str) -> bool:
+        scratch = getattr(local, "scratch", None)
+        if scratch is None:
+            scratch = local.scratch = hyperscan.Scratch(database)
+        hits = []
+        database.scan(
+            text.encode(),
+            match_event_handler=lambda *_: hits.append(True),
+            scratch=scratch,
+        )
+        return bool(hits)
+
+    return detect
+
+
+_has_operator = _build_operator_detector()
+
+
+# Transcripts reuse a small vocabulary of number phrases, so parsed phrases
+# are memoized (the function is pure)
+@lru_cache(maxsize=1024)
 def text_to_number(text: str) -> Optional[int]:
     """
     Convert text number to integer
@@ -74,15 +152,29 @@ def text_to_number(text: str) -> Optional[int]:
     if text in NUMBER_WORDS:
         return NUMBER_WORDS[text]
 
-    # Try compound numbers (e.g., "twenty three" -> 23)
-    parts = text.split()
-    if len(parts) == 2:
-        if parts[0] in NUMBER_WORDS and parts[1] in NUMBER_WORDS:
-            return NUMBER_WORDS[parts[0]] + NUMBER_WORDS[parts[1]]
-
-    # Handle "a" as 1
-    if text == "a" or text == "an":
-        return 1
+    # Compound numbers: add units and tens, multiply on scale words
+    # (e.g., "twenty three" -> 23, "two hundred thirty four" -> 234)
+    parts = text.replace("-", " ").split()
+    if parts:
+        total = 0
+        current = 0
+        for i, word in enumerate(parts):
+            # Handle "a" as 1 ("a", "a hundred")
+            if i == 0 and word in ("a", "an"):
+                current = 1
+                continue
+            value = NUMBER_WORDS.get(word)
+            if value is None:
+                break
+            if value == _HUNDRED:
+                current = max(current, 1) * _HUNDRED
+            elif value == _THOUSAND:
+                total += max(current, 1) * _THOUSAND
+                current = 0
+            else:
+                current += value
+        else:
+            return total + current
 
     logger.debug(f"Could not parse number: '{text}'")
     return None
@@ -100,20 +192,32 @@ def is_math_query(text: str) -> bool:
     """
     text = text.lower()
 
-    # Check for operator keywords
-    for operator_word in OPERATORS.keys():
-        if operator_word in text:
-            return True
+    # Check for operator keywords (one scan for all of them)
+    if _has_operator(text):
+        return True
 
     # Check for "what is" or "what's" + numbers
-    if ("what is" in text or "what's" in text) and any(c.isdigit() for c in text):
-        return True
+    return bool(_WHAT_IS_PATTERN.search(text) and _DIGIT_PATTERN.search(text))
 
-    # Check for number words + operator
-    has_number = any(word in text for word in NUMBER_WORDS.keys())
-    has_operator = any(op in text for op in OPERATORS.keys())
 
-    return has_number and has_operator
+def match_math(text: str) -> Optional[Tuple[str, float, float]]:
+    """
+    Detect and parse a math query in one call
+
+    A query can only parse if it contains an operator keyword, so the
+    keyword scan doubles as the detector and the text is lowered once.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Tuple of (operator, operand1, operand2), or None if the text is not
+        a math query (or looks like one but can't be parsed)
+    """
+    text = text.lower()
+    if not _has_operator(text):
+        return None
+    return _parse_lowered(text.strip())
 
 
 def parse_math_expression(text: str) -> Optional[Tuple[str, float, float]]:
@@ -126,40 +230,30 @@ def parse_math_expression(text: str) -> Optional[Tuple[str, float, float]]:
     Returns:
         Tuple of (operator, operand1, operand2) or None if can't parse
     """
-    text = text.lower().strip()
+    return _parse_lowered(text.lower().strip())
+
 
+def _parse_lowered(text: str) -> Optional[Tuple[str, float, float]]:
+    """parse_math_expression for text that is already lowercased and stripped"""
     # Remove common question words
-    text = re.sub(r'\b(what is|what\'s|whats|tell me|calculate)\b', '', text)
+    text = _QUESTION_WORDS_PATTERN.sub('', text)
     text = text.strip()
 
     logger.debug(f"Parsing math expression: '{text}'")
 
-    # Try to find operator
-    operator = None
-    operator_word = None
-
-    for op_word, op_name in OPERATORS.items():
-        if op_word in text:
-            operator = op_name
-            operator_word = op_word
-            break
-
-    if not operator:
+    # Find the operator in one regex pass and split around the match
+    match = _OPERATOR_PATTERN.search(text)
+    if not match:
         logger.debug("No operator found")
         return None
 
-    # Split by operator
-    parts = text.split(operator_word, 1)
-    if len(parts) != 2:
-        logger.debug(f"Could not split by operator: {parts}")
-        return None
-
-    left_text = parts[0].strip()
-    right_text = parts[1].strip()
+    operator = OPERATORS[match.group(1)]
+    left_text = text[:match.start()].strip()
+    right_text = text[match.end():].strip()
 
-    # Extract numbers
-    left_num = extract_number(left_text)
-    right_num = extract_number(right_text)
+    # Extract numbers (both halves are already lowercase)
+    left_num = _extract_lowered(left_text)
+    right_num = _extract_lowered(right_text)
 
     if left_num is None or right_num is None:
         logger.debug(f"Could not extract numbers: left='{left_text}', right='{right_text}'")
@@ -179,24 +273,24 @@ def extract_number(text: str) -> Optional[float]:
     Returns:
         Number as float or None
     """
-    text = text.strip()
+    return _extract_lowered(text.strip().lower())
+
+
+def _extract_lowered(text: str) -> Optional[float]:
+    """extract_number for text that is already lowercased"""
+    # Bare integer (e.g. the "5" left of "5 plus 5"): no regex needed
+    if text.isdecimal():
+        return float(text)
 
     # Try to find digits
-    digit_match = re.search(r'-?\d+\.?\d*', text)
+    digit_match = _NUMBER_PATTERN.search(text)
     if digit_match:
         return float(digit_match.group())
 
-    # Try number words
-    words = text.split()
-    for word in words:
-        num = text_to_number(word)
-        if num is not None:
-            return float(num)
-
-    # Try compound numbers
-    num = text_to_number(text)
-    if num is not None:
-        return float(num)
+    # Try number words (first one wins)
+    word_match = _NUMBER_WORD_PATTERN.search(text)
+    if word_match:
+        return float(text_to_number(word_match.group(1)))
 
     return None
 
@@ -214,23 +308,16 @@ def compute_math(operator: str, a: float, b: float) -> Tuple[Optional[float], Op
         Tuple of (result, error_message)
         If error, result is None and error_message is set
     """
-    try:
-        if operator == "add":
-            return (a + b, None)
-        elif operator == "subtract":
-            return (a - b, None)
-        elif operator == "multiply":
-            return (a * b, None)
-        elif operator == "divide":
-            if b == 0:
-                return (None, "I can't divide by zero. Try another number.")
-            return (a / b, None)
-        else:
-            return (None, f"Unknown operator: {operator}")
+    fn = _ARITHMETIC.get(operator)
+    if fn is not None:
+        return (fn(a, b), None)
+
+    if operator == "divide":
+        if b == 0:
+            return (None, "I can't divide by zero. Try another number.")
+        return (a / b, None)
 
-    except Exception as e:
-        logger.error(f"Error computing math: {e}")
-        return (None, "I had trouble with that calculation.")
+    return (None, f"Unknown operator: {operator}")
 
 
 def format_math_response(operator: str, a: float, b: float, result: float) -> str:
@@ -258,6 +345,9 @@ def format_math_response(operator: str, a: float, b: float, result: float) -> st
     return response
 
 
+# Answers repeat a small range of numbers; 10 and 10.0 share one entry,
+# which is correct because whole floats are spoken as ints
+@lru_cache(maxsize=256)
 def number_to_words(num: float) -> str:
     """
     Convert number to words (for simple numbers)
@@ -275,8 +365,7 @@ def number_to_words(num: float) -> str:
 
     # For numbers 0-20, use words
     if isinstance(num, int) and 0 <= num <= 20:
-        words_map = {v: k for k, v in NUMBER_WORDS.items() if isinstance(v, int) and v <= 20}
-        if num in words_map:
-            return words_map[num]
+        if num in _SMALL_NUMBER_WORDS:
+            return _SMALL_NUMBER_WORDS[num]
 
     return str(num)
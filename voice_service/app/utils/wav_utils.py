@@ -1,12 +1,109 @@
 """
 WAV file utilities for parsing and creating WAV files
 """
+import os
 import struct
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
 
+# Enough for the usual RIFF/fmt /data layout (and a LIST chunk or two) in
+# a single read
+_HEADER_READ_SIZE = 4096
+_FMT_STRUCT = struct.Struct('<HHIIHH')
+
+
+def _scan_chunks(buf, offset: int = 12):
+    """
+    Walk the RIFF chunks in an in-memory header
+
+    Args:
+        buf: WAV header bytes (from the start of the file)
+        offset: Position of the first chunk header
+
+    Returns:
+        Tuple of (fmt fields or None, data size or None, offset where the
+        scan stopped)
+    """
+    mv = memoryview(buf)
+    fmt = None
+    while offset + 8 <= len(mv):
+        chunk_id = bytes(mv[offset:offset + 4])
+        chunk_size = struct.unpack_from('<I', mv, offset + 4)[0]
+
+        if chunk_id == b'fmt ':
+            if offset + 8 + _FMT_STRUCT.size > len(mv):
+                break
+            fmt = _FMT_STRUCT.unpack_from(mv, offset + 8)
+        elif chunk_id == b'data':
+            return fmt, chunk_size, offset
+
+        offset += 8 + chunk_size
+
+    return fmt, None, offset
+
+
+def _read_wav_header(file_path: str):
+    """
+    Read the fmt fields and data size of a WAV file
+
+    One read covers the header of nearly every file; only headers with
+    large chunks before the data (or a huge fmt chunk) fall back to
+    seeking from chunk to chunk.
+
+    Returns:
+        Tuple of (file size, fmt fields, data size)
+    """
+    with open(file_path, 'rb') as f:
+        buf = f.read(_HEADER_READ_SIZE)
+        if buf[:4] != b'RIFF' or buf[8:12] != b'WAVE':
+            raise ValueError("Not a valid WAV file")
+
+        file_size = struct.unpack_from('<I', buf, 4)[0] + 8
+        fmt, data_size, offset = _scan_chunks(buf)
+
+        # Ran off the end of the buffer: continue chunk by chunk from disk
+        f.seek(offset)
+        while data_size is None:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                break
+
+            chunk_id = chunk_header[:4]
+            chunk_size = struct.unpack('<I', chunk_header[4:8])[0]
+
+            if chunk_id == b'fmt ':
+                fmt = _FMT_STRUCT.unpack(f.read(_FMT_STRUCT.size))
+                f.seek(chunk_size - _FMT_STRUCT.size, 1)
+            elif chunk_id == b'data':
+                data_size = chunk_size
+            else:
+                f.seek(chunk_size, 1)
+
+    if fmt is None:
+        raise ValueError("fmt chunk not found")
+    if data_size is None:
+        raise ValueError("data chunk not found")
+    return file_size, fmt, data_size
+
+
+def _wav_info(file_size: int, fmt: tuple, data_size: int) -> dict:
+    """Build the get_wav_info dictionary from parsed header fields"""
+    audio_format, num_channels, sample_rate, byte_rate, block_align, bits_per_sample = fmt
+    return {
+        'file_size': file_size,
+        'audio_format': audio_format,
+        'num_channels': num_channels,
+        'sample_rate': sample_rate,
+        'byte_rate': byte_rate,
+        'bits_per_sample': bits_per_sample,
+        'data_size': data_size,
+        'duration': data_size / byte_rate
+    }
+
+
 def get_wav_duration(file_path: str) -> float:
     """
     Get duration of WAV file in seconds
@@ -18,48 +115,9 @@ def get_wav_duration(file_path: str) -> float:
         Duration in seconds
     """
     try:
-        with open(file_path, 'rb') as f:
-            # Read RIFF header
-            riff = f.read(12)
-            if riff[:4] != b'RIFF' or riff[8:12] != b'WAVE':
-                raise ValueError("Not a valid WAV file")
-
-            # Find fmt chunk
-            while True:
-                chunk_header = f.read(8)
-                if len(chunk_header) < 8:
-                    raise ValueError("fmt chunk not found")
-
-                chunk_id = chunk_header[:4]
-                chunk_size = struct.unpack('<I', chunk_header[4:8])[0]
-
-                if chunk_id == b'fmt ':
-                    # Read fmt chunk
-                    fmt_data = f.read(chunk_size)
-                    sample_rate = struct.unpack('<I', fmt_data[4:8])[0]
-                    byte_rate = struct.unpack('<I', fmt_data[8:12])[0]
-                    break
-                else:
-                    # Skip this chunk
-                    f.seek(chunk_size, 1)
-
-            # Find data chunk
-            f.seek(12)  # Back to after RIFF header
-            while True:
-                chunk_header = f.read(8)
-                if len(chunk_header) < 8:
-                    raise ValueError("data chunk not found")
-
-                chunk_id = chunk_header[:4]
-                chunk_size = struct.unpack('<I', chunk_header[4:8])[0]
-
-                if chunk_id == b'data':
-                    # Calculate duration
-                    duration = chunk_size / byte_rate
-                    return duration
-                else:
-                    # Skip this chunk
-                    f.seek(chunk_size, 1)
+        _, fmt, data_size = _read_wav_header(file_path)
+        byte_rate = fmt[3]
+        return data_size / byte_rate
 
     except Exception as e:
         logger.error(f"Error getting WAV duration: {e}")
@@ -77,65 +135,90 @@ def get_wav_info(file_path: str) -> dict:
         Dictionary with WAV file information
     """
     try:
-        with open(file_path, 'rb') as f:
-            # Read RIFF header
-            riff = f.read(12)
-            if riff[:4] != b'RIFF' or riff[8:12] != b'WAVE':
-                raise ValueError("Not a valid WAV file")
-
-            file_size = struct.unpack('<I', riff[4:8])[0] + 8
-
-            # Find and read fmt chunk
-            while True:
-                chunk_header = f.read(8)
-                if len(chunk_header) < 8:
-                    raise ValueError("fmt chunk not found")
-
-                chunk_id = chunk_header[:4]
-                chunk_size = struct.unpack('<I', chunk_header[4:8])[0]
-
-                if chunk_id == b'fmt ':
-                    fmt_data = f.read(chunk_size)
-                    audio_format = struct.unpack('<H', fmt_data[0:2])[0]
-                    num_channels = struct.unpack('<H', fmt_data[2:4])[0]
-                    sample_rate = struct.unpack('<I', fmt_data[4:8])[0]
-                    byte_rate = struct.unpack('<I', fmt_data[8:12])[0]
-                    block_align = struct.unpack('<H', fmt_data[12:14])[0]
-                    bits_per_sample = struct.unpack('<H', fmt_data[14:16])[0]
-                    break
-                else:
-                    f.seek(chunk_size, 1)
-
-            # Find data chunk
-            f.seek(12)
-            while True:
-                chunk_header = f.read(8)
-                if len(chunk_header) < 8:
-                    raise ValueError("data chunk not found")
-
-                chunk_id = chunk_header[:4]
-                chunk_size = struct.unpack('<I', chunk_header[4:8])[0]
-
-                if chunk_id == b'data':
-                    data_size = chunk_size
-                    break
-                else:
-                    f.seek(chunk_size, 1)
-
-            # Calculate duration
-            duration = data_size / byte_rate
-
-            return {
-                'file_size': file_size,
-                'audio_format': audio_format,
-                'num_channels': num_channels,
-                'sample_rate': sample_rate,
-                'byte_rate': byte_rate,
-                'bits_per_sample': bits_per_sample,
-                'data_size': data_size,
-                'duration': duration
-            }
+        return _wav_info(*_read_wav_header(file_path))
 
     except Exception as e:
         logger.error(f"Error getting WAV info: {e}")
         return {}
+
+
+def get_wav_info_from_bytes(data: bytes) -> dict:
+    """
+    Get information about an in-memory WAV file
+
+    Same fields as get_wav_info, for audio that is already loaded (e.g. about
+    to be sent over the WebSocket) so the file does not have to be re-read.
+
+    Args:
+        data: Complete WAV file bytes
+
+    Returns:
+        Dictionary with WAV file information
+    """
+    try:
+        if data[:4] != b'RIFF' or data[8:12] != b'WAVE':
+            raise ValueError("Not a valid WAV file")
+
+        file_size = struct.unpack_from('<I', data, 4)[0] + 8
+
+        fmt, data_size, _ = _scan_chunks(data)
+        if fmt is None:
+            raise ValueError("fmt chunk not found")
+        if data_size is None:
+            raise ValueError("data chunk not found")
+
+        return _wav_info(file_size, fmt, data_size)
+
+    except Exception as e:
+        logger.error(f"Error getting WAV info: {e}")
+        return {}
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_wav_cached(file_path: str, mtime_ns: int, size: int) -> bool:
+    """RIFF/WAVE magic check, cached per file version (mtime and size)"""
+    with open(file_path, 'rb') as f:
+        header = f.read(12)
+    return header[:4] == b'RIFF' and header[8:12] == b'WAVE'
+
+
+def is_valid_wav(file_path: str) -> bool:
+    """
+    Check whether a file is a WAV file
+
+    Only the 12-byte RIFF/WAVE header is read, and the answer is cached
+    until the file's mtime or size changes.
+
+    Args:
+        file_path: Path to WAV file
+
+    Returns:
+        True if the file exists and has a RIFF/WAVE header
+    """
+    try:
+        st = os.stat(file_path)
+        return _is_valid_wav_cached(file_path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return False
+
+
+@lru_cache(maxsize=4)
+def silent_wav_bytes(duration: float, sample_rate: int) -> bytes:
+    """
+    A mono 16-bit PCM WAV of silence, built once per (duration, rate)
+
+    Args:
+        duration: Duration in seconds
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Complete WAV file bytes (header + zeroed samples)
+    """
+    n_bytes = int(duration * sample_rate) * 2
+    header = struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + n_bytes, b'WAVE',
+        b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b'data', n_bytes,
+    )
+    return header + bytes(n_bytes)
@@ -0,0 +1,55 @@
+"""
+LRU cache of synthesized waveforms for repeated TTS lines
+
+Game prompts and pooled cat replies repeat verbatim, so a hit skips
+synthesis entirely and costs only the WAV write. The cache is bounded by
+total seconds of audio held rather than entry count, which caps RAM no
+matter how long the cached lines are.
+"""
+import logging
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class WaveformCache:
+    """Thread-safe LRU of (samples, sample_rate), bounded by audio seconds"""
+
+    def __init__(self, max_seconds: float):
+        self.max_seconds = max_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[np.ndarray, int]]" = OrderedDict()
+        self._seconds = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Tuple[np.ndarray, int]]:
+        """Cached (samples, sample_rate) for key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, samples: np.ndarray, sample_rate: int):
+        """Store a waveform (read-only from here on), evicting the oldest as needed"""
+        seconds = len(samples) / float(sample_rate)
+        if self.max_seconds <= 0 or seconds > self.max_seconds:
+            return
+
+        samples.setflags(write=False)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._seconds -= len(old[0]) / float(old[1])
+            self._entries[key] = (samples, sample_rate)
+            self._seconds += seconds
+
+            while self._seconds > self.max_seconds:
+                _, (s, sr) = self._entries.popitem(last=False)
+                self._seconds -= len(s) / float(sr)
+
+    def __len__(self) -> int:
+        return len(self._entries)
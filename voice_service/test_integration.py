@@ -4,9 +4,16 @@ Tests complete flow: REST API → Pipeline → WebSocket events
 """
 import asyncio
 import websockets
-import requests
-import json
+import httpx
 import time
+from collections import Counter
+
+import orjson
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 
 async def test_integration():
@@ -18,10 +25,17 @@ async def test_integration():
     base_url = "http://127.0.0.1:8008"
     ws_url = "ws://127.0.0.1:8008"
 
+    # One pooled HTTP connection for both REST calls
+    async with httpx.AsyncClient(base_url=base_url) as http:
+        await _run_integration(http, ws_url)
+
+
+async def _run_integration(http: httpx.AsyncClient, ws_url: str):
+    """Drive one session through the REST API and collect its WebSocket events"""
     # Step 1: Start a session
     print("\n[1] Starting session...")
-    response = requests.post(
-        f"{base_url}/api/session/start",
+    response = await http.post(
+        "/api/session/start",
         json={"language": "en", "mode": "ptt"}
     )
 
@@ -39,15 +53,16 @@ async def test_integration():
     ws_uri = f"{ws_url}/ws?session_id={session_id}"
 
     events_received = []
+    received_types = set()
 
     try:
-        async with websockets.connect(ws_uri) as websocket:
+        async with websockets.connect(ws_uri, compression=None) as websocket:
             print(f"[OK] WebSocket connected")
 
             # Step 3: Stop session (triggers pipeline)
             print(f"\n[3] Stopping session (triggering pipeline)...")
-            response = requests.post(
-                f"{base_url}/api/session/stop",
+            response = await http.post(
+                "/api/session/stop",
                 json={"session_id": session_id, "return_audio": True}
             )
 
@@ -69,25 +84,28 @@ async def test_integration():
             while True:
                 try:
                     # Wait for message with timeout
+                    # Raw frame bytes go straight to orjson (no str decode)
                     message = await asyncio.wait_for(
-                        websocket.recv(),
+                        websocket.recv(decode=False),
                         timeout=5.0
                     )
 
-                    event = json.loads(message)
-                    events_received.append(event)
+                    # The server may coalesce several events into one frame
+                    decoded = orjson.loads(message)
+                    batch = decoded if isinstance(decoded, list) else [decoded]
 
-                    event_type = event.get("type")
-                    payload = event.get("payload", {})
+                    for event in batch:
+                        events_received.append(event)
 
-                    print(f"\n[EVENT] {event_type}")
-                    print(f"   Payload: {json.dumps(payload, indent=2)}")
+                        event_type = event.get("type")
+                        received_types.add(event_type)
 
-                    # Check if we've received all expected events
-                    event_types = [e["type"] for e in events_received]
+                        # Payloads are pretty-printed after the loop, so
+                        # formatting doesn't delay the next recv()
+                        print(f"[EVENT] {event_type} payload_bytes={len(message)}")
 
                     # We expect: state (multiple), transcript.final, reply.text, reply.audio_ready
-                    if "reply.audio_ready" in event_types:
+                    if "reply.audio_ready" in received_types:
                         print("\n[OK] All main events received!")
                         break
 
@@ -110,10 +128,14 @@ async def test_integration():
 
             print(f"\nTotal events received: {len(events_received)}")
 
-            event_types = [e["type"] for e in events_received]
+            for event in events_received:
+                print(f"\n[EVENT] {event.get('type')}")
+                payload = orjson.dumps(event.get("payload", {}), option=orjson.OPT_INDENT_2)
+                print(f"   Payload: {payload.decode()}")
+
+            type_counts = Counter(e["type"] for e in events_received)
             print(f"\nEvent types:")
-            for event_type in set(event_types):
-                count = event_types.count(event_type)
+            for event_type, count in type_counts.items():
                 print(f"  - {event_type}: {count}x")
 
             # Extract key information
@@ -144,4 +166,5 @@ async def test_integration():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_integration())
+    # uvloop when installed (comes with uvicorn[standard] on Linux/macOS)
+    (uvloop.run if uvloop else asyncio.run)(test_integration())
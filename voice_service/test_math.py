@@ -1,6 +1,10 @@
 """
 Quick test of math parsing and computation
+
+Run with pytest (one case per test) or directly for a printed walkthrough.
 """
+import pytest
+
 from app.utils.text_math import (
     is_math_query,
     parse_math_expression,
@@ -9,52 +13,66 @@ from app.utils.text_math import (
 )
 
 
-def test_math():
+# (text, expected result: a number, "error", or None if not math)
+TEST_CASES = [
+    ("what is five plus five", 10),
+    ("what's 7 plus 3", 10),
+    ("ten minus two", 8),
+    ("what is 3 times 4", 12),
+    ("12 divided by 3", 4),
+    ("100 divided by 0", "error"),
+    ("what is a cat", None),  # Not math
+]
+
+
+def solve(text):
+    """Detect, parse and compute one query: (result, error, response)"""
+    if not is_math_query(text):
+        return None, None, None
+
+    parsed = parse_math_expression(text)
+    if not parsed:
+        return None, None, None
+
+    operator, a, b = parsed
+    result, error = compute_math(operator, a, b)
+    if error:
+        return None, error, None
+    return result, None, format_math_response(operator, a, b, result)
+
+
+@pytest.mark.parametrize("text,expected", TEST_CASES, ids=[case[0] for case in TEST_CASES])
+def test_math(text, expected):
     """Test math utilities"""
+    result, error, response = solve(text)
+
+    if expected is None:
+        assert result is None and error is None
+    elif expected == "error":
+        assert error is not None
+    else:
+        assert result == expected
+        assert response
+
+
+def main():
     print("Testing Math Utilities")
     print("=" * 60)
 
-    test_cases = [
-        "what is five plus five",
-        "what's 7 plus 3",
-        "ten minus two",
-        "what is 3 times 4",
-        "12 divided by 3",
-        "100 divided by 0",
-        "what is a cat",  # Not math
-    ]
-
-    for test in test_cases:
-        print(f"\nTest: '{test}'")
-
-        # Check if math query
-        is_math = is_math_query(test)
-        print(f"  Is math: {is_math}")
-
-        if is_math:
-            # Parse expression
-            parsed = parse_math_expression(test)
-            if parsed:
-                operator, a, b = parsed
-                print(f"  Parsed: {a} {operator} {b}")
-
-                # Compute
-                result, error = compute_math(operator, a, b)
-
-                if error:
-                    print(f"  Error: {error}")
-                else:
-                    print(f"  Result: {result}")
-
-                    # Format response
-                    if result is not None:
-                        response = format_math_response(operator, a, b, result)
-                        print(f"  Response: '{response}'")
-            else:
-                print(f"  Could not parse expression")
+    for text, _ in TEST_CASES:
+        print(f"\nTest: '{text}'")
+        result, error, response = solve(text)
+
+        if error:
+            print(f"  Error: {error}")
+        elif response:
+            print(f"  Result: {result}")
+            print(f"  Response: '{response}'")
+        else:
+            print(f"  Not math")
 
     print("\n" + "=" * 60)
 
 
 if __name__ == "__main__":
-    test_math()
+    main()
@@ -1,12 +1,43 @@
 """
 Simple TTS test
+
+Run with pytest (one synthesis per test, one shared TTS engine) or directly
+to list voices and write the clips to data/test_audio for listening.
 """
 import os
-from app.pipeline.processors.tts_processor import TTSProcessor
 
+import pytest
+
+
+TEST_SENTENCES = [
+    "Hello! I'm your friendly game character.",
+    "Five plus five is ten.",
+    "What's your favorite animal?",
+    "I can help you with math, animals, or colors!"
+]
+
+
+@pytest.fixture(scope="session")
+def tts():
+    """One TTS processor (and engine) for every synthesis case"""
+    pytest.importorskip("pyttsx3")
+    from app.pipeline.processors.tts_processor import TTSProcessor
+
+    return TTSProcessor()
 
-def test_tts():
+
+@pytest.mark.parametrize("sentence", TEST_SENTENCES)
+def test_tts(tts, sentence, tmp_path):
     """Test TTS processor"""
+    output_path = str(tmp_path / "test.wav")
+
+    assert tts.synthesize(sentence, output_path)
+    assert os.path.getsize(output_path) > 44
+
+
+def main():
+    from app.pipeline.processors.tts_processor import TTSProcessor
+
     print("=" * 60)
     print("TTS PROCESSOR TEST")
     print("=" * 60)
@@ -19,14 +50,6 @@ def test_tts():
     print("\n[2] Available voices:")
     tts.list_voices()
 
-    # Test sentences
-    test_sentences = [
-        "Hello! I'm your friendly game character.",
-        "Five plus five is ten.",
-        "What's your favorite animal?",
-        "I can help you with math, animals, or colors!"
-    ]
-
     output_dir = "data/test_audio"
     os.makedirs(output_dir, exist_ok=True)
 
@@ -34,7 +57,7 @@ def test_tts():
     print(f"Output directory: {output_dir}")
     print("-" * 60)
 
-    for i, sentence in enumerate(test_sentences):
+    for i, sentence in enumerate(TEST_SENTENCES):
         output_path = os.path.join(output_dir, f"test_{i+1}.wav")
 
         print(f"\n  Test {i+1}: '{sentence}'")
@@ -56,4 +79,4 @@ def test_tts():
 
 
 if __name__ == "__main__":
-    test_tts()
+    main()
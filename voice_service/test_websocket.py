@@ -3,7 +3,16 @@ Simple WebSocket test script
 """
 import asyncio
 import websockets
-import json
+import orjson
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Prebuilt control messages, encoded once. These stay str (text frames):
+# the server treats every binary frame as an audio chunk
+_PING = orjson.dumps({"type": "ping"}).decode()
 
 
 async def test_websocket():
@@ -14,24 +23,26 @@ async def test_websocket():
     print(f"Connecting to {uri}...")
 
     try:
-        async with websockets.connect(uri) as websocket:
+        # Events are small JSON frames: skip per-message deflate, and take
+        # frames as raw bytes (no str decode / UTF-8 validation) for orjson
+        async with websockets.connect(uri, compression=None) as websocket:
             print("Connected successfully!")
 
             # Wait for initial state event
-            message = await websocket.recv()
-            print(f"Received: {message}")
+            message = await websocket.recv(decode=False)
+            print(f"Received: {len(message)} bytes")
 
-            event = json.loads(message)
+            event = orjson.loads(message)
             print(f"Event type: {event['type']}")
             print(f"Payload: {event['payload']}")
 
-            # Send a ping
-            await websocket.send(json.dumps({"type": "ping"}))
+            # Send a ping (a text frame: binary frames are audio chunks)
+            await websocket.send(_PING)
             print("Sent ping")
 
             # Wait for pong
-            message = await websocket.recv()
-            print(f"Received: {message}")
+            message = await websocket.recv(decode=False)
+            print(f"Received: {orjson.loads(message)}")
 
             print("\nWebSocket test successful!")
 
@@ -40,4 +51,5 @@ async def test_websocket():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_websocket())
+    # uvloop when installed (comes with uvicorn[standard] on Linux/macOS)
+    (uvloop.run if uvloop else asyncio.run)(test_websocket())
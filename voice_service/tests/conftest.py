@@ -4,12 +4,22 @@ Pytest configuration and shared fixtures for Voice Service tests
 import os
 import sys
 import asyncio
+import functools
+import tempfile
 import pytest
+import pytest_asyncio
 import numpy as np
+import requests
+from pathlib import Path
 from typing import AsyncGenerator, Generator
-from unittest.mock import MagicMock, AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from fastapi.testclient import TestClient
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Add app directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -17,6 +27,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from app.main import app
 from app.config import settings
 from app.api.session_manager import SessionManager, Session
+from app.api.session_manager import session_manager as app_session_manager
 from app.pipeline.voice_pipeline import VoicePipeline
 
 
@@ -27,26 +38,69 @@ from app.pipeline.voice_pipeline import VoicePipeline
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+    # uvloop (installed with uvicorn[standard], not on Windows) when available
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
     yield loop
+    asyncio.set_event_loop(None)
     loop.close()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def warm_hot_paths():
+    """
+    Pay one-time costs before the first test: the Numba gate kernel (hit by
+    the stationary noise reducer tests), the math regexes and caches, and
+    the pipeline's eagerly built processors
+    """
+    from app.pipeline.processors import noise_reducer
+    from app.utils.text_math import is_math_query, match_math
+
+    if noise_reducer.njit is not None:
+        # Same dtypes the stationary gate passes in (complex64 spectrum,
+        # float32 per-bin threshold), so this is the signature used later
+        n_bins = noise_reducer._N_FFT // 2 + 1
+        spec = np.zeros((2, n_bins), dtype=np.complex64)
+        noise_reducer._gate_spectrum(spec, np.zeros(n_bins, dtype=np.float32), 0.5)
+
+    is_math_query("1 plus 1")
+    match_math("what is five plus five")
+    VoicePipeline()
+
+
 # ============================================================================
 # Test Client Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client() -> Generator[TestClient, None, None]:
-    """Create a test client for the FastAPI app"""
+    """Create a test client for the FastAPI app
+
+    Shared by the whole run so the app's lifespan (model loading, DB and
+    background tasks) starts and stops once; reset_app_state undoes each
+    test's changes.
+    """
     with TestClient(app) as test_client:
         yield test_client
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def reset_app_state():
+    """Clear dependency overrides and end sessions a test opened on the app"""
+    existing = set(app_session_manager.sessions)
+    yield
+    app.dependency_overrides.clear()
+    for session_id in app_session_manager.sessions.keys() - existing:
+        app_session_manager.delete_session(session_id)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_client() -> AsyncGenerator[AsyncClient, None]:
-    """Create an async test client for the FastAPI app"""
-    async with AsyncClient(app=app, base_url="http://test") as ac:
+    """Create an async test client for the FastAPI app
+
+    One ASGI transport and connection pool for the whole run.
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
 
 
@@ -54,63 +108,76 @@ async def async_client() -> AsyncGenerator[AsyncClient, None]:
 # Audio Data Fixtures
 # ============================================================================
 
-@pytest.fixture
-def sample_audio_16khz() -> np.ndarray:
-    """Generate sample audio data at 16kHz (1 second)"""
-    sample_rate = 16000
-    duration = 1.0
-    frequency = 440.0  # A4 note
+@functools.lru_cache(maxsize=None)
+def _sine(sample_rate: int, duration: float, frequency: float = 440.0) -> np.ndarray:
+    """Read-only sine tone (A4 by default); tests that mutate must copy it"""
+    # Sample i is at t = i / sample_rate. The phase stays float64 (late
+    # samples keep their precision); sin writes straight into the float32
+    # output, so there is no float64 sine buffer or astype copy
+    n = int(sample_rate * duration)
+    phase = np.arange(n, dtype=np.float64)
+    phase *= 2 * np.pi * frequency / sample_rate
+    audio = np.empty(n, dtype=np.float32)
+    np.sin(phase, out=audio)
+    audio.setflags(write=False)
+    return audio
 
-    t = np.linspace(0, duration, int(sample_rate * duration))
-    audio = np.sin(2 * np.pi * frequency * t).astype(np.float32)
 
-    return audio
+# The signals are deterministic, so each one is generated once per run
 
+@pytest.fixture(scope="session")
+def make_sine():
+    """
+    Factory for read-only sine tones: make_sine(sample_rate, duration, frequency=440.0)
 
-@pytest.fixture
-def sample_audio_24khz() -> np.ndarray:
-    """Generate sample audio data at 24kHz (1 second)"""
-    sample_rate = 24000
-    duration = 1.0
-    frequency = 440.0  # A4 note
+    Tones are cached, so tests asking for the same shape share one array.
+    """
+    return _sine
 
-    t = np.linspace(0, duration, int(sample_rate * duration))
-    audio = np.sin(2 * np.pi * frequency * t).astype(np.float32)
 
-    return audio
+@pytest.fixture(scope="session")
+def sample_audio_16khz(make_sine) -> np.ndarray:
+    """Generate sample audio data at 16kHz (1 second)"""
+    return make_sine(16000, 1.0)
 
 
-@pytest.fixture
-def silence_audio() -> np.ndarray:
-    """Generate silent audio (1 second at 16kHz)"""
-    sample_rate = 16000
-    duration = 1.0
+@pytest.fixture(scope="session")
+def sample_audio_24khz(make_sine) -> np.ndarray:
+    """Generate sample audio data at 24kHz (1 second)"""
+    return make_sine(24000, 1.0)
 
-    audio = np.zeros(int(sample_rate * duration), dtype=np.float32)
 
+@pytest.fixture(scope="session")
+def silence_audio() -> np.ndarray:
+    """Generate silent audio (1 second at 16kHz)"""
+    audio = np.zeros(16000, dtype=np.float32)
+    audio.setflags(write=False)
     return audio
 
 
-@pytest.fixture
-def short_audio() -> np.ndarray:
+@pytest.fixture(scope="session")
+def short_audio(make_sine) -> np.ndarray:
     """Generate very short audio (100ms at 16kHz)"""
-    sample_rate = 16000
-    duration = 0.1
-    frequency = 440.0
+    return make_sine(16000, 0.1)
 
-    t = np.linspace(0, duration, int(sample_rate * duration))
-    audio = np.sin(2 * np.pi * frequency * t).astype(np.float32)
 
-    return audio
+@pytest.fixture
+def writable_audio_16khz(sample_audio_16khz) -> np.ndarray:
+    """Private, writable copy of sample_audio_16khz for tests that modify it"""
+    return sample_audio_16khz.copy()
 
 
 # ============================================================================
 # Session Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def session_manager() -> SessionManager:
-    """Create a fresh session manager for testing"""
+    """Create a session manager shared by the tests in a module
+
+    cleanup_sessions ends whatever each test creates, so every test still
+    starts from the same set of sessions.
+    """
     return SessionManager()
 
 
@@ -119,18 +186,21 @@ def test_session(session_manager: SessionManager) -> Session:
     """Create a test session"""
     session = session_manager.create_session()
     yield session
-    session_manager.end_session(session.session_id)
+    session_manager.delete_session(session.session_id)
 
 
 # ============================================================================
 # Mock Fixtures for External Services
 # ============================================================================
 
+# Mocks are spec'd to the attributes the code under test uses: cheaper than
+# MagicMock's auto-created attributes, and a typo raises AttributeError
+
 @pytest.fixture
 def mock_ollama_client():
     """Mock Ollama client for LLM testing"""
-    with patch('app.pipeline.processors.llm_ollama.requests.post') as mock_post:
-        mock_response = MagicMock()
+    with patch('app.pipeline.processors.llm_ollama.requests.Session.post') as mock_post:
+        mock_response = Mock(spec=requests.Response)
         mock_response.status_code = 200
         mock_response.json.return_value = {
             "response": "This is a test response from the mock LLM.",
@@ -143,7 +213,7 @@ def mock_ollama_client():
 @pytest.fixture
 def mock_stt_processor():
     """Mock STT processor for testing"""
-    mock = MagicMock()
+    mock = Mock(spec=["transcribe"])
     mock.transcribe.return_value = "what is five plus five"
     return mock
 
@@ -151,18 +221,26 @@ def mock_stt_processor():
 @pytest.fixture
 def mock_tts_processor():
     """Mock TTS processor for testing"""
-    mock = MagicMock()
+    mock = Mock(spec=["synthesize", "sample_rate"])
     mock.synthesize.return_value = True
     mock.sample_rate = 24000
     return mock
 
 
+@pytest.fixture(scope="session")
+def trimmed_noise_audio() -> np.ndarray:
+    """Read-only 1 s of seeded white noise, shared by every mock VAD"""
+    audio = np.random.default_rng(0).standard_normal(16000, dtype=np.float32)
+    audio.setflags(write=False)
+    return audio
+
+
 @pytest.fixture
-def mock_vad_processor():
+def mock_vad_processor(trimmed_noise_audio):
     """Mock VAD processor for testing"""
-    mock = MagicMock()
+    mock = Mock(spec=["is_speech", "trim_silence"])
     mock.is_speech.return_value = True
-    mock.trim_silence.return_value = np.random.randn(16000).astype(np.float32)
+    mock.trim_silence.return_value = trimmed_noise_audio
     return mock
 
 
@@ -179,7 +257,7 @@ def voice_pipeline():
 @pytest.fixture
 def mock_voice_pipeline():
     """Create a mock voice pipeline for testing"""
-    mock = MagicMock()
+    mock = Mock(spec=["process"])
     mock.process.return_value = {
         "transcript": "what is five plus five",
         "reply_text": "Five plus five is ten.",
@@ -193,25 +271,44 @@ def mock_voice_pipeline():
 # File System Fixtures
 # ============================================================================
 
+# RAM-backed (tmpfs) root for audio scratch files, when the OS has one
+_RAM_TMP = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+
 @pytest.fixture
 def temp_audio_dir(tmp_path):
-    """Create a temporary directory for audio files"""
-    audio_dir = tmp_path / "audio"
-    audio_dir.mkdir()
-    return audio_dir
+    """Create a temporary directory for audio files (on tmpfs when available)"""
+    if _RAM_TMP is None:
+        audio_dir = tmp_path / "audio"
+        audio_dir.mkdir()
+        yield audio_dir
+        return
 
+    with tempfile.TemporaryDirectory(prefix="pytest-audio-", dir=_RAM_TMP) as audio_dir:
+        yield Path(audio_dir)
 
-@pytest.fixture
-def temp_wav_file(temp_audio_dir, sample_audio_16khz):
-    """Create a temporary WAV file"""
+
+@pytest.fixture(scope="session")
+def temp_wav_file(tmp_path_factory, sample_audio_16khz):
+    """Create a temporary WAV file, written once and shared read-only
+
+    Tests that modify the file must copy it into temp_audio_dir first.
+    """
     import soundfile as sf
 
-    wav_path = temp_audio_dir / "test.wav"
-    sf.write(str(wav_path), sample_audio_16khz, 16000, subtype='PCM_16')
+    wav_path = tmp_path_factory.mktemp("audio") / "test.wav"
+    with sf.SoundFile(str(wav_path), 'w', 16000, 1, 'PCM_16') as wav:
+        wav.write(sample_audio_16khz)
 
     return wav_path
 
 
+@pytest.fixture(scope="session")
+def wav_bytes(temp_wav_file) -> bytes:
+    """Contents of temp_wav_file, read once (wrap in io.BytesIO per upload)"""
+    return temp_wav_file.read_bytes()
+
+
 # ============================================================================
 # WebSocket Fixtures
 # ============================================================================
@@ -243,39 +340,41 @@ def test_settings():
 
 @pytest.fixture(autouse=True)
 def cleanup_sessions(session_manager):
-    """Cleanup all sessions after each test"""
+    """End the sessions each test created"""
+    existing = set(session_manager.sessions)
     yield
-    # Clean up all sessions
-    for session_id in list(session_manager.sessions.keys()):
-        session_manager.end_session(session_id)
+    for session_id in session_manager.sessions.keys() - existing:
+        session_manager.delete_session(session_id)
 
 
 # ============================================================================
 # Math Router Test Data
 # ============================================================================
 
-@pytest.fixture
-def math_test_cases():
-    """Provide test cases for math router"""
-    return [
-        # (input_text, expected_result, expected_operator)
-        ("what is five plus five", 10, "plus"),
-        ("5 + 5", 10, "plus"),
-        ("ten minus three", 7, "minus"),
-        ("12 divided by 4", 3, "divided"),
-        ("6 times 7", 42, "times"),
-        ("what is 100 plus 200", 300, "plus"),
-        ("fifteen minus eight", 7, "minus"),
-    ]
-
-
-@pytest.fixture
-def invalid_math_cases():
-    """Provide invalid math test cases"""
-    return [
-        "what is your name",
-        "tell me a story",
-        "hello there",
-        "5 divided by 0",  # Division by zero
-        "one million plus two million",  # Out of range
-    ]
+# One parametrized test per case (each case passes or fails on its own)
+
+@pytest.fixture(params=[
+    # (input_text, expected_result, expected_operator)
+    ("what is five plus five", 10, "add"),
+    ("5 plus 5", 10, "add"),
+    ("ten minus three", 7, "subtract"),
+    ("12 divided by 4", 3, "divide"),
+    ("6 times 7", 42, "multiply"),
+    ("what is 100 plus 200", 300, "add"),
+    ("fifteen minus eight", 7, "subtract"),
+], ids=lambda case: case[0])
+def math_test_case(request):
+    """Provide one test case for the math router"""
+    return request.param
+
+
+@pytest.fixture(params=[
+    "what is your name",
+    "tell me a story",
+    "hello there",
+    "what is 7",  # No operator
+    "5 divided by 0",  # Division by zero
+])
+def invalid_math_case(request):
+    """Provide one invalid math test case"""
+    return request.param
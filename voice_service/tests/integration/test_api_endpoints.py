@@ -1,9 +1,12 @@
 """
 Integration tests for API endpoints
 """
+import asyncio
+import io
 import pytest
 import json
 from fastapi.testclient import TestClient
+from httpx import AsyncClient
 
 
 @pytest.mark.integration
@@ -43,6 +46,34 @@ class TestHealthEndpoint:
         ollama_status = data["checks"]["ollama"]["status"]
         assert ollama_status in ["healthy", "unhealthy"]
 
+    def test_liveness_probe(self, client: TestClient):
+        """Test liveness probe is served without waiting for models"""
+        response = client.get("/healthz")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "alive"
+
+    def test_readiness_probe(self, client: TestClient):
+        """Test readiness probe reports loading until the STT model is ready"""
+        model_ready = client.app.state.model_ready
+        was_ready = model_ready.is_set()
+        try:
+            model_ready.clear()
+            response = client.get("/readyz")
+            assert response.status_code == 503
+            assert response.json()["status"] == "loading"
+
+            model_ready.set()
+            response = client.get("/readyz")
+            assert response.status_code == 200
+            assert response.json()["status"] == "ready"
+        finally:
+            # The client is session-scoped: leave readiness as it was
+            if was_ready:
+                model_ready.set()
+            else:
+                model_ready.clear()
+
 
 @pytest.mark.integration
 class TestSessionEndpoints:
@@ -151,30 +182,28 @@ class TestSessionEndpoints:
 class TestAudioEndpoints:
     """Test audio-related endpoints"""
 
-    def test_upload_audio(self, client: TestClient, temp_wav_file):
+    def test_upload_audio(self, client: TestClient, wav_bytes):
         """Test uploading audio file"""
         # Start session
         start_response = client.post("/api/session/start", json={})
         session_id = start_response.json()["session_id"]
 
         # Upload audio
-        with open(temp_wav_file, "rb") as f:
-            response = client.post(
-                f"/api/audio/upload/{session_id}",
-                files={"file": ("test.wav", f, "audio/wav")}
-            )
+        response = client.post(
+            f"/api/audio/upload/{session_id}",
+            files={"file": ("test.wav", io.BytesIO(wav_bytes), "audio/wav")}
+        )
 
         assert response.status_code == 200
         data = response.json()
         assert "message" in data or "status" in data
 
-    def test_upload_audio_invalid_session(self, client: TestClient, temp_wav_file):
+    def test_upload_audio_invalid_session(self, client: TestClient, wav_bytes):
         """Test uploading audio to invalid session"""
-        with open(temp_wav_file, "rb") as f:
-            response = client.post(
-                "/api/audio/upload/invalid-session",
-                files={"file": ("test.wav", f, "audio/wav")}
-            )
+        response = client.post(
+            "/api/audio/upload/invalid-session",
+            files={"file": ("test.wav", io.BytesIO(wav_bytes), "audio/wav")}
+        )
 
         assert response.status_code in [404, 400]
 
@@ -255,23 +284,23 @@ class TestErrorHandling:
 class TestConcurrentSessions:
     """Test handling of multiple concurrent sessions"""
 
-    def test_multiple_sessions(self, client: TestClient):
-        """Test creating multiple sessions"""
-        sessions = []
-
-        # Create 5 sessions
-        for i in range(5):
-            response = client.post("/api/session/start", json={})
-            assert response.status_code == 200
-            sessions.append(response.json()["session_id"])
+    async def test_multiple_sessions(self, async_client: AsyncClient):
+        """Test creating multiple sessions concurrently"""
+        # Create 5 sessions at once
+        responses = await asyncio.gather(
+            *(async_client.post("/api/session/start", json={}) for _ in range(5))
+        )
+        assert all(response.status_code == 200 for response in responses)
+        sessions = [response.json()["session_id"] for response in responses]
 
         # Verify all sessions are unique
         assert len(sessions) == len(set(sessions))
 
         # Get info for each session
-        for session_id in sessions:
-            response = client.get(f"/api/session/{session_id}")
-            assert response.status_code == 200
+        responses = await asyncio.gather(
+            *(async_client.get(f"/api/session/{session_id}") for session_id in sessions)
+        )
+        assert all(response.status_code == 200 for response in responses)
 
     def test_session_isolation(self, client: TestClient):
         """Test that sessions are isolated from each other"""
@@ -3,7 +3,6 @@ Integration tests for WebSocket functionality
 """
 import pytest
 import asyncio
-import json
 from unittest.mock import Mock, AsyncMock, patch
 
 
@@ -198,6 +197,74 @@ class TestWebSocketErrorHandling:
             pytest.fail("Should handle send errors gracefully")
 
 
+@pytest.mark.websocket
+@pytest.mark.integration
+class TestPlaybackAck:
+    """Test the playback.started handshake between reply turns"""
+
+    @pytest.mark.asyncio
+    async def test_ack_before_timeout(self):
+        """Test the waiter returns as soon as the client acks"""
+        from app.api.ws import ConnectionManager
+
+        manager = ConnectionManager()
+        session_id = "test-session"
+        manager.expect_playback_ack(session_id)
+
+        waiter = asyncio.create_task(manager.wait_for_playback_ack(session_id, timeout=5.0))
+        await asyncio.sleep(0)
+        manager.handle_playback_started(session_id)
+
+        await asyncio.wait_for(waiter, timeout=1.0)
+        assert session_id not in manager.playback_acks
+
+    @pytest.mark.asyncio
+    async def test_ack_timeout(self):
+        """Test the waiter gives up after the timeout without raising"""
+        from app.api.ws import ConnectionManager
+
+        manager = ConnectionManager()
+        session_id = "test-session"
+        manager.expect_playback_ack(session_id)
+
+        await manager.wait_for_playback_ack(session_id, timeout=0.05)
+        assert session_id not in manager.playback_acks
+
+    @pytest.mark.asyncio
+    async def test_disconnect_releases_waiter(self):
+        """Test a disconnect wakes a turn waiting on an ack that will never come"""
+        from app.api.ws import ConnectionManager
+
+        manager = ConnectionManager()
+        client = AsyncMock()
+        session_id = "test-session"
+        await manager.connect(client, session_id)
+        manager.expect_playback_ack(session_id)
+
+        waiter = asyncio.create_task(manager.wait_for_playback_ack(session_id, timeout=30.0))
+        await asyncio.sleep(0)
+        await manager.disconnect(client, session_id)
+
+        await asyncio.wait_for(waiter, timeout=1.0)
+        assert session_id not in manager.playback_acks
+
+    @pytest.mark.asyncio
+    async def test_stale_ack_ignored(self):
+        """Test an ack with no turn armed (e.g. proactive playback) doesn't satisfy the next turn"""
+        from app.api.ws import ConnectionManager
+
+        manager = ConnectionManager()
+        session_id = "test-session"
+
+        manager.handle_playback_started(session_id)
+        assert session_id not in manager.playback_acks
+
+        manager.expect_playback_ack(session_id)
+        assert not manager.playback_acks[session_id].is_set()
+        await manager.wait_for_playback_ack(session_id, timeout=0.05)
+        assert session_id not in manager.playback_acks
+
+
 @pytest.mark.websocket
 @pytest.mark.integration
 class TestWebSocketMessageFormat:
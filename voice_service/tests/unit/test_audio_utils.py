@@ -1,11 +1,35 @@
 """
 Unit tests for audio utilities
 """
+import io
+import math
+import timeit
 import pytest
 import numpy as np
 import os
-from app.utils.audio_io import save_wav, load_wav, normalize_audio
-from app.utils.wav_utils import get_wav_duration, is_valid_wav
+import soundfile as sf
+from app.utils.audio_io import (
+    save_wav, load_wav, normalize_audio, resample_audio, audio_to_int16, int16_to_audio,
+)
+from app.utils.wav_utils import get_wav_duration, get_wav_info_from_bytes, is_valid_wav
+
+
+def _roundtrip(audio: np.ndarray, sample_rate: int):
+    """Write audio as 16-bit WAV to memory and read it back with load_wav"""
+    buf = io.BytesIO()
+    sf.write(buf, audio, sample_rate, subtype='PCM_16', format='WAV')
+    buf.seek(0)
+    return load_wav(buf)
+
+
+def _rms(x: np.ndarray) -> float:
+    """One-pass RMS (dot product, no squared temporary)"""
+    return math.sqrt(float(np.dot(x, x)) / x.size) if x.size else 0.0
+
+
+def _peak(x: np.ndarray) -> float:
+    """Peak absolute sample from the two reductions (no abs temporary)"""
+    return float(max(x.max(), -x.min())) if x.size else 0.0
 
 
 class TestWavIO:
@@ -27,16 +51,18 @@ class TestWavIO:
         # Verify
         assert sample_rate == 16000
         assert loaded_audio.shape == sample_audio_16khz.shape
-        np.testing.assert_array_almost_equal(loaded_audio, sample_audio_16khz, decimal=4)
+        # Same tolerance as assert_array_almost_equal(decimal=4); the
+        # assertion (and its diff report) only runs on a mismatch
+        if not np.allclose(loaded_audio, sample_audio_16khz, rtol=0, atol=1.5e-4):
+            np.testing.assert_array_almost_equal(loaded_audio, sample_audio_16khz, decimal=4)
 
-    def test_save_different_sample_rates(self, temp_audio_dir, sample_audio_16khz):
+    def test_save_different_sample_rates(self, sample_audio_16khz):
         """Test saving with different sample rates"""
+        # In-memory round trip; test_save_and_load_wav covers the file path
         for sr in [8000, 16000, 24000, 48000]:
-            output_path = os.path.join(temp_audio_dir, f"test_{sr}.wav")
-            save_wav(output_path, sample_audio_16khz, sr)
-
-            loaded_audio, loaded_sr = load_wav(output_path)
+            loaded_audio, loaded_sr = _roundtrip(sample_audio_16khz, sr)
             assert loaded_sr == sr
+            assert loaded_audio.shape == sample_audio_16khz.shape
 
     def test_save_empty_audio(self, temp_audio_dir):
         """Test saving empty audio"""
@@ -61,6 +87,10 @@ class TestAudioNormalization:
         audio = np.array([0.5, 1.5, -2.0, 0.8], dtype=np.float32)
         normalized = normalize_audio(audio)
 
+        # One fresh contiguous float32 buffer (what the SIMD loops want)
+        assert normalized.dtype == np.float32
+        assert normalized.flags.c_contiguous
+
         # Should be within [-1, 1]
         assert normalized.min() >= -1.0
         assert normalized.max() <= 1.0
@@ -85,6 +115,26 @@ class TestAudioNormalization:
         np.testing.assert_array_equal(normalized, audio)
 
 
+class TestResampling:
+    """Test audio resampling"""
+
+    @pytest.mark.parametrize("orig_sr", [44100, 48000])
+    def test_resample_to_16khz(self, orig_sr):
+        """Test downsampling common browser capture rates to 16kHz"""
+        t = np.arange(orig_sr) / orig_sr
+        audio = np.sin(2 * np.pi * 440.0 * t).astype(np.float32)
+
+        resampled = resample_audio(audio, orig_sr, 16000)
+
+        assert resampled.dtype == np.float32
+        assert len(resampled) == 16000
+        assert np.max(np.abs(resampled)) <= 1.05
+
+    def test_resample_same_rate(self, sample_audio_16khz):
+        """Test resampling to the same rate is a no-op"""
+        assert resample_audio(sample_audio_16khz, 16000, 16000) is sample_audio_16khz
+
+
 class TestWavUtils:
     """Test WAV utility functions"""
 
@@ -95,6 +145,18 @@ class TestWavUtils:
         # Should be approximately 1 second (we created 1s of audio)
         assert 0.9 <= duration <= 1.1
 
+    def test_get_wav_info_from_bytes(self, temp_wav_file):
+        """Test parsing WAV info from in-memory bytes"""
+        info = get_wav_info_from_bytes(temp_wav_file.read_bytes())
+
+        assert info["sample_rate"] == 16000
+        assert info["num_channels"] == 1
+        assert 0.9 <= info["duration"] <= 1.1
+
+    def test_get_wav_info_from_bytes_invalid(self):
+        """Test parsing non-WAV bytes"""
+        assert get_wav_info_from_bytes(b"This is not a WAV file") == {}
+
     def test_get_wav_duration_nonexistent(self):
         """Test getting duration of non-existent file"""
         with pytest.raises(FileNotFoundError):
@@ -122,35 +184,30 @@ class TestAudioConversions:
 
     def test_int16_to_float32(self):
         """Test converting int16 to float32"""
-        # Create int16 audio
-        int16_audio = np.array([0, 16384, -16384, 32767, -32768], dtype=np.int16)
-
-        # Convert to float32
-        float32_audio = int16_audio.astype(np.float32) / 32768.0
+        int16_audio = np.array([0, 16384, -16384, 32767, -32767], dtype=np.int16)
 
-        # Verify range
-        assert float32_audio.min() >= -1.0
-        assert float32_audio.max() <= 1.0
+        float32_audio = int16_to_audio(int16_audio)
 
-        # Verify values
-        assert float32_audio[0] == 0.0
-        assert abs(float32_audio[3] - 0.999969) < 0.0001  # ~1.0
-        assert float32_audio[4] == -1.0
+        assert float32_audio.dtype == np.float32
+        assert float32_audio == pytest.approx([0.0, 0.5, -0.5, 1.0, -1.0], abs=1e-4)
 
     def test_float32_to_int16(self):
         """Test converting float32 to int16"""
-        # Create float32 audio
-        float32_audio = np.array([0.0, 0.5, -0.5, 1.0, -1.0], dtype=np.float32)
+        float32_audio = np.array([0.0, 0.5, -0.5, 1.0, -1.0, 1.5], dtype=np.float32)
 
-        # Convert to int16
-        int16_audio = (float32_audio * 32767).astype(np.int16)
+        int16_audio = audio_to_int16(float32_audio)
 
-        # Verify
-        assert int16_audio[0] == 0
-        assert int16_audio[1] == 16383
-        assert int16_audio[2] == -16383
-        assert int16_audio[3] == 32767
-        assert int16_audio[4] == -32767
+        assert int16_audio.dtype == np.int16
+        np.testing.assert_array_equal(int16_audio, [0, 16383, -16383, 32767, -32767, 32767])
+
+    def test_int16_round_trip(self):
+        """Both directions use the same 32767 scale, so a round trip is lossless to 1 LSB"""
+        # Every int16 value, generated straight into an int16 buffer
+        int16_audio = np.arange(-32768, 32768, dtype=np.int16)
+
+        round_trip = audio_to_int16(int16_to_audio(int16_audio))
+
+        np.testing.assert_allclose(round_trip, int16_audio, atol=1)
 
 
 class TestAudioProperties:
@@ -158,20 +215,37 @@ class TestAudioProperties:
 
     def test_calculate_rms(self, sample_audio_16khz):
         """Test RMS calculation"""
-        rms = np.sqrt(np.mean(sample_audio_16khz ** 2))
+        rms = _rms(sample_audio_16khz)
         assert rms > 0
         assert rms <= 1.0
 
     def test_calculate_peak(self, sample_audio_16khz):
         """Test peak calculation"""
-        peak = np.max(np.abs(sample_audio_16khz))
+        peak = _peak(sample_audio_16khz)
         assert peak > 0
         assert peak <= 1.0
 
+    def test_rms_fast_path_speed(self, request, sample_audio_16khz):
+        """Regression lock: the pipeline RMS stays a one-pass dot product"""
+        pytest.importorskip("pytest_benchmark")
+        from app.pipeline.processors.noise_reducer import _rms as pipeline_rms
+
+        benchmark = request.getfixturevalue("benchmark")
+        rms = benchmark(pipeline_rms, sample_audio_16khz)
+
+        assert rms == pytest.approx(_rms(sample_audio_16khz), rel=1e-5)
+
+        # Relative, not wall-clock: best of several runs against the
+        # two-pass form with a squared temporary, on the same machine
+        def best(fn):
+            return min(timeit.repeat(lambda: fn(sample_audio_16khz), number=200, repeat=5))
+
+        assert best(pipeline_rms) < best(lambda x: np.sqrt(np.mean(x ** 2)))
+
     def test_silent_audio_properties(self, silence_audio):
         """Test properties of silent audio"""
-        rms = np.sqrt(np.mean(silence_audio ** 2))
-        peak = np.max(np.abs(silence_audio))
+        rms = _rms(silence_audio)
+        peak = _peak(silence_audio)
 
         assert rms == 0.0
         assert peak == 0.0
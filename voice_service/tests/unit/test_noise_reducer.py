@@ -0,0 +1,107 @@
+"""
+Unit tests for the noise reduction processor
+"""
+import numpy as np
+import pytest
+
+from app.config import settings
+from app.pipeline.processors.noise_reducer import NoiseReducer
+
+SAMPLE_RATE = 16000
+
+
+@pytest.fixture(scope="module")
+def noisy_tone():
+    """(clean, noisy): a 0.5 s tone in the middle of 1 s of white noise"""
+    rng = np.random.default_rng(0)
+    t = np.arange(SAMPLE_RATE) / SAMPLE_RATE
+    clean = np.zeros(SAMPLE_RATE, dtype=np.float32)
+    speech = slice(int(0.3 * SAMPLE_RATE), int(0.8 * SAMPLE_RATE))
+    clean[speech] = 0.3 * np.sin(2 * np.pi * 440.0 * t[speech])
+    noisy = (clean + 0.05 * rng.standard_normal(SAMPLE_RATE)).astype(np.float32)
+    clean.setflags(write=False)
+    noisy.setflags(write=False)
+    return clean, noisy
+
+
+def _snr_db(clean: np.ndarray, audio: np.ndarray) -> float:
+    """SNR of audio against the clean reference"""
+    residual = audio - clean
+    return float(10 * np.log10(np.dot(clean, clean) / np.dot(residual, residual)))
+
+
+class TestSnrEstimate:
+    """Test the clean-audio skip check"""
+
+    def test_zero_lead_in_not_clean(self, noisy_tone):
+        """Test a digitally silent lead-in doesn't pass for a clean noise floor"""
+        _, noisy = noisy_tone
+        lead_in = np.zeros(int(0.2 * SAMPLE_RATE), dtype=np.float32)
+        reducer = NoiseReducer(sample_rate=SAMPLE_RATE)
+
+        snr_db = reducer._estimate_snr_db(np.concatenate([lead_in, noisy]))
+
+        assert snr_db is not None
+        assert snr_db < settings.NOISE_REDUCE_SNR_SKIP_DB
+        assert snr_db == pytest.approx(reducer._estimate_snr_db(noisy), abs=1.0)
+
+    def test_clean_audio_skipped(self, noisy_tone):
+        """Test a clip with a very low noise floor is returned untouched"""
+        clean, _ = noisy_tone
+        rng = np.random.default_rng(2)
+        audio = (clean + 1e-4 * rng.standard_normal(len(clean))).astype(np.float32)
+
+        assert NoiseReducer(sample_rate=SAMPLE_RATE).process(audio) is audio
+
+    def test_all_silence(self):
+        """Test digital silence gives no estimate"""
+        reducer = NoiseReducer(sample_rate=SAMPLE_RATE)
+        assert reducer._estimate_snr_db(np.zeros(SAMPLE_RATE, dtype=np.float32)) is None
+
+
+class TestStationaryGate:
+    """Test the in-house stationary spectral gate"""
+
+    def test_preserves_length(self, noisy_tone):
+        """Test output has the input's length and dtype"""
+        _, noisy = noisy_tone
+        reduced = NoiseReducer(sample_rate=SAMPLE_RATE, stationary=True).process(noisy)
+
+        assert len(reduced) == len(noisy)
+        assert reduced.dtype == np.float32
+
+    def test_improves_snr(self, noisy_tone):
+        """Test the gate removes noise without eating the tone"""
+        clean, noisy = noisy_tone
+        reduced = NoiseReducer(sample_rate=SAMPLE_RATE, stationary=True).process(noisy)
+
+        assert _snr_db(clean, reduced) > _snr_db(clean, noisy) + 3.0
+
+    @pytest.mark.parametrize("n_samples", [1, 100, 255])
+    def test_short_input(self, noisy_tone, n_samples):
+        """Test inputs shorter than one STFT window"""
+        _, noisy = noisy_tone
+        reduced = NoiseReducer(sample_rate=SAMPLE_RATE, stationary=True).process(noisy[:n_samples])
+
+        assert len(reduced) == n_samples
+        assert np.all(np.isfinite(reduced))
+
+
+class TestGateKernel:
+    """Test the JIT gate kernel against the NumPy reference"""
+
+    def test_numba_matches_numpy(self):
+        """Test _gate_spectrum and _gate_spectrum_numpy agree within float32 tolerance"""
+        pytest.importorskip("numba")
+        from app.pipeline.processors.noise_reducer import _gate_spectrum, _gate_spectrum_numpy
+
+        rng = np.random.default_rng(1)
+        spec = (rng.standard_normal((64, 257)) + 1j * rng.standard_normal((64, 257))).astype(np.complex64)
+        threshold = np.abs(rng.standard_normal(257)).astype(np.float32)
+
+        expected = spec.copy()
+        _gate_spectrum_numpy(expected, threshold, 0.6)
+        actual = spec.copy()
+        _gate_spectrum(actual, threshold, 0.6)
+
+        np.testing.assert_allclose(actual, expected, rtol=1e-5, atol=1e-6)
@@ -0,0 +1,116 @@
+"""
+Unit tests for cloud call retries
+"""
+import httpx
+import pytest
+
+from app.config import settings
+from app.utils import retry
+from app.utils.retry import async_retry_call, is_transient, retry_call
+
+
+class StatusError(Exception):
+    """SDK-style API error carrying an HTTP status"""
+
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    """Retry immediately, with a fixed attempt budget"""
+    monkeypatch.setattr(retry, "_backoff", lambda attempt: 0)
+    monkeypatch.setattr(settings, "CLOUD_RETRY_ATTEMPTS", 3)
+
+
+def _failing(errors):
+    """Callable that raises the given errors in turn, then returns "ok"; records calls"""
+    calls = []
+
+    def func():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+
+    return func, calls
+
+
+class TestIsTransient:
+    """Test which errors are worth retrying"""
+
+    @pytest.mark.parametrize("status", [429, 503])
+    def test_retriable_status(self, status):
+        """Test rate limits and server errors are retried"""
+        assert is_transient(StatusError("busy", status))
+
+    @pytest.mark.parametrize("message", [
+        "invalid_api_key: check your key",
+        "quota_exceeded for this month",
+    ])
+    def test_auth_and_quota_not_retried(self, message):
+        """Test auth/quota failures are not retried, even with a retriable status"""
+        assert not is_transient(StatusError(message, 429))
+
+    def test_transport_error(self):
+        """Test network errors are retried"""
+        assert is_transient(httpx.ConnectTimeout("timed out"))
+
+    def test_client_error_not_retried(self):
+        """Test other 4xx errors are not retried"""
+        assert not is_transient(StatusError("bad request", 400))
+        assert not is_transient(ValueError("bad input"))
+
+
+class TestRetryCall:
+    """Test the sync retry loop"""
+
+    def test_recovers_from_transient(self):
+        """Test a transient failure is retried until success"""
+        func, calls = _failing([StatusError("busy", 503)])
+        assert retry_call(func) == "ok"
+        assert len(calls) == 2
+
+    def test_gives_up_after_attempts(self):
+        """Test the function is called CLOUD_RETRY_ATTEMPTS times and the last error re-raised"""
+        errors = [StatusError(f"busy {i}", 503) for i in range(3)]
+        func, calls = _failing(errors)
+        with pytest.raises(StatusError) as exc_info:
+            retry_call(func)
+        assert len(calls) == 3
+        assert exc_info.value is errors[-1]
+
+    def test_permanent_error_raised_at_once(self):
+        """Test a non-transient failure is not retried"""
+        func, calls = _failing([StatusError("invalid_api_key", 401)])
+        with pytest.raises(StatusError):
+            retry_call(func)
+        assert len(calls) == 1
+
+
+class TestAsyncRetryCall:
+    """Test the async retry loop"""
+
+    async def test_recovers_from_transient(self):
+        """Test a transient failure is retried until success"""
+        func, calls = _failing([httpx.ReadTimeout("timed out")])
+
+        async def call():
+            return func()
+
+        assert await async_retry_call(call) == "ok"
+        assert len(calls) == 2
+
+    async def test_gives_up_after_attempts(self):
+        """Test the function is awaited CLOUD_RETRY_ATTEMPTS times and the last error re-raised"""
+        errors = [httpx.ConnectError(f"refused {i}") for i in range(3)]
+        func, calls = _failing(errors)
+
+        async def call():
+            return func()
+
+        with pytest.raises(httpx.ConnectError) as exc_info:
+            await async_retry_call(call)
+        assert len(calls) == 3
+        assert exc_info.value is errors[-1]
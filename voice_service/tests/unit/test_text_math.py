@@ -1,11 +1,13 @@
 """
 Unit tests for math text processing
 """
+import numpy as np
 import pytest
 from app.utils.text_math import (
     text_to_number,
     is_math_query,
     parse_math_expression,
+    match_math,
     extract_number,
     compute_math,
     format_math_response,
@@ -40,6 +42,13 @@ class TestTextToNumber:
         assert text_to_number("forty two") == 42
         assert text_to_number("ninety nine") == 99
 
+    def test_parse_scales(self):
+        """Test parsing numbers with hundred/thousand"""
+        assert text_to_number("three hundred") == 300
+        assert text_to_number("two hundred thirty four") == 234
+        assert text_to_number("a hundred") == 100
+        assert text_to_number("one thousand twenty-five") == 1025
+
     def test_parse_digits(self):
         """Test parsing digit strings"""
         assert text_to_number("5") == 5
@@ -79,75 +88,49 @@ class TestMathDetection:
 class TestMathParsing:
     """Test parsing of math expressions"""
 
-    def test_parse_addition(self):
-        """Test parsing of addition"""
-        result = parse_math_expression("what is five plus five")
-        assert result is not None
-        operator, a, b = result
-        assert operator == "add"
-        assert a == 5.0
-        assert b == 5.0
-
-    def test_parse_subtraction(self):
-        """Test parsing of subtraction"""
-        result = parse_math_expression("ten minus three")
-        assert result is not None
-        operator, a, b = result
-        assert operator == "subtract"
-        assert a == 10.0
-        assert b == 3.0
-
-    def test_parse_multiplication(self):
-        """Test parsing of multiplication"""
-        result = parse_math_expression("6 times 7")
-        assert result is not None
-        operator, a, b = result
-        assert operator == "multiply"
-        assert a == 6.0
-        assert b == 7.0
-
-    def test_parse_division(self):
-        """Test parsing of division"""
-        result = parse_math_expression("12 divided by 4")
-        assert result is not None
-        operator, a, b = result
-        assert operator == "divide"
-        assert a == 12.0
-        assert b == 4.0
-
-    def test_parse_with_digits(self):
-        """Test parsing with digit numbers"""
-        result = parse_math_expression("5 plus 5")
-        assert result is not None
-        operator, a, b = result
-        assert a == 5.0
-        assert b == 5.0
+    @pytest.mark.parametrize("text,operator,a,b", [
+        ("what is five plus five", "add", 5.0, 5.0),
+        ("ten minus three", "subtract", 10.0, 3.0),
+        ("6 times 7", "multiply", 6.0, 7.0),
+        ("12 divided by 4", "divide", 12.0, 4.0),
+        ("5 plus 5", "add", 5.0, 5.0),
+        # The longest operator phrase wins ("divided by", not "divide")
+        ("twenty divided by five", "divide", 20.0, 5.0),
+    ])
+    def test_parse(self, text, operator, a, b):
+        """Test parsing of each operator, with word and digit numbers"""
+        assert parse_math_expression(text) == (operator, a, b)
 
     def test_parse_invalid(self):
         """Test parsing from invalid input"""
         assert parse_math_expression("hello world") is None
         assert parse_math_expression("what is your name") is None
 
+    def test_operator_whole_words_only(self):
+        """Test that operator words inside other words don't match"""
+        assert not is_math_query("unless you are sleepy")
+        assert parse_math_expression("the sandwich is bland") is None
+
 
 class TestExtractNumber:
     """Test number extraction from text"""
 
-    def test_extract_digits(self):
-        """Test extracting digit numbers"""
-        assert extract_number("5") == 5.0
-        assert extract_number("42") == 42.0
-        assert extract_number("100") == 100.0
-
-    def test_extract_words(self):
-        """Test extracting word numbers"""
-        assert extract_number("five") == 5.0
-        assert extract_number("twenty") == 20.0
-        assert extract_number("the number is ten") == 10.0
-
-    def test_extract_from_sentence(self):
-        """Test extracting numbers from sentences"""
-        assert extract_number("give me 5 apples") == 5.0
-        assert extract_number("I have twenty dollars") == 20.0
+    @pytest.mark.parametrize("text,expected", [
+        ("5", 5.0),
+        ("42", 42.0),
+        ("100", 100.0),
+        ("five", 5.0),
+        ("twenty", 20.0),
+        ("the number is ten", 10.0),
+        ("give me 5 apples", 5.0),
+        ("I have twenty dollars", 20.0),
+        ("seven?", 7.0),
+        ("twenty three", 23.0),
+        ("I have two hundred apples", 200.0),
+    ])
+    def test_extract(self, text, expected):
+        """Test extracting digit, word and multi-word numbers from text"""
+        assert extract_number(text) == expected
 
     def test_extract_invalid(self):
         """Test extracting from text with no numbers"""
@@ -158,29 +141,15 @@ class TestExtractNumber:
 class TestMathComputation:
     """Test math computation"""
 
-    def test_addition(self):
-        """Test addition computation"""
-        result, error = compute_math("add", 5, 5)
-        assert result == 10
-        assert error is None
-
-    def test_subtraction(self):
-        """Test subtraction computation"""
-        result, error = compute_math("subtract", 10, 3)
-        assert result == 7
-        assert error is None
-
-    def test_multiplication(self):
-        """Test multiplication computation"""
-        result, error = compute_math("multiply", 6, 7)
-        assert result == 42
-        assert error is None
-
-    def test_division(self):
-        """Test division computation"""
-        result, error = compute_math("divide", 12, 4)
-        assert result == 3
-        assert error is None
+    @pytest.mark.parametrize("operator,a,b,expected", [
+        ("add", 5, 5, 10),
+        ("subtract", 10, 3, 7),
+        ("multiply", 6, 7, 42),
+        ("divide", 12, 4, 3),
+    ])
+    def test_compute(self, operator, a, b, expected):
+        """Test each arithmetic operation"""
+        assert compute_math(operator, a, b) == (expected, None)
 
     def test_division_by_zero(self):
         """Test division by zero handling"""
@@ -241,15 +210,75 @@ class TestNumberToWords:
         assert number_to_words(10.0) == "ten"  # Should convert to int
 
 
+class TestMatchMath:
+    """Test combined math detection and parsing"""
+
+    def test_match_math_query(self):
+        """Test math queries parse in one call"""
+        assert match_math("What is five plus five") == ("add", 5.0, 5.0)
+        assert match_math("10 minus 3") == ("subtract", 10.0, 3.0)
+
+    def test_match_non_math(self):
+        """Test non-math text returns None"""
+        assert match_math("tell me a story") is None
+        assert match_math("what is 7") is None
+
+    @pytest.mark.parametrize("text", [
+        "what is five plus five",
+        "6 times 7",
+        "twelve divided by four",
+        "hello kitty",
+        "what is the sky",
+    ])
+    def test_matches_two_step_parse(self, text):
+        """Test match_math agrees with is_math_query + parse_math_expression"""
+        expected = parse_math_expression(text) if is_math_query(text) else None
+        assert match_math(text) == expected
+
+
+class TestRouterCases:
+    """Test the shared math router cases from conftest"""
+
+    def test_router_case(self, math_test_case):
+        """Test each case is matched and computed"""
+        text, expected_result, expected_operator = math_test_case
+        parsed = match_math(text)
+        assert parsed is not None
+        assert parsed[0] == expected_operator
+
+        result, error = compute_math(*parsed)
+        assert error is None
+        assert result == expected_result
+
+    def test_router_rejects(self, invalid_math_case):
+        """Test each invalid case yields no answer"""
+        parsed = match_math(invalid_math_case)
+        if parsed is not None:
+            result, error = compute_math(*parsed)
+            assert result is None
+            assert error is not None
+
+
+PIPELINE_CASES = [
+    ("what is five plus five", 10),
+    ("10 minus 3", 7),
+    ("6 times 7", 42),
+    ("twelve divided by four", 3),
+]
+
+
 class TestEndToEnd:
     """Test end-to-end math processing"""
 
-    @pytest.mark.parametrize("input_text,expected_result", [
-        ("what is five plus five", 10),
-        ("10 minus 3", 7),
-        ("6 times 7", 42),
-        ("twelve divided by four", 3),
-    ])
+    def test_pipeline_batch(self):
+        """Test every pipeline case in one pass and compare the results at once"""
+        results = np.array([
+            compute_math(*parse_math_expression(text))[0] for text, _ in PIPELINE_CASES
+        ])
+        expected = np.array([result for _, result in PIPELINE_CASES])
+        np.testing.assert_array_equal(results, expected)
+
+    @pytest.mark.parametrize("input_text,expected_result", PIPELINE_CASES)
     def test_full_math_pipeline(self, input_text, expected_result):
         """Test full math processing pipeline"""
         # Check it's detected as math
@@ -47,7 +47,9 @@ export function useVoiceService(): UseVoiceServiceResult {
 
   // Serialised audio queue — ensures multi-segment replies (streaming TTS)
   // play back-to-back rather than overlapping.
-  const audioQueueRef = useRef<string[]>([]);
+  // Each entry is either a URL to download or audio bytes received inline
+  const audioQueueRef = useRef<(string | ArrayBuffer)[]>([]);
+  const inlineAudioRef = useRef<ArrayBuffer | null>(null);
   const audioPlayingRef = useRef(false);
 
   // Setup WebSocket event handlers
@@ -80,10 +82,12 @@ export function useVoiceService(): UseVoiceServiceResult {
       if (audioPlayingRef.current) return;
       audioPlayingRef.current = true;
       setGameState('speaking');
+      ws.sendPlaybackStarted();
       while (audioQueueRef.current.length > 0) {
-        const url = audioQueueRef.current.shift()!;
+        const item = audioQueueRef.current.shift()!;
         try {
-          const audioData = await apiRef.current.downloadAudio(url);
+          const audioData =
+            typeof item === 'string' ? await apiRef.current.downloadAudio(item) : item;
           await audioPlayer.playAudio(audioData);
         } catch (err) {
           console.error('Failed to play audio segment:', err);
@@ -93,8 +97,17 @@ export function useVoiceService(): UseVoiceServiceResult {
       setGameState('idle');
     }
 
+    ws.on('reply.audio_data', (data: ArrayBuffer) => {
+      inlineAudioRef.current = data;
+    });
+
     ws.on('reply.audio_ready', (payload: AudioReadyPayload) => {
-      audioQueueRef.current.push(payload.url);
+      if (payload.inline && inlineAudioRef.current) {
+        audioQueueRef.current.push(inlineAudioRef.current);
+        inlineAudioRef.current = null;
+      } else {
+        audioQueueRef.current.push(payload.url);
+      }
       drainAudioQueue();
     });
 
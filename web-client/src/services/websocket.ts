@@ -34,6 +34,11 @@ interface AudioEndMessage {
   session_id: string;
 }
 
+interface PlaybackStartedMessage {
+  type: 'playback.started';
+  session_id: string;
+}
+
 export class VoiceWebSocketClient {
   private ws: WebSocket | null = null;
   private sessionId: string = '';
@@ -78,6 +83,8 @@ export class VoiceWebSocketClient {
       try {
         console.log('Connecting to WebSocket:', wsUrl);
         this.ws = new WebSocket(wsUrl);
+        // Reply audio may arrive inline as binary frames
+        this.ws.binaryType = 'arraybuffer';
 
         this.ws.onopen = () => {
           console.log('WebSocket connected successfully');
@@ -87,9 +94,18 @@ export class VoiceWebSocketClient {
         };
 
         this.ws.onmessage = (event) => {
+          if (event.data instanceof ArrayBuffer) {
+            this.handleAudioData(event.data);
+            return;
+          }
           try {
-            const data: WebSocketEvent = JSON.parse(event.data);
-            this.handleEvent(data);
+            // The server may coalesce several events into one frame (JSON array)
+            const data: WebSocketEvent | WebSocketEvent[] = JSON.parse(event.data);
+            if (Array.isArray(data)) {
+              data.forEach((item) => this.handleEvent(item));
+            } else {
+              this.handleEvent(data);
+            }
           } catch (error) {
             console.error('Failed to parse WebSocket message:', error);
           }
@@ -180,6 +196,21 @@ export class VoiceWebSocketClient {
     console.log('Sent audio.end message');
   }
 
+  /**
+   * Tell the backend that reply audio has started playing, so it can
+   * finish the turn without waiting for a fixed delay
+   */
+  sendPlaybackStarted(): void {
+    if (!this.isConnected) return;
+
+    const message: PlaybackStartedMessage = {
+      type: 'playback.started',
+      session_id: this.sessionId,
+    };
+
+    this.send(JSON.stringify(message));
+  }
+
   private async ensureConnected(): Promise<void> {
     if (!this.isConnected) {
       throw new Error('WebSocket is not connected');
@@ -212,6 +243,17 @@ export class VoiceWebSocketClient {
     }
   }
 
+  /**
+   * Binary frames carry the WAV bytes announced by the following
+   * reply.audio_ready event (payload.inline === true)
+   */
+  private handleAudioData(data: ArrayBuffer): void {
+    const handlers = this.eventHandlers.get('reply.audio_data');
+    if (handlers) {
+      handlers.forEach((handler) => handler(data));
+    }
+  }
+
   private attemptReconnect(): void {
     if (this.reconnectAttempts < this.maxReconnectAttempts && this.sessionId) {
       this.reconnectAttempts++;
@@ -231,6 +273,7 @@ export class VoiceWebSocketClient {
   on(eventType: 'transcript.final', callback: EventCallback<TranscriptPayload>): void;
   on(eventType: 'reply.text', callback: EventCallback<ReplyTextPayload>): void;
   on(eventType: 'reply.audio_ready', callback: EventCallback<AudioReadyPayload>): void;
+  on(eventType: 'reply.audio_data', callback: EventCallback<ArrayBuffer>): void;
   on(eventType: 'error', callback: EventCallback<ErrorPayload>): void;
   // Cat events
   on(eventType: 'cat.sound', callback: EventCallback<CatSoundPayload>): void;
@@ -99,6 +99,7 @@ export function createMockWebSocketClient() {
   return {
     connect: jest.fn().mockResolvedValue(undefined),
     disconnect: jest.fn(),
+    sendPlaybackStarted: jest.fn(),
     on: jest.fn((event: string, callback: Function) => {
       if (!callbacks[event]) callbacks[event] = [];
       callbacks[event].push(callback);
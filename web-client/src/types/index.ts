@@ -49,6 +49,8 @@ export interface AudioReadyPayload {
   format: string;
   sample_rate_hz: number;
   channels: number;
+  // True when the WAV bytes were already sent as a binary WebSocket frame
+  inline?: boolean;
 }
 
 // Error event payload